@@ -1,8 +1,39 @@
 __version__ = "0.3.11"
 
-from easydata.blocks import *  # noqa: F401 F403
-from easydata.groups import *  # noqa: F401 F403
-from easydata.models import ItemModel, StackedModel, StackedParser  # noqa: F401 F403
-from easydata.parsers import *  # noqa: F401 F403
-from easydata.processors import *  # noqa: F401 F403
-from easydata.queries import *  # noqa: F401 F403
+from typing import TYPE_CHECKING  # noqa: E402
+
+from easydata import parsers, processors, queries  # noqa: E402
+from easydata.utils.imports import lazy_module  # noqa: E402
+
+if TYPE_CHECKING:
+    from easydata.blocks import *  # noqa: F401 F403
+    from easydata.groups import *  # noqa: F401 F403
+    from easydata.items import *  # noqa: F401 F403
+    from easydata.models import ItemModel, StackedModel, StackedParser  # noqa: F401
+    from easydata.parsers import *  # noqa: F401 F403
+    from easydata.processors import *  # noqa: F401 F403
+    from easydata.queries import *  # noqa: F401 F403
+
+# Models, parsers, processors and queries are imported when they are accessed
+# for the first time, so that importing easydata stays fast
+__all__ = lazy_module(
+    __name__,
+    {
+        "easydata.blocks": (
+            "BlockParserModel",
+            "BlockSimpleDataModel",
+            "BlockSimpleTextModel",
+            "BlockSimpleSearchFloatModel",
+            "BlockSimpleSearchIntModel",
+            "BlockSimplePriceFloatModel",
+            "BlockSimplePriceIntModel",
+            "BlockSimplePriceTextModel",
+        ),
+        "easydata.groups": ("ItemGroup",),
+        "easydata.items": ("LazyItem",),
+        "easydata.models": ("ItemModel", "StackedModel", "StackedParser"),
+        "easydata.parsers": parsers.__all__,
+        "easydata.processors": processors.__all__,
+        "easydata.queries": queries.__all__,
+    },
+)
@@ -0,0 +1,2 @@
+from easydata.benchmarks.runner import *  # noqa: F401 F403
+from easydata.benchmarks.scenarios import *  # noqa: F401 F403
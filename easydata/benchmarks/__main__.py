@@ -0,0 +1,105 @@
+import argparse
+import json
+import sys
+
+from easydata.benchmarks.runner import compare, format_comparison, run_benchmarks
+from easydata.benchmarks.scenarios import SCENARIOS
+
+
+def main(args=None) -> int:
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m easydata.benchmarks",
+        description="Runs easydata benchmarks on synthetic corpora.",
+    )
+
+    arg_parser.add_argument(
+        "-s",
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="scenario to run, all scenarios are run by default",
+    )
+
+    arg_parser.add_argument("--seed", type=int, default=0)
+
+    arg_parser.add_argument(
+        "-n",
+        "--documents",
+        type=int,
+        help="number of documents in each corpus",
+    )
+
+    arg_parser.add_argument("-o", "--output", help="file to which results are saved")
+
+    arg_parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help=(
+            "run all scenarios in one process, in which case peak rss of a scenario "
+            "includes memory of scenarios which ran before it"
+        ),
+    )
+
+    arg_parser.add_argument(
+        "--compare",
+        nargs="+",
+        metavar="RESULTS",
+        help=(
+            "baseline results file to which a new run is compared, or baseline "
+            "and current results files to compare without running"
+        ),
+    )
+
+    arg_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative change which is reported as a regression",
+    )
+
+    parsed_args = arg_parser.parse_args(args)
+
+    compare_files = parsed_args.compare or []
+
+    if len(compare_files) > 2:
+        arg_parser.error("--compare accepts at most two results files")
+
+    if len(compare_files) == 2:
+        current = _load_results(compare_files[1])
+    else:
+        current = run_benchmarks(
+            scenario_names=parsed_args.scenario,
+            seed=parsed_args.seed,
+            documents=parsed_args.documents,
+            isolate=not parsed_args.no_isolate,
+        )
+
+        results_json = json.dumps(current, indent=2)
+
+        if parsed_args.output:
+            with open(parsed_args.output, "w") as results_file:
+                results_file.write(results_json)
+        elif not compare_files:
+            print(results_json)
+
+    if not compare_files:
+        return 0
+
+    comparison = compare(
+        baseline=_load_results(compare_files[0]),
+        current=current,
+        threshold=parsed_args.threshold,
+    )
+
+    print(format_comparison(comparison))
+
+    return 1 if any(c["regression"] for c in comparison.values()) else 0
+
+
+def _load_results(path: str) -> dict:
+    with open(path) as results_file:
+        return json.load(results_file)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
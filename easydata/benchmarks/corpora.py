@@ -0,0 +1,263 @@
+import json
+from random import Random
+from typing import List
+
+__all__ = (
+    "product_pages",
+    "listing_pages",
+    "json_api_responses",
+    "xml_feeds",
+    "description_pages",
+)
+
+BRANDS = ["EasyData", "Easybook", "Nordic", "Aurora", "Vertex", "Lumen", "Kestrel"]
+
+CATEGORIES = ["Laptops", "Phones", "Tablets", "Monitors", "Headphones", "Cameras"]
+
+COLORS = ["Black", "White", "Silver", "Blue", "Red", "Green", "Gold"]
+
+SIZES = ["XS", "S", "M", "L", "XL", "13 inch", "15 inch", "17 inch"]
+
+AVAILABILITY = ["In Stock", "Out of Stock", "Only 2 left", "Pre-order"]
+
+WORDS = (
+    "lightweight aluminium display battery processor memory storage keyboard "
+    "wireless charging premium durable compact design performance graphics "
+    "speakers camera resolution fast reliable everyday travel office gaming"
+).split()
+
+FEATURE_KEYS = [
+    "Color",
+    "Material",
+    "Weight",
+    "Display",
+    "Battery",
+    "Processor",
+    "Memory",
+    "Storage",
+    "Warranty",
+]
+
+
+def _sentence(random: Random, min_words: int = 6, max_words: int = 16) -> str:
+    words = random.choices(WORDS, k=random.randint(min_words, max_words))
+
+    return " ".join(words).capitalize() + "."
+
+
+def _price(random: Random) -> str:
+    return "{:,.2f}".format(random.randint(1000, 250000) / 100)
+
+
+def _feature(random: Random, feature_key: str) -> str:
+    if feature_key == "Color":
+        return random.choice(COLORS)
+
+    return "{} {}".format(random.randint(1, 64), random.choice(WORDS))
+
+
+def product_pages(random: Random, documents: int) -> List[str]:
+    """Large product pages with breadcrumbs, specification table, images and
+    a long description, similar to pages of big retailers."""
+
+    pages = []
+
+    for product_id in range(documents):
+        breadcrumbs = "".join(
+            '<li><a href="/c/{0}">{0}</a></li>'.format(c)
+            for c in random.sample(CATEGORIES, 3)
+        )
+
+        specs = "".join(
+            "<tr><th>{} {}</th><td>{}</td></tr>".format(
+                random.choice(FEATURE_KEYS), spec_num, random.choice(WORDS)
+            )
+            for spec_num in range(150)
+        )
+
+        images = "".join(
+            '<img class="gallery" src="/images/{}-{}.jpg">'.format(product_id, i)
+            for i in range(20)
+        )
+
+        description = "".join("<p>{}</p>".format(_sentence(random)) for _ in range(40))
+
+        # Unrelated markup which pages usually contain around product data
+        navigation = "".join(
+            '<li class="nav"><a href="/n/{}">{}</a></li>'.format(
+                i, random.choice(WORDS)
+            )
+            for i in range(300)
+        )
+
+        pages.append(
+            """<html><head><title>Product {product_id}</title></head><body>
+            <ul class="navigation">{navigation}</ul>
+            <ul class="breadcrumbs">{breadcrumbs}</ul>
+            <div id="product" data-sku="SKU-{product_id}">
+                <h1 class="name">{brand} {word} {product_id}</h1>
+                <span class="brand">{brand}</span>
+                <span class="price">${price}</span>
+                <span class="sale-price">${sale_price}</span>
+                <span class="availability">{availability}</span>
+                <time datetime="2021-0{month}-1{day}T10:30:00">Released</time>
+                <div class="gallery">{images}</div>
+                <table class="specs">{specs}</table>
+                <div class="description">{description}</div>
+            </div></body></html>""".format(
+                product_id=product_id,
+                navigation=navigation,
+                breadcrumbs=breadcrumbs,
+                brand=random.choice(BRANDS),
+                word=random.choice(WORDS).title(),
+                price=_price(random),
+                sale_price=_price(random),
+                availability=random.choice(AVAILABILITY),
+                month=random.randint(1, 9),
+                day=random.randint(0, 9),
+                images=images,
+                specs=specs,
+                description=description,
+            )
+        )
+
+    return pages
+
+
+def listing_pages(random: Random, documents: int, tiles: int = 200) -> List[str]:
+    """Category listing pages, each with 200 product tiles."""
+
+    pages = []
+
+    for page_num in range(documents):
+        page_tiles = "".join(
+            """<div class="tile" data-id="{tile_id}">
+                <a class="link" href="/p/{tile_id}?ref=listing">
+                    <span class="name">{brand} {word} {tile_id}</span>
+                </a>
+                <span class="brand">{brand}</span>
+                <span class="price">${price}</span>
+                <span class="availability">{availability}</span>
+                <span class="rating">{rating} out of 5</span>
+            </div>""".format(
+                tile_id=page_num * tiles + tile_num,
+                brand=random.choice(BRANDS),
+                word=random.choice(WORDS).title(),
+                price=_price(random),
+                availability=random.choice(AVAILABILITY),
+                rating=random.randint(10, 50) / 10,
+            )
+            for tile_num in range(tiles)
+        )
+
+        pages.append(
+            '<html><body><h1>{}</h1><div class="tiles">{}</div></body></html>'.format(
+                random.choice(CATEGORIES), page_tiles
+            )
+        )
+
+    return pages
+
+
+def json_api_responses(random: Random, documents: int) -> List[str]:
+    """Json product api responses with color variants, each with size stock."""
+
+    responses = []
+
+    for product_id in range(documents):
+        variants = [
+            {
+                "color": color,
+                "sku": "SKU-{}-{}".format(product_id, color.upper()),
+                "price": _price(random),
+                "images": [
+                    "/images/{}/{}-{}.jpg".format(product_id, color, i)
+                    for i in range(8)
+                ],
+                "sizes": [
+                    {"size": size, "stock": random.randint(0, 20)} for size in SIZES
+                ],
+            }
+            for color in random.sample(COLORS, 5)
+        ]
+
+        responses.append(
+            json.dumps(
+                {
+                    "data": {
+                        "id": product_id,
+                        "title": "{} {} {}".format(
+                            random.choice(BRANDS),
+                            random.choice(WORDS).title(),
+                            product_id,
+                        ),
+                        "brand": random.choice(BRANDS),
+                        "category": random.choice(CATEGORIES),
+                        "description": " ".join(_sentence(random) for _ in range(10)),
+                        "variants": variants,
+                    }
+                }
+            )
+        )
+
+    return responses
+
+
+def xml_feeds(random: Random, documents: int, records: int = 250) -> List[bytes]:
+    """Product feeds, like ones which are sent to shopping comparison sites."""
+
+    feeds = []
+
+    for feed_num in range(documents):
+        feed_records = "".join(
+            """<product>
+                <id>{record_id}</id>
+                <title>{brand} {word} {record_id}</title>
+                <brand>{brand}</brand>
+                <category>{category}</category>
+                <price>{price} USD</price>
+                <availability>{availability}</availability>
+                <link>https://demo.com/p/{record_id}</link>
+            </product>""".format(
+                record_id=feed_num * records + record_num,
+                brand=random.choice(BRANDS),
+                word=random.choice(WORDS).title(),
+                category=random.choice(CATEGORIES),
+                price=_price(random),
+                availability=random.choice(AVAILABILITY),
+            )
+            for record_num in range(records)
+        )
+
+        feeds.append(
+            "<?xml version='1.0' encoding='utf-8'?><products>{}</products>".format(
+                feed_records
+            ).encode("utf-8")
+        )
+
+    return feeds
+
+
+def description_pages(random: Random, documents: int) -> List[str]:
+    """Pages where most of the data is in a description block with features."""
+
+    pages = []
+
+    for product_id in range(documents):
+        features = "".join(
+            "<li>{}: {}</li>".format(feature_key, _feature(random, feature_key))
+            for feature_key in FEATURE_KEYS
+        )
+
+        paragraphs = "".join("<p>{}</p>".format(_sentence(random)) for _ in range(25))
+
+        pages.append(
+            """<html><body>
+            <h1 class="name">{} {}</h1>
+            <div class="description">{}<ul>{}</ul></div>
+            </body></html>""".format(
+                random.choice(BRANDS), product_id, paragraphs, features
+            )
+        )
+
+    return pages
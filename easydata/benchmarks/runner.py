@@ -0,0 +1,234 @@
+import multiprocessing
+import platform
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional
+
+import easydata
+from easydata.benchmarks.scenarios import SCENARIOS, Scenario
+from easydata.utils.profiler import timings_stats
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore
+
+__all__ = (
+    "peak_rss_kb",
+    "run_scenario",
+    "run_scenario_isolated",
+    "run_benchmarks",
+    "compare",
+    "format_comparison",
+)
+
+
+def peak_rss_kb() -> Optional[int]:
+    # Peak of a current address space on Linux, since max rss of rusage is
+    # carried over from a parent process into a spawned one
+    try:
+        with open("/proc/self/status") as status_file:
+            for status_line in status_file:
+                if status_line.startswith("VmHWM:"):
+                    return int(status_line.split()[1])
+    except OSError:
+        pass
+
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Max rss is reported in bytes on macOS and in kilobytes elsewhere
+    return max_rss // 1024 if sys.platform == "darwin" else max_rss
+
+
+def run_scenario(
+    scenario: Scenario,
+    seed: int = 0,
+    documents: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Parses a corpus of a scenario and returns items per second, latency
+    percentiles of items in milliseconds and peak rss of a process."""
+
+    corpus = scenario.create_documents(seed, documents or scenario.documents)
+
+    model = scenario.model()
+
+    # First document warms up compiled queries and model manager
+    list(model.parse_items(corpus[0]))
+
+    latencies: List[float] = []
+
+    start = perf_counter()
+
+    for document in corpus:
+        iter_items = model.parse_items(document)
+
+        while True:
+            item_start = perf_counter()
+
+            try:
+                next(iter_items)
+            except StopIteration:
+                break
+
+            latencies.append(perf_counter() - item_start)
+
+    seconds = perf_counter() - start
+
+    latency_stats = timings_stats(latencies)
+
+    return {
+        "documents": len(corpus),
+        "items": len(latencies),
+        "seconds": round(seconds, 6),
+        "items_per_sec": round(len(latencies) / seconds, 2),
+        "latency_ms": {
+            stat: round(latency_stats[stat] * 1000, 4)
+            for stat in ("mean", "p50", "p95", "p99", "max")
+        },
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def run_scenario_isolated(
+    scenario_name: str,
+    seed: int = 0,
+    documents: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Runs a scenario in a new process, since peak rss of a process also
+    includes memory of scenarios which ran before in it."""
+
+    spawn_context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=spawn_context) as executor:
+        return executor.submit(
+            _run_scenario_by_name,
+            scenario_name,
+            seed,
+            documents,
+        ).result()
+
+
+def _run_scenario_by_name(
+    scenario_name: str,
+    seed: int,
+    documents: Optional[int],
+) -> Dict[str, Any]:
+
+    return run_scenario(SCENARIOS[scenario_name], seed=seed, documents=documents)
+
+
+def run_benchmarks(
+    scenario_names: Optional[Iterable[str]] = None,
+    seed: int = 0,
+    documents: Optional[int] = None,
+    isolate: bool = True,
+) -> Dict[str, Any]:
+
+    scenario_names = list(scenario_names or SCENARIOS)
+
+    for scenario_name in scenario_names:
+        if scenario_name not in SCENARIOS:
+            raise ValueError(
+                "Benchmark scenario {} doesn't exist. Available are: {}".format(
+                    scenario_name, ", ".join(SCENARIOS)
+                )
+            )
+
+    return {
+        "easydata": easydata.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "scenarios": {
+            scenario_name: (
+                run_scenario_isolated(scenario_name, seed=seed, documents=documents)
+                if isolate
+                else run_scenario(
+                    SCENARIOS[scenario_name], seed=seed, documents=documents
+                )
+            )
+            for scenario_name in scenario_names
+        },
+    }
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.1,
+) -> Dict[str, Dict[str, Any]]:
+    """Compares throughput and p95 latency of scenarios which are in both
+    results. Scenario is marked as a regression if any of them got worse by
+    more than a threshold."""
+
+    comparison = {}
+
+    for scenario_name, current_stats in current["scenarios"].items():
+        baseline_stats = baseline["scenarios"].get(scenario_name)
+
+        if not baseline_stats:
+            continue
+
+        items_per_sec_change = _change(
+            baseline_stats["items_per_sec"],
+            current_stats["items_per_sec"],
+        )
+
+        p95_change = _change(
+            baseline_stats["latency_ms"]["p95"],
+            current_stats["latency_ms"]["p95"],
+        )
+
+        comparison[scenario_name] = {
+            "items_per_sec": (
+                baseline_stats["items_per_sec"],
+                current_stats["items_per_sec"],
+                items_per_sec_change,
+            ),
+            "p95_ms": (
+                baseline_stats["latency_ms"]["p95"],
+                current_stats["latency_ms"]["p95"],
+                p95_change,
+            ),
+            "regression": items_per_sec_change < -threshold or p95_change > threshold,
+        }
+
+    return comparison
+
+
+def format_comparison(comparison: Dict[str, Dict[str, Any]]) -> str:
+    lines = []
+
+    for scenario_name, scenario_comparison in comparison.items():
+        baseline_items_per_sec, items_per_sec, items_per_sec_change = (
+            scenario_comparison["items_per_sec"]
+        )
+
+        baseline_p95, p95, p95_change = scenario_comparison["p95_ms"]
+
+        lines.append(
+            "{:<20} items/sec {:>10.2f} -> {:<10.2f} ({:+.1%})  "
+            "p95 {:>8.3f}ms -> {:<8.3f} ({:+.1%}){}".format(
+                scenario_name,
+                baseline_items_per_sec,
+                items_per_sec,
+                items_per_sec_change,
+                baseline_p95,
+                p95,
+                p95_change,
+                "  REGRESSION" if scenario_comparison["regression"] else "",
+            )
+        )
+
+    return "\n".join(lines)
+
+
+def _change(baseline_value: float, current_value: float) -> float:
+    if not baseline_value:
+        return 0.0
+
+    return (current_value - baseline_value) / baseline_value
@@ -0,0 +1,213 @@
+from random import Random
+from typing import Any, Callable, Dict, List
+
+from easydata import parsers, processors
+from easydata.benchmarks import corpora
+from easydata.models import ItemModel
+from easydata.queries import jp, pq
+
+__all__ = (
+    "Scenario",
+    "SCENARIOS",
+)
+
+AVAILABILITY_CHOICES = [
+    ("in_stock", ["in stock", "only"]),
+    ("out_of_stock", ["out of stock"]),
+    ("pre_order", ["pre-order"]),
+]
+
+
+class ProductPageModel(ItemModel):
+    item_name = parsers.Text(pq("#product .name::text"))
+
+    item_sku = parsers.Text(pq("#product::attr(data-sku)"))
+
+    item_brand = parsers.Text(pq("#product .brand::text"))
+
+    item_category = parsers.Text(pq(".breadcrumbs li:last-child a::text"))
+
+    item_breadcrumbs = parsers.TextList(pq(".breadcrumbs a::text-items"))
+
+    item_price = parsers.PriceFloat(pq("#product .price::text"))
+
+    item_sale_price = parsers.PriceFloat(pq("#product .sale-price::text"))
+
+    item_stock = parsers.Has(
+        pq("#product .availability::text"),
+        contains=["in stock", "only"],
+    )
+
+    item_availability = parsers.Choice(
+        lookups=[pq("#product .availability::text")],
+        choices=AVAILABILITY_CHOICES,
+    )
+
+    item_release_date = parsers.DateTime(pq("#product time::attr(datetime)"))
+
+    item_images = parsers.UrlList(
+        pq("#product .gallery img::src-items"),
+        domain="https://demo.com",
+    )
+
+    item_specs = parsers.TextDict(
+        pq(".specs tr::items"),
+        key_query=pq("th::text"),
+        val_query=pq("td::text"),
+    )
+
+    item_description = parsers.Description(pq("#product .description::html"))
+
+
+class ListingTileModel(ItemModel):
+    data_processors = [
+        processors.DataFromIterQueryProcessor(pq(".tiles .tile::items")),
+    ]
+
+    item_id = parsers.Int(pq("::attr(data-id)"))
+
+    item_name = parsers.Text(pq(".name::text"))
+
+    item_url = parsers.Url(
+        pq(".link::href"),
+        domain="https://demo.com",
+        remove_qs="ref",
+    )
+
+    item_brand = parsers.Text(pq(".brand::text"))
+
+    item_price = parsers.PriceFloat(pq(".price::text"))
+
+    item_stock = parsers.Has(pq(".availability::text"), contains=["in stock", "only"])
+
+    item_rating = parsers.SearchFloat(pq(".rating::text"))
+
+
+class JsonApiVariantModel(ItemModel):
+    data_processors = [
+        processors.DataJsonToDictProcessor(),
+        processors.DataFromQueryProcessor(jp("data")),
+        processors.DataVariantsProcessor(
+            query=jp("variants"),
+            key_parser=parsers.Text(jp("color")),
+            new_source="color_data",
+        ),
+    ]
+
+    item_name = parsers.Text(jp("title"))
+
+    item_brand = parsers.Text(jp("brand"))
+
+    item_category = parsers.Text(jp("category"))
+
+    item_description = parsers.Description(jp("description"))
+
+    item_color = parsers.Text(jp("color"), source="color_data")
+
+    item_sku = parsers.Text(jp("sku"), source="color_data")
+
+    item_price = parsers.PriceFloat(jp("price"), source="color_data")
+
+    item_images = parsers.UrlList(
+        jp("images"),
+        source="color_data",
+        domain="https://demo.com",
+    )
+
+    item_sizes = parsers.HasDict(
+        jp("sizes"),
+        key_query=jp("size"),
+        val_query=jp("stock"),
+        source="color_data",
+    )
+
+
+class XmlFeedModel(ItemModel):
+    data_processors = [processors.DataXmlStreamProcessor(tag="product")]
+
+    item_id = parsers.Int(jp("product.id"))
+
+    item_name = parsers.Text(jp("product.title"))
+
+    item_brand = parsers.Text(jp("product.brand"))
+
+    item_category = parsers.Text(jp("product.category"))
+
+    item_price = parsers.PriceFloat(jp("product.price"))
+
+    item_stock = parsers.Has(jp("product.availability"), contains=["in stock", "only"])
+
+    item_url = parsers.Url(jp("product.link"))
+
+
+class DescriptionPageModel(ItemModel):
+    item_name = parsers.Text(pq(".name::text"))
+
+    item_description = parsers.Description(pq(".description::html"))
+
+    item_sentences = parsers.Sentences(pq(".description::html"))
+
+    item_features = parsers.FeaturesDict(pq(".description::html"))
+
+    item_color = parsers.Feature(pq(".description::html"), key="color")
+
+    item_material = parsers.Feature(pq(".description::html"), key="material")
+
+    item_weight = parsers.Feature(pq(".description::html"), key="weight")
+
+    item_battery = parsers.Feature(pq(".description::html"), key="battery")
+
+
+class Scenario:
+    def __init__(
+        self,
+        name: str,
+        model: Callable[[], ItemModel],
+        corpus: Callable[[Random, int], List[Any]],
+        documents: int,
+    ):
+
+        self.name = name
+        self.model = model
+        self.corpus = corpus
+        self.documents = documents
+
+    def create_documents(self, seed: int, documents: int) -> List[Any]:
+        return self.corpus(Random("{}-{}".format(self.name, seed)), documents)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            name="product_pages",
+            model=ProductPageModel,
+            corpus=corpora.product_pages,
+            documents=50,
+        ),
+        Scenario(
+            name="listing_pages",
+            model=ListingTileModel,
+            corpus=corpora.listing_pages,
+            documents=10,
+        ),
+        Scenario(
+            name="json_api",
+            model=JsonApiVariantModel,
+            corpus=corpora.json_api_responses,
+            documents=200,
+        ),
+        Scenario(
+            name="xml_feeds",
+            model=XmlFeedModel,
+            corpus=corpora.xml_feeds,
+            documents=8,
+        ),
+        Scenario(
+            name="description_pages",
+            model=DescriptionPageModel,
+            corpus=corpora.description_pages,
+            documents=100,
+        ),
+    )
+}
@@ -1,3 +1,4 @@
+from concurrent.futures import Executor
 from typing import List, Optional
 
 from easydata.exceptions import DropItem
@@ -7,6 +8,28 @@ ED_LANGUAGE: str = "en"
 
 ED_DROP_ITEM_EXCEPTION = DropItem
 
+# Config attributes used by queries. Query memo stores raw query selections
+# per document, so that they are shared between item parsers.
+ED_QUERY_MEMO: bool = False
+
+# Json backend used by queries and processors: auto, orjson, ujson or json. Auto
+# uses orjson or ujson for decoding if installed and stdlib json otherwise.
+ED_JSON_BACKEND: str = "auto"
+
+# Config attributes used by model manager. If profile is enabled, wall times of
+# item parsers, processors and model callbacks are collected by a profiler.
+ED_PROFILE: bool = False
+
+# Config attributes used by data bags. If dependencies are tracked, data sources
+# read by each item value are recorded, so that items can be reparsed.
+ED_TRACK_DEPENDENCIES: bool = False
+
+# Config attributes used by async item model parsing. Executor set to None
+# means that event loop default executor will be used.
+ED_ASYNC_EXECUTOR: Optional[Executor] = None
+
+ED_ASYNC_CONCURRENCY: Optional[int] = None
+
 # Config attributes used by date time parsers
 ED_DATETIME_FORMAT: str = "%m/%d/%Y %H:%M:%S"
 
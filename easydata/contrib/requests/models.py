@@ -1,4 +1,5 @@
-from typing import Optional
+from concurrent.futures import Executor
+from typing import AsyncGenerator, Optional
 
 from requests import Response
 
@@ -54,6 +55,53 @@ class ItemModel(BaseItemModel):
 
             yield item
 
+    async def aparse_res2item(
+        self,
+        response: Optional[Response] = None,
+        to_json: bool = False,
+        executor: Optional[Executor] = None,
+        **cb_kwargs,
+    ):
+
+        iter_items = self.aparse_res2items(
+            response=response,
+            to_json=to_json,
+            executor=executor,
+            **cb_kwargs,
+        )
+
+        try:
+            return await iter_items.__anext__()
+        finally:
+            await iter_items.aclose()
+
+    async def aparse_res2items(
+        self,
+        response: Optional[Response] = None,
+        to_json: bool = False,
+        executor: Optional[Executor] = None,
+        **cb_kwargs,
+    ) -> AsyncGenerator[dict, None]:
+
+        if response:
+            data_bag = response_to_data_bag(
+                response,
+                to_json=to_json,
+                **cb_kwargs,
+            )
+
+            iter_items = super().aparse_items(data=data_bag, executor=executor)
+        else:
+            iter_items = super().aparse_items(executor=executor, **cb_kwargs)
+
+        async for item in iter_items:
+            process_response_item = getattr(self, "process_response_item", None)
+
+            if process_response_item:
+                item = process_response_item(item, response, **cb_kwargs)
+
+            yield item
+
 
 class StackedModel(StackedMixin, ItemModel):
     pass
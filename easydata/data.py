@@ -1,8 +1,65 @@
-from typing import Any, Dict, List
+from copy import copy
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
 
 from easydata.mixins import ConfigMixin
 
-__all__ = ("DataBag",)
+__all__ = (
+    "DataBag",
+    "QueryMemo",
+)
+
+
+class QueryMemo:
+    """Stores raw query selections of a single document, so that fields which
+    use the same query with different pseudo keys or processing share them."""
+
+    def __init__(self):
+        self._selections: Dict[tuple, tuple] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def select(
+        self,
+        data: Any,
+        query_kind: Hashable,
+        query: Optional[str],
+        select: Callable[[Any, Optional[str]], Any],
+    ) -> Any:
+
+        memo_key = (id(data), query_kind, query)
+
+        if memo_key in self._selections:
+            self.hits += 1
+
+            return self._selections[memo_key][1]
+
+        self.misses += 1
+
+        selection = select(data, query)
+
+        # Queried data is stored as well, so that its id can't be reused
+        self._selections[memo_key] = (data, selection)
+
+        return selection
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._selections),
+        }
 
 
 class DataBag(ConfigMixin):
@@ -15,6 +72,43 @@ class DataBag(ConfigMixin):
 
         self._cached_results: Dict[str, Any] = {}
 
+        # Parent data bag from which data is read through if it's not found
+        # in this one. Copies hold only data which was added to them.
+        self._parent: Optional[DataBag] = None
+
+        # Data derived from sources (e.g. main_pq from main) with it's source name
+        self._derived_sources: Dict[str, Optional[str]] = {}
+
+        # Copies which hold a new document, e.g. a record of a json lines file,
+        # don't share query memo with a data bag they were copied from
+        self._new_document = False
+
+        self._query_memo: Optional[QueryMemo] = None
+
+        self._memo: Dict[Hashable, tuple] = {}
+
+        # Item values which are parsed once for data bags with the same shared
+        # results, e.g. variant invariant values of a product
+        self._shared_item_keys: FrozenSet[str] = frozenset()
+
+        self._shared_results: Dict[str, tuple] = {}
+
+        # Data sources read by each item value, which are tracked only if
+        # ED_TRACK_DEPENDENCIES is enabled, so that item can be reparsed
+        self._track_dependencies = False
+
+        self._dependencies: Dict[str, FrozenSet[str]] = {}
+
+        self._dependencies_stack: List[Set[str]] = []
+
+        self._parsed_results: Dict[str, Any] = {}
+
+        # Data bag from which reparsed data bags are copied with its sources
+        # which were changed, so that reparsing doesn't nest copies
+        self._reparse_base: Optional[DataBag] = None
+
+        self._changed_sources: Dict[str, Any] = {}
+
         for arg_name, arg_value in kwargs.items():
             self.add(arg_name, arg_value)
 
@@ -23,12 +117,94 @@ class DataBag(ConfigMixin):
 
         self.init_config(self._model_manager.config)
 
+        if self.config["ED_QUERY_MEMO"] and not self.query_memo:
+            self._document_root._query_memo = QueryMemo()
+
+        self._track_dependencies = self.config["ED_TRACK_DEPENDENCIES"]
+
+        # Reading sources as attributes is tracked only by a subclass of data
+        # bag's class, so that attribute access of other data bags stays fast
+        tracking = isinstance(self, _DependencyTrackingMixin)
+
+        if self._track_dependencies and not tracking:
+            self.__class__ = _dependency_tracking_class(type(self))
+        elif tracking and not self._track_dependencies:
+            self.__class__ = type(self).__bases__[1]
+
+    @property
+    def query_memo(self) -> Optional[QueryMemo]:
+        """Query memo is shared between data bag and all its copies which
+        hold the same document."""
+
+        return self._document_root._query_memo
+
+    def memoize(
+        self,
+        key: Hashable,
+        create_value: Callable[[], Any],
+        pin: Any = None,
+    ) -> Any:
+        """Returns a value stored under a key for the whole document or creates
+        it. Object passed as pin is stored with a value, so that id which is
+        used in a key can't be reused. Memo is shared with all copies which
+        hold the same document."""
+
+        memo = self._document_root._memo
+
+        if key not in memo:
+            memo[key] = (create_value(), pin)
+
+        return memo[key][0]
+
+    @property
+    def _root(self) -> "DataBag":
+        data = self
+
+        while data._parent is not None:
+            data = data._parent
+
+        return data
+
+    @property
+    def _document_root(self) -> "DataBag":
+        data = self
+
+        while not data._new_document and data._parent is not None:
+            data = data._parent
+
+        return data
+
     def has_model_manger_instance(self):
         return bool(self._model_manager)
 
     def add(self, arg_name: str, arg_value):
         setattr(self, arg_name, arg_value)
 
+    def add_derived(self, source: Optional[str], arg_name: str, arg_value):
+        """Adds data derived from a source to a data bag which holds the source,
+        so that copies which share the same source can reuse it."""
+
+        data = self
+
+        while source not in data.__dict__ and data._parent is not None:
+            data = data._parent
+
+        data.add(arg_name, arg_value)
+
+        data._derived_sources[arg_name] = source
+
+    def share_results(
+        self,
+        item_keys: Iterable[str],
+        shared_results: Dict[str, Any],
+    ):
+        """Values of item keys are parsed only once for all data bags which
+        share the same results dictionary."""
+
+        self._shared_item_keys = frozenset(item_keys)
+
+        self._shared_results = shared_results
+
     def has(self, arg_name):
         return hasattr(self, arg_name)
 
@@ -45,22 +221,145 @@ class DataBag(ConfigMixin):
             )
 
         if item_key in self._cached_results:
+            if self._track_dependencies:
+                self._add_dependencies(self._dependencies.get(item_key, ()))
+
             return self._cached_results[item_key]
 
-        self._cached_results[item_key] = self._model_manager.process_item_parser(
-            item_key=item_key,
-            data=self,
-        )
+        if item_key in self._shared_item_keys:
+            self._cached_results[item_key] = self._get_shared(item_key)
+        else:
+            self._cached_results[item_key] = self._parse_item_value(item_key)
 
         return self._cached_results[item_key]
 
+    def _get_shared(self, item_key: str) -> Any:
+        shared_results = self._shared_results
+
+        if item_key not in shared_results:
+            value = self._parse_item_value(item_key)
+
+            shared_results[item_key] = (value, self._dependencies.get(item_key))
+        else:
+            value, dependencies = shared_results[item_key]
+
+            if dependencies is not None:
+                self._dependencies[item_key] = dependencies
+
+                self._add_dependencies(dependencies)
+
+        # Shared containers are copied so that changes don't leak between items
+        if isinstance(value, (list, dict)):
+            return copy(value)
+
+        return value
+
+    def _parse_item_value(self, item_key: str) -> Any:
+        if not self._track_dependencies:
+            return self._model_manager.process_item_parser(  # type: ignore
+                item_key=item_key,
+                data=self,
+            )
+
+        dependencies_stack = self._root._dependencies_stack
+
+        dependencies: Set[str] = set()
+
+        dependencies_stack.append(dependencies)
+
+        try:
+            value = self._model_manager.process_item_parser(  # type: ignore
+                item_key=item_key,
+                data=self,
+            )
+        finally:
+            dependencies_stack.pop()
+
+        self._dependencies[item_key] = frozenset(dependencies)
+
+        # Item processors can change containers of an item in place
+        self._parsed_results[item_key] = (
+            copy(value) if isinstance(value, (list, dict)) else value
+        )
+
+        # Values which read this item value depend on the same sources
+        self._add_dependencies(dependencies)
+
+        return value
+
+    def _add_dependencies(self, dependencies: Iterable[str]):
+        dependencies_stack = self._root._dependencies_stack
+
+        if dependencies_stack:
+            dependencies_stack[-1].update(dependencies)
+
+    @property
+    def dependencies(self) -> Dict[str, FrozenSet[str]]:
+        """Data sources read by each parsed item value, including sources
+        read through other item values. Empty if dependencies aren't tracked."""
+
+        return self._dependencies
+
+    def reparse_copy(self, changed_sources: Dict[str, Any]) -> "DataBag":
+        """Returns a copy with changed sources, which reuses item values that
+        don't depend on any of them. Only values parsed with tracked
+        dependencies are reused, others are parsed again."""
+
+        base_data = self._reparse_base or self
+
+        changed_sources = {**self._changed_sources, **changed_sources}
+
+        data = base_data.copy()
+
+        data._reparse_base = base_data
+
+        data._changed_sources = changed_sources
+
+        for source, source_value in changed_sources.items():
+            data.add(source, source_value)
+
+        changed_keys = set(changed_sources) | self._derived_keys(changed_sources)
+
+        for item_key, dependencies in self._dependencies.items():
+            if item_key not in self._parsed_results:
+                continue
+
+            if dependencies.isdisjoint(changed_keys):
+                value = self._parsed_results[item_key]
+
+                data._cached_results[item_key] = (
+                    copy(value) if isinstance(value, (list, dict)) else value
+                )
+
+                data._parsed_results[item_key] = value
+
+                data._dependencies[item_key] = dependencies
+
+        return data
+
+    def _derived_keys(self, sources: Iterable[str]) -> Set[str]:
+        sources = set(sources)
+
+        derived_keys = set()
+
+        data: Optional[DataBag] = self
+
+        while data is not None:
+            for derived_key, derived_source in data._derived_sources.items():
+                if derived_source in sources:
+                    derived_keys.add(derived_key)
+
+            data = data._parent
+
+        return derived_keys
+
     def get_all(self) -> dict:
         if self._model_manager:
             return self.get_multi(self._model_manager.item_keys())
 
         return {}
 
-    def get_multi(self, item_keys: List[str]):
+    def get_multi(self, item_keys: Iterable[str]):
         results = self._cached_results
 
         for item_key in item_keys:
@@ -69,15 +368,18 @@ class DataBag(ConfigMixin):
 
         return results
 
-    def copy(self, model_manager=None):
-        data_copy = self.__dict__.copy()
+    def copy(self, model_manager=None, new_document: bool = False):
+        # Copies keep a class of a data bag, but not arguments of its subclass
+        data = type(self).__new__(type(self))
 
-        del data_copy["_model_manager"]
-        del data_copy["_cached_results"]
+        DataBag.__init__(data)
 
-        data = DataBag(
-            **data_copy,
-        )
+        data._parent = self
+
+        data._new_document = new_document
+
+        if self.has_config:
+            data.init_config(self.config)
 
         model_manager = model_manager or self._model_manager
 
@@ -90,8 +392,61 @@ class DataBag(ConfigMixin):
     def cached_results(self):
         return self._cached_results
 
+    def __getattr__(self, name):
+        # Called only when attribute is not found in this data bag
+        if name.startswith("__") or "_parent" not in self.__dict__:
+            raise AttributeError(name)
+
+        data = self._parent
+
+        while data is not None:
+            if name in data.__dict__:
+                derived_source = data._derived_sources.get(name)
+
+                # Derived data is outdated if source was overridden in a copy
+                if derived_source and self._overrides(derived_source, data):
+                    break
+
+                return data.__dict__[name]
+
+            data = data._parent
+
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+        )
+
+    def _overrides(self, source: str, parent_data: "DataBag") -> bool:
+        data: Optional[DataBag] = self
+
+        while data is not None and data is not parent_data:
+            if source in data.__dict__:
+                return True
+
+            data = data._parent
+
+        return False
+
     def __getitem__(self, key):
         return getattr(self, key)
 
     def __setitem__(self, key, value):
         return setattr(self, key, value)
+
+
+class _DependencyTrackingMixin:
+    def __getattribute__(self, name):
+        # Sources are public attributes which aren't defined by a data bag
+        # class, e.g. data.main or data["stock_json"] in item methods
+        if name[0] != "_" and not hasattr(type(self), name):
+            self._add_dependencies((name,))  # type: ignore
+
+        return super().__getattribute__(name)
+
+
+@lru_cache(maxsize=None)
+def _dependency_tracking_class(data_bag_class: type) -> type:
+    return type(
+        data_bag_class.__name__,
+        (_DependencyTrackingMixin, data_bag_class),
+        {"__module__": data_bag_class.__module__},
+    )
@@ -80,6 +80,10 @@ class ItemGroup(Base):
 
             self._group_item_parsers[item_name] = parser_method
 
+    @property
+    def group_item_names(self) -> List[str]:
+        return list(self._group_item_parsers.keys())
+
     @property
     def group_item_protected_names(self) -> List[str]:
         return self._group_item_protected_names
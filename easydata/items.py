@@ -0,0 +1,59 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+
+from easydata.data import DataBag
+
+__all__ = ("LazyItem",)
+
+
+class LazyItem(Mapping):
+    """Read-only item whose values are parsed only when they are accessed for
+    the first time."""
+
+    def __init__(
+        self,
+        data: DataBag,
+        item_keys: Dict[str, None],
+        item_groups_keys: Dict[str, str],
+    ):
+
+        self._data = data
+        self._item_keys = item_keys
+        self._item_groups_keys = item_groups_keys
+        self._item: Dict[str, Any] = {}
+
+    def __getitem__(self, item_key: str) -> Any:
+        if item_key in self._item:
+            return self._item[item_key]
+
+        if item_key not in self._item_keys:
+            raise KeyError(item_key)
+
+        item_group = self._item_groups_keys.get(item_key)
+
+        if item_group:
+            group_values = self._data.get(item_group)
+
+            value = group_values.get(item_key) if group_values else None
+        else:
+            value = self._data.get(item_key)
+
+        self._item[item_key] = value
+
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._item_keys)
+
+    def __len__(self) -> int:
+        return len(self._item_keys)
+
+    def __repr__(self):
+        return "<{} parsed={}>".format(type(self).__name__, self._item)
+
+    @property
+    def data(self) -> DataBag:
+        return self._data
+
+    def to_dict(self) -> dict:
+        return {item_key: self[item_key] for item_key in self._item_keys}
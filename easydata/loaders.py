@@ -13,6 +13,8 @@ class ObjectLoader(object):
 
         self._objects: OrderedDict = OrderedDict()
 
+        self._version = 0
+
         if objects:
             self.add_list(objects, unique)
 
@@ -36,6 +38,12 @@ class ObjectLoader(object):
     def __getitem__(self, key):
         return self._objects[key]
 
+    @property
+    def version(self) -> int:
+        """Changes whenever objects are added or deleted."""
+
+        return self._version
+
     def values(self):
         yield from self._objects.values()
 
@@ -67,6 +75,8 @@ class ObjectLoader(object):
 
             self._total_object_count += 1
 
+            self._version += 1
+
     def add_list(
         self,
         objects: List[Any],
@@ -98,6 +108,8 @@ class ObjectLoader(object):
         if key in self._objects:
             del self._objects[key]
 
+            self._version += 1
+
     def del_by_type(self, object_type: Any):
         keys_to_delete = []
 
@@ -108,6 +120,8 @@ class ObjectLoader(object):
         for key_to_delete in keys_to_delete:
             del self._objects[key_to_delete]
 
+            self._version += 1
+
     def del_by_type_list(self, object_type_list: List[Any]):
         for object_type in object_type_list:
             self.del_by_type(object_type)
@@ -1,12 +1,26 @@
-from typing import Iterator, List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from easydata import models
 from easydata.data import DataBag
 from easydata.groups import ItemGroup
+from easydata.items import LazyItem
 from easydata.loaders import ObjectLoader
-from easydata.mixins import ConfigMixin
+from easydata.mixins import ConfigMixin, config_property
 from easydata.parsers.base import Base as BaseParser
+from easydata.parsers.base import BaseData
 from easydata.utils import mix
+from easydata.utils.profiler import Profiler
 
 __all__ = ("ModelManager",)
 
@@ -18,6 +32,44 @@ MODEL_VARIANTS_KEYS = [
 ]
 
 
+class ItemProjection:
+    def __init__(
+        self,
+        parse_item_keys: Tuple[str, ...],
+        item_keys: Dict[str, None],
+        only: Optional[Set[str]] = None,
+        exclude: Optional[Set[str]] = None,
+    ):
+
+        self.parse_item_keys = parse_item_keys
+        self.item_keys = item_keys
+
+        self._only = only
+        self._exclude = exclude
+
+    def filter_item(self, item: dict) -> dict:
+        if self._only is not None:
+            return {k: v for k, v in item.items() if k in self._only}
+
+        exclude = self._exclude or set()
+
+        return {k: v for k, v in item.items() if k not in exclude}
+
+
+class ProfiledDataProcessor:
+    def __init__(self, processor: Any, profiler: Profiler, name: str):
+        self._processor = processor
+        self._profiler = profiler
+        self._name = name
+
+    def parse(self, value: Any) -> Iterator[Any]:
+        return self._profiler.time_iter(
+            "data_processors",
+            self._name,
+            iter(self._processor.parse(value)),
+        )
+
+
 class ModelManager(ConfigMixin):
     _ignore_item_attr_prefix = ["item_processors"]
 
@@ -42,6 +94,14 @@ class ModelManager(ConfigMixin):
 
         self._item_processors_loader = ObjectLoader()
 
+        self._item_projections: Dict[tuple, ItemProjection] = {}
+
+        self._variant_invariant_item_keys: Dict[str, Tuple[str, ...]] = {}
+
+        self._profiler: Optional[Profiler] = None
+
+        self._profile_prefix = ""
+
         self._init_model(model)
 
         self._init_config()
@@ -50,6 +110,11 @@ class ModelManager(ConfigMixin):
 
         self._init_processors_config()
 
+        if self.config["ED_PROFILE"]:
+            self.set_profiler(Profiler())
+        else:
+            self.compile()
+
     @property
     def data_processors(self) -> ObjectLoader:
         return self._data_processors_loader
@@ -67,39 +132,136 @@ class ModelManager(ConfigMixin):
     def get_item_val(self, item_key: str):
         return self._item_parsers[item_key]
 
+    def variant_invariant_item_keys(self, variants_source: str) -> Tuple[str, ...]:
+        """Item keys whose parsers read neither a variants source nor other
+        item values, so their values are the same for all variants."""
+
+        if variants_source not in self._variant_invariant_item_keys:
+            self._variant_invariant_item_keys[variants_source] = tuple(
+                item_key
+                for item_key, item_parser in self._item_parsers.items()
+                if _is_variant_invariant(item_parser, variants_source)
+            )
+
+        return self._variant_invariant_item_keys[variants_source]
+
+    @property
+    def profiler(self) -> Optional[Profiler]:
+        return self._profiler
+
+    def set_profiler(self, profiler: Optional[Profiler], prefix: str = ""):
+        """Sets profiler which times item parsers, processors and callbacks of
+        this and nested item models. Profiler is removed if it's None."""
+
+        self._profiler = profiler
+        self._profile_prefix = prefix
+
+        for item_key, item_parser in self._item_parsers.items():
+            if isinstance(item_parser, models.ItemModel):
+                item_parser.model_manager.set_profiler(
+                    profiler,
+                    prefix="{}{}.".format(prefix, item_key),
+                )
+
+        self.compile()
+
+    def compile(self):
+        """Freeze model callbacks, processors and item parsers into a flat
+        execution plan, so that per item processing doesn't need to discover
+        them again. Plan is compiled again once data or item processors
+        loaders are modified."""
+
+        self._compiled_loaders_versions = self._loaders_versions()
+
+        self._preprocess_data_cbs = self._get_models_callbacks("preprocess_data")
+        self._load_item_cbs = self._get_models_callbacks("load_item")
+        self._process_data_cbs = self._get_models_callbacks("process_data")
+        self._preprocess_item_cbs = self._get_models_callbacks("preprocess_item")
+        self._process_item_cbs = self._get_models_callbacks("process_item")
+
+        self._data_processors = self._profile_data_processors(
+            self._data_processors_loader.values()
+        )
+
+        self._item_processors_parse = tuple(
+            self._profile(
+                "item_processors",
+                _processor_name(item_processor),
+                mix.compile_processor(item_processor),
+            )
+            for item_processor in self._item_processors_loader.values()
+        )
+
+        self._item_parsers_dispatch = {
+            item_key: self._profile(
+                "items",
+                item_key,
+                self._compile_item_parser(item_parser),
+            )
+            for item_key, item_parser in self._item_parsers.items()
+        }
+
+        self._compile_lazy_item_keys()
+
+        self._item_projections.clear()
+
+    def _loaders_versions(self) -> Tuple[int, int]:
+        return (
+            self._data_processors_loader.version,
+            self._item_processors_loader.version,
+        )
+
+    def _compile_if_loaders_changed(self):
+        if self._loaders_versions() != self._compiled_loaders_versions:
+            self.compile()
+
     def process_item_parser(self, item_key: str, data: DataBag):
         try:
-            return self._process_item_parser(item_key, data)
+            return self._item_parsers_dispatch[item_key](data)
         except self._drop_item_exception as msg:
             raise self._drop_item_exception(msg)
         except Exception as e:
-            # Append to all exception info regarding which item
-            # key was affected
-            append_error_msg = 'FOR ITEM KEY: "%s"' % item_key
-
-            e.args = (append_error_msg,) + e.args
+            _append_item_key_error_msg(e, item_key)
 
             raise
 
     def parse_data_to_items(
         self,
         data=None,
+        lazy: bool = False,
+        only: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        source_processors: Optional[list] = None,
         **kwargs,
-    ) -> Iterator[dict]:
+    ) -> Iterator[Union[dict, LazyItem]]:
+
+        projection = self._get_item_projection(only, exclude)
 
         data = mix.data_to_data_bag(data, **kwargs)
 
         if not data.has_model_manger_instance():
             data.init_model_manager(self)
 
+        if lazy:
+            self._validate_lazy_items()
+
+            data_to_item = self._data_to_lazy_item
+        else:
+            data_to_item = self._data_to_item
+
+        if source_processors:
+            mix.init_processors_config(source_processors, self.config)
+
+            source_processors = list(self._profile_data_processors(source_processors))
+
         drop_item_exceptions = []
 
-        for iter_data in self._apply_data_processors(data):
+        for iter_data in self._apply_data_processors(data, source_processors):
             # we store exceptions so that other variations could get
             # processed, and we throw stored exceptions after iteration has ended
 
             try:
-                yield self._data_to_item(iter_data)
+                yield data_to_item(iter_data, projection)
             except self._drop_item_exception as drop_item_exception:
                 # Store item drop exceptions
                 drop_item_exceptions.append(drop_item_exception)
@@ -111,49 +273,229 @@ class ModelManager(ConfigMixin):
 
             raise self._drop_item_exception(drop_item_exceptions[0])
 
-    def _process_item_parser(self, item_key: str, data: DataBag):
+    def parse_data_to_columns(
+        self,
+        documents: Iterable[Any],
+        only: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        **kwargs,
+    ) -> Dict[str, list]:
+        """Parses a batch of documents field by field instead of document by
+        document, so that data parsers can parse values of all documents at
+        once. Returns a list of values of all items for each item key."""
+
+        projection = self._get_item_projection(only, exclude)
+
+        data_list = []
+
+        for document in documents:
+            data = mix.data_to_data_bag(document, **kwargs)
+
+            if not data.has_model_manger_instance():
+                data.init_model_manager(self)
+
+            for iter_data in self._apply_data_processors(data):
+                for load_item_cb in self._load_item_cbs:
+                    load_item_cb(iter_data)
+
+                data_list.append(iter_data)
+
+        item_keys = projection.parse_item_keys if projection else self.item_keys()
+
+        # Dropped items are left out of columns
+        dropped_data_indexes: Set[int] = set()
+
+        for item_key in item_keys:
+            self._parse_column(item_key, data_list, dropped_data_indexes)
+
+        columns: Dict[str, list] = {}
+
+        items_len = 0
+
+        for data_index, data in enumerate(data_list):
+            if data_index in dropped_data_indexes:
+                continue
+
+            try:
+                item = self._parsed_data_to_item(data, projection)
+            except self._drop_item_exception:
+                continue
+
+            if not item:
+                continue
+
+            # Item keys which are missing in some items get None values
+            for item_key, item_value in item.items():
+                if item_key not in columns:
+                    columns[item_key] = [None] * items_len
+
+                columns[item_key].append(item_value)
+
+            items_len += 1
+
+            for column in columns.values():
+                if len(column) < items_len:
+                    column.append(None)
+
+        return columns
+
+    def _parse_column(
+        self,
+        item_key: str,
+        data_list: List[DataBag],
+        dropped_data_indexes: Set[int],
+    ):
+
+        column_data = [
+            (data_index, data)
+            for data_index, data in enumerate(data_list)
+            if data_index not in dropped_data_indexes
+            and item_key not in data.cached_results
+        ]
+
         item_parser = self._item_parsers[item_key]
 
+        # Profiled parsers are timed for each document
+        if isinstance(item_parser, BaseData) and not self._profiler:
+            errors: Dict[int, Exception] = {}
+
+            values = item_parser.parse_values([data for _, data in column_data], errors)
+
+            for column_index, (data_index, data) in enumerate(column_data):
+                error = errors.get(column_index)
+
+                if error is None:
+                    data.set(item_key, values[column_index])
+                elif isinstance(error, self._drop_item_exception):
+                    dropped_data_indexes.add(data_index)
+                else:
+                    _append_item_key_error_msg(error, item_key)
+
+                    raise error
+
+            return
+
+        for data_index, data in column_data:
+            try:
+                data.get(item_key)
+            except self._drop_item_exception:
+                dropped_data_indexes.add(data_index)
+
+    def reparse_data_to_item(
+        self,
+        data: DataBag,
+        changed_sources: Dict[str, Any],
+        lazy: bool = False,
+        only: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> Union[dict, LazyItem, None]:
+
+        if (
+            not data.has_model_manger_instance()
+            or not self.config["ED_TRACK_DEPENDENCIES"]
+        ):
+            raise ValueError(
+                "Only data bags of items which were parsed with enabled "
+                "ED_TRACK_DEPENDENCIES config can be reparsed"
+            )
+
+        projection = self._get_item_projection(only, exclude)
+
+        # Data processors are not applied again, so changed sources must be
+        # in the same form as item parsers read them
+        reparse_data = data.reparse_copy(changed_sources)
+
+        if lazy:
+            self._validate_lazy_items()
+
+            return self._data_to_lazy_item(reparse_data, projection)
+
+        return self._data_to_item(reparse_data, projection)
+
+    def _compile_item_parser(self, item_parser) -> Callable[[DataBag], Any]:
         if isinstance(item_parser, models.ItemModel):
-            data = data.copy(item_parser.model_manager)
+            model_manager = item_parser.model_manager
 
-            return item_parser.parse_item(data)
+            def parse_item_model(data: DataBag):
+                return item_parser.parse_item(data.copy(model_manager))
 
-        return mix.process_item_parser(item_parser, data)
+            return parse_item_model
 
-    @property
+        return mix.compile_item_parser(item_parser)
+
+    def _profile(self, section: str, name: str, func: Callable) -> Callable:
+        if not self._profiler:
+            return func
+
+        return self._profiler.time(section, self._profile_prefix + name, func)
+
+    def _profile_data_processors(self, data_processors: Iterable) -> tuple:
+        if not self._profiler:
+            return tuple(data_processors)
+
+        return tuple(
+            ProfiledDataProcessor(
+                processor=data_processor,
+                profiler=self._profiler,
+                name=self._profile_prefix + _processor_name(data_processor),
+            )
+            for data_processor in data_processors
+        )
+
+    @config_property
     def _drop_item_exception(self):
         return self.config["ED_DROP_ITEM_EXCEPTION"]
 
-    def _apply_data_processors(self, data: DataBag) -> Iterator[DataBag]:
-        data = self._preprocess_data_cb(data)
+    def _apply_data_processors(
+        self,
+        data: DataBag,
+        source_processors: Optional[list] = None,
+    ) -> Iterator[DataBag]:
+
+        self._compile_if_loaders_changed()
 
-        data_processors = list(self._data_processors_loader.values())
+        # Source processors split source data into documents, which are then
+        # processed by model callbacks and data processors one by one
+        if source_processors:
+            for source_data in mix.apply_data_processors(data, source_processors):
+                yield from self._apply_data_processors(source_data)
 
-        if data_processors:
-            for iter_data in mix.apply_data_processors(data, data_processors):
-                iter_data = self._process_data_cb(iter_data)
+            return
+
+        for preprocess_data_cb in self._preprocess_data_cbs:
+            data = preprocess_data_cb(data)
+
+        if self._data_processors:
+            for iter_data in mix.apply_data_processors(data, self._data_processors):
+                for process_data_cb in self._process_data_cbs:
+                    iter_data = process_data_cb(iter_data)
 
                 yield iter_data
         else:
             yield data
 
     def _apply_item_processors(self, item: dict):
-        item = self._preprocess_item_cb(item)
+        self._compile_if_loaders_changed()
 
-        if item is None:
-            return None
+        for preprocess_item_cb in self._preprocess_item_cbs:
+            item = preprocess_item_cb(item)
 
-        item = mix.apply_processors(
-            value=item,
-            processors=list(self._item_processors_loader.values()),
-            return_on_none=True,
-        )
+            if not item:
+                return None
 
-        if not item:
-            return None
+        for item_processor_parse in self._item_processors_parse:
+            item = item_processor_parse(item)
+
+            if not item:
+                return None
 
-        return self._process_item_cb(item)
+        for process_item_cb in self._process_item_cbs:
+            item = process_item_cb(item)
+
+            if not item:
+                return None
+
+        return item
 
     def _remove_protected_item_keys(self, item: dict) -> dict:
         if not self._item_protected_names:
@@ -165,10 +507,27 @@ class ModelManager(ConfigMixin):
 
         return item
 
-    def _data_to_item(self, data: DataBag):
-        self._load_item_cb(data)
+    def _data_to_item(
+        self,
+        data: DataBag,
+        projection: Optional[ItemProjection] = None,
+    ):
 
-        item = data.get_all()
+        for load_item_cb in self._load_item_cbs:
+            load_item_cb(data)
+
+        return self._parsed_data_to_item(data, projection)
+
+    def _parsed_data_to_item(
+        self,
+        data: DataBag,
+        projection: Optional[ItemProjection] = None,
+    ):
+
+        if projection:
+            item = data.get_multi(projection.parse_item_keys)
+        else:
+            item = data.get_all()
 
         item = self._merge_groups_items(item)
 
@@ -177,20 +536,161 @@ class ModelManager(ConfigMixin):
         if not item:
             return None
 
-        return self._remove_protected_item_keys(item)
+        item = self._remove_protected_item_keys(item)
+
+        return projection.filter_item(item) if projection else item
+
+    def _data_to_lazy_item(
+        self,
+        data: DataBag,
+        projection: Optional[ItemProjection] = None,
+    ) -> LazyItem:
+
+        for load_item_cb in self._load_item_cbs:
+            load_item_cb(data)
+
+        # Protected item values are parsed in advance, since they usually
+        # serve as drop item validators
+        data.get_multi(self._lazy_item_protected_keys)
+
+        return LazyItem(
+            data=data,
+            item_keys=projection.item_keys if projection else self._lazy_item_keys,
+            item_groups_keys=self._lazy_item_groups_keys,
+        )
+
+    def _get_item_projection(
+        self,
+        only: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> Optional[ItemProjection]:
+
+        self._compile_if_loaders_changed()
+
+        if only is None and exclude is None:
+            return None
+
+        if only is not None and exclude is not None:
+            raise ValueError("only and exclude cannot be set at the same time!")
+
+        projection_key = (
+            tuple(only) if only is not None else None,
+            tuple(exclude) if exclude is not None else None,
+        )
+
+        if projection_key not in self._item_projections:
+            self._item_projections[projection_key] = self._create_item_projection(
+                only=set(only) if only is not None else None,
+                exclude=set(exclude) if exclude is not None else None,
+            )
+
+        return self._item_projections[projection_key]
+
+    def _create_item_projection(
+        self,
+        only: Optional[Set[str]] = None,
+        exclude: Optional[Set[str]] = None,
+    ) -> ItemProjection:
+
+        # Item keys which are added by item processors aren't known in advance
+        if only is not None:
+            item_keys = {k: None for k in self._lazy_item_keys if k in only}
+        else:
+            exclude = exclude or set()
+
+            item_keys = {k: None for k in self._lazy_item_keys if k not in exclude}
+
+        required_item_keys = list(item_keys)
+
+        # Models with preprocess_item or process_item callbacks can declare item
+        # keys which the callbacks read through a required_item_keys attribute
+        item_consumers = list(self._item_processors_loader.values()) + [
+            model
+            for model in self._models
+            if hasattr(model, "preprocess_item") or hasattr(model, "process_item")
+        ]
+
+        for item_consumer in item_consumers:
+            consumer_item_keys = getattr(item_consumer, "required_item_keys", None)
+
+            if consumer_item_keys is None:
+                required_item_keys = list(self._lazy_item_keys)
+
+                break
+
+            required_item_keys += consumer_item_keys
+
+        # Item values which are reached by parsers through from_item or
+        # data.get are parsed on demand, so they don't need to be listed here.
+        parse_item_keys = dict.fromkeys(self._lazy_item_protected_keys)
+
+        for item_key in required_item_keys:
+            item_key = self._lazy_item_groups_keys.get(item_key, item_key)
+
+            if item_key in self._item_parsers:
+                parse_item_keys[item_key] = None
+
+        return ItemProjection(
+            parse_item_keys=tuple(parse_item_keys),
+            item_keys=item_keys,
+            only=only,
+            exclude=exclude,
+        )
+
+    def _validate_lazy_items(self):
+        self._compile_if_loaders_changed()
+
+        if (
+            self._item_processors_parse
+            or self._preprocess_item_cbs
+            or self._process_item_cbs
+        ):
+            raise ValueError(
+                "Lazy items are not supported by models with item processors or "
+                "preprocess_item and process_item callbacks since they require "
+                "all item values."
+            )
+
+    def _compile_lazy_item_keys(self):
+        lazy_item_keys: List[str] = []
+
+        self._lazy_item_groups_keys: Dict[str, str] = {}
+
+        self._lazy_item_protected_keys: List[str] = []
+
+        for item_key, item_parser in self._item_parsers.items():
+            if item_key in self._item_protected_names:
+                self._lazy_item_protected_keys.append(item_key)
+
+            if item_key in self._item_groups:
+                if item_parser.group_item_protected_names:
+                    self._lazy_item_protected_keys.append(item_key)
+
+                for group_item_key in item_parser.group_item_names:
+                    self._lazy_item_groups_keys[group_item_key] = item_key
+
+                    lazy_item_keys.append(group_item_key)
+            else:
+                lazy_item_keys.append(item_key)
+
+        # Dict is used as an ordered set
+        self._lazy_item_keys = {
+            item_key: None
+            for item_key in lazy_item_keys
+            if item_key not in self._item_protected_names
+        }
 
     def _merge_groups_items(self, item):
         if self._item_groups:
             for item_group in self._item_groups:
-                key_values = item[item_group]
+                # Group could be left out if only some item keys are parsed.
+                # Group dictionary is removed from item since it's key values
+                # are merged into item.
+                key_values = item.pop(item_group, None)
 
                 if key_values:
                     item |= key_values
 
-                # Remove group dictionary from item since it's key value are
-                # merged into item
-                del item[item_group]
-
         return item
 
     def _init_model(self, model):
@@ -226,16 +726,16 @@ class ModelManager(ConfigMixin):
     def _init_parsers_config(self):
         for parser_instance in self._item_parsers.values():
             if isinstance(parser_instance, BaseParser):
-                parser_instance.init_config(self.config)
+                parser_instance.init_config(self.config).bind_config()
 
     def _init_processors_config(self):
         for item_processor in self._item_processors_loader.values():
             item_processor.init_model(self._model)
-            item_processor.init_config(self.config)
+            item_processor.init_config(self.config).bind_config()
 
         for data_processor in self._data_processors_loader.values():
             data_processor.init_model(self._model)
-            data_processor.init_config(self.config)
+            data_processor.init_config(self.config).bind_config()
 
     def _load_item_parsers_from_model(self, model):
         item_attr_items = mix.iter_attr_data_from_obj(
@@ -282,41 +782,45 @@ class ModelManager(ConfigMixin):
         for config_name, config_value in config_data:
             self._config_properties[config_name] = config_value
 
-    def _preprocess_data_cb(self, data: DataBag):
-        for model in self._models:
-            if hasattr(model, "preprocess_data"):
-                data = model.preprocess_data(data)
+    def _get_models_callbacks(self, callback_name: str) -> Tuple[Callable, ...]:
+        return tuple(
+            self._profile(
+                "callbacks",
+                "{}.{}".format(type(model).__name__, callback_name),
+                getattr(model, callback_name),
+            )
+            for model in self._models
+            if hasattr(model, callback_name)
+        )
 
-        return data
 
-    def _load_item_cb(self, data: DataBag):
-        for model in self._models:
-            if hasattr(model, "load_item"):
-                model.load_item(data)
+def _append_item_key_error_msg(exception: Exception, item_key: str):
+    # Append to all exception info regarding which item key was affected
+    append_error_msg = 'FOR ITEM KEY: "%s"' % item_key
 
-    def _process_data_cb(self, data: DataBag):
-        for model in self._models:
-            if hasattr(model, "process_data"):
-                data = model.process_data(data)
+    exception.args = (append_error_msg,) + exception.args
 
-        return data
 
-    def _preprocess_item_cb(self, item: dict):
-        for model in self._models:
-            if hasattr(model, "preprocess_item"):
-                item = model.preprocess_item(item)
+def _is_variant_invariant(item_parser: Any, variants_source: str) -> bool:
+    # Only data parsers are checked, since other parsers and item methods can
+    # read anything from a data bag
+    if not isinstance(item_parser, BaseData):
+        return False
 
-            if not item:
-                return None
+    sources = item_parser.read_sources()
 
-        return item
+    if sources is None:
+        return False
 
-    def _process_item_cb(self, item: dict):
-        for model in self._models:
-            if hasattr(model, "process_item"):
-                item = model.process_item(item)
+    # Variants data is also added under keys like main_variants and main_key
+    variants_source_prefix = variants_source + "_"
 
-            if not item:
-                return None
+    return not any(
+        source == variants_source or source.startswith(variants_source_prefix)
+        for source in sources
+    )
 
-        return item
+
+def _processor_name(processor: Any) -> str:
+    # Functions are named by their name and processor objects by their class
+    return getattr(processor, "__name__", None) or type(processor).__name__
@@ -1,12 +1,49 @@
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Tuple, Union
 
 from easydata.config.loader import ConfigLoader
 from easydata.utils import config
 
 
+class config_property:
+    """Property which is resolved from a config once and then read as a plain
+    instance attribute. It's resolved again after a new config is set."""
+
+    def __init__(self, func: Callable[[Any], Any]):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+
+        value = self.func(instance)
+
+        instance.__dict__[self.name] = value
+
+        return value
+
+
 class ConfigMixin:
     _config: Optional[ConfigLoader] = None
 
+    _config_property_names: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        cls._config_property_names = tuple(
+            {
+                attr_name: None
+                for klass in reversed(cls.__mro__)
+                for attr_name, attr_value in vars(klass).items()
+                if isinstance(attr_value, config_property)
+            }
+        )
+
     @property
     def has_config(self):
         return bool(self._config)
@@ -24,7 +61,7 @@ class ConfigMixin:
         override: bool = False,
     ):
 
-        if not self.has_config or override:
+        if not self._config or override:
             if isinstance(config_obj, ConfigLoader):
                 self._config = config_obj
             else:
@@ -34,4 +71,21 @@ class ConfigMixin:
 
                 self._config = new_config
 
+            self._reset_config_properties()
+
         return self
+
+    def bind_config(self):
+        """Resolves all config properties, so that parsing only reads plain
+        attributes instead of looking up a config for each value."""
+
+        for config_property_name in self._config_property_names:
+            getattr(self, config_property_name)
+
+        return self
+
+    def _reset_config_properties(self):
+        instance_dict = self.__dict__
+
+        for config_property_name in self._config_property_names:
+            instance_dict.pop(config_property_name, None)
@@ -1,11 +1,39 @@
+import asyncio
+import os
 from abc import ABC
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from contextlib import contextmanager
 from functools import cached_property
-from typing import Any, Callable, Iterator, List, Optional
+from itertools import chain, islice
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-from easydata.managers import ModelManager
+from easydata import managers
+from easydata.data import DataBag
+from easydata.items import LazyItem
 from easydata.parsers.base import Base
-from easydata.processors.data import DataBaseProcessor
+from easydata.processors.data import DataBaseProcessor, DataJsonLinesProcessor
 from easydata.processors.item import ItemBaseProcessor
+from easydata.utils.profiler import Profiler
 
 __all__ = (
     "BaseModel",
@@ -16,10 +44,183 @@ __all__ = (
 )
 
 
+_batch_worker_model: Any = None
+
+_no_item: Any = object()
+
+
+def _init_batch_worker(model):
+    global _batch_worker_model
+
+    _batch_worker_model = model
+
+    # Initialize model manager in advance so that it's ready for the first chunk
+    _batch_worker_model.model_manager
+
+
+def _parse_batch_chunk(
+    chunk: List[Tuple[int, Any]],
+    kwargs: dict,
+) -> List[Tuple[int, list, Optional[Exception]]]:
+
+    chunk_results: List[Tuple[int, list, Optional[Exception]]] = []
+
+    for document_index, document in chunk:
+        items: list = []
+
+        try:
+            for item in _batch_worker_model.parse_items(document, **kwargs):
+                items.append(item)
+        except Exception as e:
+            chunk_results.append((document_index, items, e))
+        else:
+            chunk_results.append((document_index, items, None))
+
+    return chunk_results
+
+
+def _iter_chunks(
+    documents: Iterable[Any],
+    chunksize: int,
+) -> Iterator[List[Tuple[int, Any]]]:
+
+    iter_documents = enumerate(documents)
+
+    while True:
+        chunk = list(islice(iter_documents, chunksize))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _iter_batch_results(
+    executor: ProcessPoolExecutor,
+    chunks: Iterator[List[Tuple[int, Any]]],
+    kwargs: dict,
+    ordered: bool,
+    max_pending: int,
+):
+
+    # Pending futures are cancelled once results aren't read anymore, e.g.
+    # after an exception. Executor's cancel_futures requires Python 3.9.
+    ordered_pending: Deque[Future] = deque()
+
+    pending: Set[Future] = set()
+
+    try:
+        if ordered:
+            for chunk in chunks:
+                ordered_pending.append(
+                    executor.submit(_parse_batch_chunk, chunk, kwargs)
+                )
+
+                if len(ordered_pending) >= max_pending:
+                    yield ordered_pending.popleft().result()
+
+            while ordered_pending:
+                yield ordered_pending.popleft().result()
+        else:
+            for chunk in chunks:
+                pending.add(executor.submit(_parse_batch_chunk, chunk, kwargs))
+
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        yield future.result()
+
+            done, pending = wait(pending)
+
+            for future in done:
+                yield future.result()
+    finally:
+        for future in chain(ordered_pending, pending):
+            future.cancel()
+
+
 class BaseModel(ABC):
     @cached_property
-    def model_manager(self) -> ModelManager:
-        return ModelManager(self)
+    def model_manager(self) -> "managers.ModelManager":
+        return managers.ModelManager(self)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+
+        # Model manager holds compiled plan which can't be pickled. It will
+        # be created again once model is unpickled.
+        state.pop("model_manager", None)
+        state.pop("_async_semaphore", None)
+
+        return state
+
+    @contextmanager
+    def profile(self, profiler: Optional[Profiler] = None) -> Iterator[Profiler]:
+        """Times item parsers, processors and callbacks of items parsed within
+        a context, including nested item models."""
+
+        model_manager = self.model_manager
+
+        previous_profiler = model_manager.profiler
+
+        profiler = profiler or Profiler()
+
+        model_manager.set_profiler(profiler)
+
+        try:
+            yield profiler
+        finally:
+            model_manager.set_profiler(previous_profiler)
+
+    def _get_async_semaphore(self) -> Optional[asyncio.Semaphore]:
+        concurrency = self.model_manager.config["ED_ASYNC_CONCURRENCY"]
+
+        if not concurrency:
+            return None
+
+        loop = asyncio.get_running_loop()
+
+        # Semaphore is bound to the event loop in which it's used
+        semaphore_loop, semaphore = self.__dict__.get("_async_semaphore", (None, None))
+
+        if semaphore_loop is not loop:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            self.__dict__["_async_semaphore"] = (loop, semaphore)
+
+        return semaphore
+
+    async def _aparse_items(
+        self,
+        data=None,
+        executor: Optional[Executor] = None,
+        **kwargs,
+    ) -> AsyncGenerator[dict, None]:
+
+        loop = asyncio.get_running_loop()
+
+        executor = executor or self.model_manager.config["ED_ASYNC_EXECUTOR"]
+
+        semaphore = self._get_async_semaphore()
+
+        iter_items = self._parse_items(data, **kwargs)
+
+        while True:
+            # Next item is parsed only when it's requested, so slow consumers
+            # will hold parsing back instead of letting items pile up.
+            if semaphore:
+                async with semaphore:
+                    item = await loop.run_in_executor(
+                        executor, next, iter_items, _no_item
+                    )
+            else:
+                item = await loop.run_in_executor(executor, next, iter_items, _no_item)
+
+            if item is _no_item:
+                return
+
+            yield item
 
     def _parse_items(
         self,
@@ -47,6 +248,140 @@ class ItemModel(BaseModel):
 
         return next(self._parse_items(data, **kwargs))
 
+    def parse_columns(
+        self,
+        documents: Iterable[Any],
+        **kwargs,
+    ) -> Dict[str, list]:
+        """Parse a batch of documents field by field into a list of values for
+        each item key. Dropped items are left out."""
+
+        return self.model_manager.parse_data_to_columns(documents, **kwargs)
+
+    def reparse_item(
+        self,
+        data: DataBag,
+        changed_sources: Dict[str, Any],
+        **kwargs,
+    ) -> Union[dict, LazyItem, None]:
+        """Parse an item again from a data bag of a previously parsed item where
+        only some sources have changed. Item values which don't depend on
+        changed sources are reused. Requires ED_TRACK_DEPENDENCIES config."""
+
+        return self.model_manager.reparse_data_to_item(
+            data,
+            changed_sources,
+            **kwargs,
+        )
+
+    def parse_jsonl(
+        self,
+        path: Union[str, os.PathLike],
+        offset: int = 0,
+        **kwargs,
+    ) -> Iterator[dict]:
+        """Parse each record of a json lines file as its own document. Byte
+        offsets of records are available under main_offset and main_next_offset
+        data sources."""
+
+        source_processors = [DataJsonLinesProcessor(offset=offset)]
+
+        yield from self._parse_items(
+            path,
+            source_processors=source_processors,
+            **kwargs,
+        )
+
+    async def aparse_items(
+        self,
+        data=None,
+        executor: Optional[Executor] = None,
+        **kwargs,
+    ) -> AsyncGenerator[dict, None]:
+        """Asynchronous variant of parse_items where item parsing is done in an
+        executor, so that event loop doesn't get blocked."""
+
+        async for item in self._aparse_items(data, executor, **kwargs):
+            yield item
+
+    async def aparse_item(
+        self,
+        data=None,
+        executor: Optional[Executor] = None,
+        **kwargs,
+    ) -> dict:
+
+        iter_items = self._aparse_items(data, executor, **kwargs)
+
+        try:
+            return await iter_items.__anext__()
+        finally:
+            await iter_items.aclose()
+
+    def parse_items_batch(
+        self,
+        documents: Iterable[Any],
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+        ordered: bool = True,
+        **kwargs,
+    ) -> Iterator[dict]:
+        """Parse documents in a process pool where each worker holds its own
+        copy of the model. Items are streamed back in document order unless
+        ordered is False. Model must be picklable."""
+
+        if chunksize < 1:
+            raise ValueError("chunksize must be greater than 0")
+
+        workers = workers or os.cpu_count() or 1
+
+        drop_item_exception = self.model_manager.config["ED_DROP_ITEM_EXCEPTION"]
+
+        drop_item_exceptions = []
+
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(self,),
+        )
+
+        batch_results = _iter_batch_results(
+            executor=executor,
+            chunks=_iter_chunks(documents, chunksize),
+            kwargs=kwargs,
+            ordered=ordered,
+            max_pending=workers * 2,
+        )
+
+        try:
+            for chunk_results in batch_results:
+                for document_index, items, exception in chunk_results:
+                    yield from items
+
+                    if exception is None:
+                        continue
+
+                    # Append to exception info regarding which document was affected
+                    append_error_msg = "FOR DOCUMENT INDEX: %s" % document_index
+
+                    exception.args = (append_error_msg,) + exception.args
+                    exception.document_index = document_index  # type: ignore
+
+                    if not isinstance(exception, drop_item_exception):
+                        raise exception
+
+                    drop_item_exceptions.append(exception)
+        finally:
+            batch_results.close()
+
+            executor.shutdown(wait=True)
+
+        if drop_item_exceptions:
+            if len(drop_item_exceptions) > 1:
+                raise drop_item_exception(drop_item_exceptions)
+
+            raise drop_item_exceptions[0]
+
 
 class StackedMixin:
     def __init__(
@@ -1,16 +1,86 @@
-from easydata.parsers.choice import *  # noqa: F401 F403
-from easydata.parsers.clause import *  # noqa: F401 F403
-from easydata.parsers.data import *  # noqa: F401 F403
-from easydata.parsers.desc import *  # noqa: F401 F403
-from easydata.parsers.dict import *  # noqa: F401 F403
-from easydata.parsers.drop import *  # noqa: F401 F403
-from easydata.parsers.email import *  # noqa: F401 F403
-from easydata.parsers.has import *  # noqa: F401 F403
-from easydata.parsers.list import *  # noqa: F401 F403
-from easydata.parsers.math import *  # noqa: F401 F403
-from easydata.parsers.misc import *  # noqa: F401 F403
-from easydata.parsers.number import *  # noqa: F401 F403
-from easydata.parsers.price import PriceFloat, PriceInt, PriceText  # noqa: F401 F403
-from easydata.parsers.text import *  # noqa: F401 F403
-from easydata.parsers.time import *  # noqa: F401 F403
-from easydata.parsers.url import *  # noqa: F401 F403
+from typing import TYPE_CHECKING
+
+from easydata.utils.imports import lazy_module
+
+if TYPE_CHECKING:
+    from easydata.parsers.choice import *  # noqa: F401 F403
+    from easydata.parsers.clause import *  # noqa: F401 F403
+    from easydata.parsers.data import *  # noqa: F401 F403
+    from easydata.parsers.desc import *  # noqa: F401 F403
+    from easydata.parsers.dict import *  # noqa: F401 F403
+    from easydata.parsers.drop import *  # noqa: F401 F403
+    from easydata.parsers.email import *  # noqa: F401 F403
+    from easydata.parsers.has import *  # noqa: F401 F403
+    from easydata.parsers.list import *  # noqa: F401 F403
+    from easydata.parsers.math import *  # noqa: F401 F403
+    from easydata.parsers.misc import *  # noqa: F401 F403
+    from easydata.parsers.number import *  # noqa: F401 F403
+    from easydata.parsers.price import *  # noqa: F401 F403
+    from easydata.parsers.text import *  # noqa: F401 F403
+    from easydata.parsers.time import *  # noqa: F401 F403
+    from easydata.parsers.url import *  # noqa: F401 F403
+
+# Parsers are imported when they are accessed for the first time, so that
+# dependencies like dateparser are loaded only by models which use them
+__all__ = lazy_module(
+    __name__,
+    {
+        "easydata.parsers.choice": ("BaseLookups", "Choice"),
+        "easydata.parsers.clause": ("OR", "WITH", "SWITCH", "IF"),
+        "easydata.parsers.data": ("Data",),
+        "easydata.parsers.desc": (
+            "Description",
+            "Sentences",
+            "Features",
+            "FeaturesDict",
+            "Feature",
+        ),
+        "easydata.parsers.dict": (
+            "Dict",
+            "TextDict",
+            "HasDict",
+            "PriceFloatDict",
+            "PriceTextDict",
+        ),
+        "easydata.parsers.drop": ("DropContains", "DropEmpty"),
+        "easydata.parsers.email": ("Email",),
+        "easydata.parsers.has": ("Bool", "IBool", "Has", "IHas"),
+        "easydata.parsers.list": ("List", "TextList", "UrlList", "EmailSearchList"),
+        "easydata.parsers.math": ("Count", "Avg", "AvgInt"),
+        "easydata.parsers.misc": (
+            "ConcatText",
+            "JoinList",
+            "MergeDict",
+            "ItemDict",
+            "ValueList",
+            "StringFormat",
+        ),
+        "easydata.parsers.number": (
+            "SFloat",
+            "SInt",
+            "Float",
+            "Int",
+            "FloatText",
+            "IntText",
+            "SearchFloat",
+            "SearchInt",
+            "SearchFloatText",
+            "SearchIntText",
+        ),
+        "easydata.parsers.price": ("PriceFloat", "PriceInt", "PriceText"),
+        "easydata.parsers.text": ("Text", "Str"),
+        "easydata.parsers.time": (
+            "DateTime",
+            "Date",
+            "Year",
+            "Time",
+            "DateTimeSearch",
+            "DateSearch",
+            "TimeSearch",
+            "YearSearch",
+            "SPDateTime",
+            "SPDate",
+        ),
+        "easydata.parsers.url": ("Url",),
+    },
+)
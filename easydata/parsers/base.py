@@ -1,13 +1,28 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional, Union
+from copy import copy
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
+from easydata.config.loader import ConfigLoader
 from easydata.data import DataBag
 from easydata.mixins import ConfigMixin
 from easydata.queries.base import QuerySearchBase
 from easydata.queries.jp import JMESPathSearch, JMESPathStrictSearch
 from easydata.utils import parse
+from easydata.utils.cache import LRUCache
 
 __all__ = (
     "Base",
@@ -38,28 +53,121 @@ def custom_process_value(
     return callback_or_parser(value, data)
 
 
+def _add_read_sources(values: Iterable[Any], sources: Set[str], seen: Set[int]) -> bool:
+    # Nested queries and parsers are found in attributes of a parser, e.g.
+    # contains_query of Has or parsers in query params. False is returned if
+    # sources can't be listed.
+    for value in values:
+        if id(value) in seen:
+            continue
+
+        seen.add(id(value))
+
+        if isinstance(value, (ConfigLoader, LRUCache)):
+            # Config and caches hold no queries
+            continue
+        elif isinstance(value, BaseData):
+            value_sources = value.read_sources()
+
+            if value_sources is None:
+                return False
+
+            sources |= value_sources
+        elif isinstance(value, Base) or callable(value):
+            # Other parsers like item groups and custom callbacks
+            return False
+        elif isinstance(value, QuerySearchBase):
+            if getattr(value, "_source", None):
+                sources.add(value._source)  # type: ignore
+
+            if not _add_read_sources(vars(value).values(), sources, seen):
+                return False
+        elif isinstance(value, dict):
+            if not _add_read_sources(
+                list(value.keys()) + list(value.values()), sources, seen
+            ):
+                return False
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            if not _add_read_sources(value, sources, seen):
+                return False
+
+    return True
+
+
+def _map_documents(
+    callback: Callable,
+    data_list: Sequence[Any],
+    errors: Optional[Dict[int, Exception]],
+    values: Optional[Sequence[Any]] = None,
+) -> List[Any]:
+    # Callback is called with a value and data of each document, or only with
+    # data. Exceptions are stored in errors by document index if it's passed.
+    args_list: Iterable[tuple] = (
+        ((data,) for data in data_list) if values is None else zip(values, data_list)
+    )
+
+    if errors is None:
+        return [callback(*args) for args in args_list]
+
+    results = []
+
+    for index, args in enumerate(args_list):
+        try:
+            results.append(callback(*args))
+        except Exception as error:
+            errors[index] = error
+
+            results.append(None)
+
+    return results
+
+
 def _get_item_value_from_data_bag(
     data: DataBag,
     query: str,
 ) -> Any:
 
-    if "<jp>" in query:
-        query, jp_query = tuple(query.split("<jp>"))
+    item_key, jp_search = _compile_item_value_query(query)
 
-        value = data.get(query)
+    value = data.get(item_key)
 
-        return JMESPathSearch(jp_query).get(value)
+    return jp_search.get(value) if jp_search else value
+
+
+@lru_cache(maxsize=1024)
+def _compile_item_value_query(query: str) -> Tuple[str, Optional[JMESPathSearch]]:
+    if "<jp>" in query:
+        item_key, jp_query = tuple(query.split("<jp>"))
+
+        return item_key, JMESPathSearch(jp_query)
     elif "<jps>" in query:
-        query, jp_query = tuple(query.split("<jps>"))
+        item_key, jp_query = tuple(query.split("<jps>"))
+
+        return item_key, JMESPathStrictSearch(jp_query)
+
+    return query, None
 
-        value = data.get(query)
 
-        return JMESPathStrictSearch(jp_query).get(value)
+_missing = object()
 
-    return data.get(query)
+# Only values of these types are cached, since other hashable values like lxml
+# elements are hashed by identity and would keep whole documents in memory
+_cacheable_value_types = (str, bytes, int, float, bool, type(None))
 
 
 class BaseData(Base, ABC):
+    # Parsers whose output also depends on data besides a raw value, e.g. on
+    # other queries or a current time, set this to False
+    cacheable = True
+
+    _value_cache: Optional[LRUCache] = None
+
+    @property
+    def dedupable(self) -> bool:
+        # Equal raw values of documents which are parsed together in a batch
+        # are parsed only once, if a parsed value depends only on a raw value
+        return self.cacheable
+
     def __init__(
         self,
         query: Optional[Union[QuerySearchBase, BaseData]] = None,
@@ -72,6 +180,8 @@ class BaseData(Base, ABC):
         empty_as_none: bool = False,
         debug: bool = False,
         debug_source: bool = False,
+        cache: bool = False,
+        cache_size: Optional[int] = None,
     ):
 
         if query and from_item:
@@ -88,6 +198,32 @@ class BaseData(Base, ABC):
         self._debug = debug
         self._debug_source = debug_source
 
+        if cache or cache_size:
+            self._value_cache = LRUCache(cache_size or 1024)
+
+    def init_config(
+        self,
+        config_obj: Union[dict, ConfigLoader],
+        override: bool = False,
+    ):
+
+        previous_config = self._config
+
+        super().init_config(config_obj, override=override)
+
+        # Cached values were parsed with a previous config
+        if self._value_cache is not None and self._config is not previous_config:
+            self._value_cache.clear()
+
+        return self
+
+    def cache_info(self) -> Optional[dict]:
+        return None if self._value_cache is None else self._value_cache.info()
+
+    def cache_clear(self) -> None:
+        if self._value_cache is not None:
+            self._value_cache.clear()
+
     def add_query(self, query: Union[QuerySearchBase, BaseData]):
         self._query = query
 
@@ -117,14 +253,144 @@ class BaseData(Base, ABC):
                 parent_data=parent_data,
             )
 
+        value = self._process_raw_value_of_data(value, data)
+
+        value = self._parse_value(value, data)
+
+        return self._process_parsed_value(value, data)
+
+    def parse_values(
+        self,
+        data_list: Sequence[Any],
+        errors: Optional[Dict[int, Exception]] = None,
+    ) -> List[Any]:
+        """Parses values of many documents at once, e.g. of a whole batch in
+        parse_columns. Returns values in the same order as documents. If errors
+        dict is passed, exceptions are stored under indexes of documents which
+        raised them, with None values, instead of being raised."""
+
+        # Parsers which customize parse method are parsed document by document
+        if type(self).parse is not BaseData.parse:
+            return _map_documents(self.parse, data_list, errors)
+
+        return self._parse_values(data_list, errors)
+
+    def parse_raw_values(
+        self,
+        values: List[Any],
+        data_list: Sequence[Any],
+    ) -> List[Any]:
+        """Parses raw values of many documents. Parsers can override it with a
+        batched implementation. Equal raw values are parsed only once."""
+
+        return self._parse_raw_values(values, data_list)
+
+    def _parse_raw_values(
+        self,
+        values: List[Any],
+        data_list: Sequence[Any],
+        errors: Optional[Dict[int, Exception]] = None,
+    ) -> List[Any]:
+
+        if not self.dedupable:
+            return _map_documents(self._parse_value, data_list, errors, values)
+
+        parsed_values: Dict[tuple, Any] = {}
+
+        def parse_value(value: Any, data: Any) -> Any:
+            if not isinstance(value, _cacheable_value_types):
+                return self._parse_value(value, data)
+
+            value_key = (type(value), value)
+
+            if value_key not in parsed_values:
+                parsed_values[value_key] = self._parse_value(value, data)
+
+                return parsed_values[value_key]
+
+            parsed_value = parsed_values[value_key]
+
+            # Containers are copied so that changes don't leak between items
+            if isinstance(parsed_value, (list, dict)):
+                return copy(parsed_value)
+
+            return parsed_value
+
+        return _map_documents(parse_value, data_list, errors, values)
+
+    def _parse_values(
+        self,
+        data_list: Sequence[Any],
+        errors: Optional[Dict[int, Exception]] = None,
+    ) -> List[Any]:
+
+        values = _map_documents(self._parse_raw_value_of_data, data_list, errors)
+
+        if errors is None:
+            values = self.parse_raw_values(values, data_list)
+
+            return [
+                self._process_parsed_value(value, data)
+                for value, data in zip(values, data_list)
+            ]
+
+        # Documents which raised an error are left out of next steps
+        indexes = [index for index in range(len(data_list)) if index not in errors]
+
+        batch_data_list = [data_list[index] for index in indexes]
+
+        batch_values = [values[index] for index in indexes]
+
+        batch_errors: Dict[int, Exception] = {}
+
+        if type(self).parse_raw_values is BaseData.parse_raw_values:
+            batch_values = self._parse_raw_values(
+                batch_values, batch_data_list, batch_errors
+            )
+        else:
+            # Custom batched implementations can't assign errors to documents
+            batch_values = self.parse_raw_values(batch_values, batch_data_list)
+
+        for batch_index, index in enumerate(indexes):
+            if batch_index in batch_errors:
+                errors[index] = batch_errors[batch_index]
+
+                values[index] = None
+
+                continue
+
+            try:
+                values[index] = self._process_parsed_value(
+                    batch_values[batch_index], data_list[index]
+                )
+            except Exception as error:
+                errors[index] = error
+
+                values[index] = None
+
+        return values
+
+    def _parse_raw_value_of_data(self, data: Any) -> Any:
+        if self._from_item and isinstance(data, DataBag):
+            value = _get_item_value_from_data_bag(
+                data=data,
+                query=self._from_item,
+            )
+        else:
+            value = self._parse_data_to_value(data=data, parent_data=data)
+
+        return self._process_raw_value_of_data(value, data)
+
+    def _process_raw_value_of_data(self, value: Any, data: Any) -> Any:
         if self._debug_source:  # Debug value before is parsed
             print(value)
 
         if self._process_raw_value:
             value = custom_process_value(self._process_raw_value, value, data)
 
-        value = self.parse_value(value, data)
+        return value
 
+    def _process_parsed_value(self, value: Any, data: Any) -> Any:
         if self._debug:  # Debug value after is parsed
             print(value)
 
@@ -141,6 +407,21 @@ class BaseData(Base, ABC):
     def source(self):
         return self._source or "main"
 
+    def read_sources(self) -> Optional[Set[str]]:
+        """Data sources from which a value is parsed, including sources of
+        all nested queries and parsers. None is returned if a value can also
+        depend on other item values or on custom callbacks."""
+
+        if self._from_item or self._default_from_item:
+            return None
+
+        sources = {self.source}
+
+        if not _add_read_sources(vars(self).values(), sources, {id(self)}):
+            return None
+
+        return sources
+
     def _parse_data_to_value(
         self,
         data: DataBag,
@@ -184,6 +465,37 @@ class BaseData(Base, ABC):
 
         return value  # no default value was specified
 
+    def _parse_value(
+        self,
+        value: Any,
+        data: Any,
+    ) -> Any:
+
+        value_cache = self._value_cache
+
+        if (
+            value_cache is None
+            or not self.cacheable
+            or not isinstance(value, _cacheable_value_types)
+        ):
+            return self.parse_value(value, data)
+
+        # Type is part of a key since 1, 1.0 and True are equal dict keys
+        cache_key = (type(value), value)
+
+        parsed_value = value_cache.get(cache_key, _missing)
+
+        if parsed_value is _missing:
+            parsed_value = self.parse_value(value, data)
+
+            value_cache.set(cache_key, parsed_value)
+
+        # Cached containers are copied so that changes don't leak between items
+        if isinstance(parsed_value, (list, dict)):
+            return copy(parsed_value)
+
+        return parsed_value
+
     @abstractmethod
     def parse_value(
         self,
@@ -1,10 +1,10 @@
 from abc import ABC
-from functools import cached_property
 from typing import Any, List, Optional
 
 from easytxt import text
 
 from easydata.data import DataBag
+from easydata.mixins import config_property
 from easydata.parsers.base import Base
 from easydata.parsers.has import Has
 from easydata.parsers.text import Text
@@ -55,7 +55,7 @@ class BaseLookups(Base, ABC):
 
         return lookup_values
 
-    @cached_property
+    @config_property
     def _initialized_lookups(self):
         initialized_lookups = []
 
@@ -114,15 +114,19 @@ class Choice(BaseLookups):
 
         lookup_value = " ".join(lookup_values)
 
-        for choice_data in self._choices:
-            choice_value, choice_search_data = choice_data
-
+        for choice_value, choice_search_data in self._initialized_choices:
             if isinstance(choice_search_data, Has):
-                choice_search_data.init_config(self.config)
-
                 if choice_search_data.parse(data=data):
                     return choice_value
             elif lookup_value and text.contains(lookup_value, choice_search_data):
                 return choice_value
 
         return None
+
+    @config_property
+    def _initialized_choices(self) -> list:
+        for _, choice_search_data in self._choices:
+            if isinstance(choice_search_data, Has):
+                choice_search_data.init_config(self.config)
+
+        return self._choices
@@ -1,5 +1,6 @@
 from typing import Any, Callable, Optional
 
+from easydata.mixins import config_property
 from easydata.parsers.base import Base
 from easydata.typing import Parser
 from easydata.utils import mix, parse
@@ -62,23 +63,23 @@ class WITH(OR):
         with_parent_data: bool = False,
     ) -> Any:
 
-        parsers = list(self.parsers)
+        first_parser, *parsers = self._initialized_parsers
 
-        value = (
-            parsers.pop(0)
-            .init_config(self.config)
-            .parse(
-                data=data,
-                parent_data=parent_data,
-                with_parent_data=with_parent_data,
-            )
+        value = first_parser.parse(
+            data=data,
+            parent_data=parent_data,
+            with_parent_data=with_parent_data,
         )
 
         for parser in parsers:
-            value = parser.init_config(self.config).parse(value)
+            value = parser.parse(value)
 
         return value
 
+    @config_property
+    def _initialized_parsers(self) -> tuple:
+        return tuple(parser.init_config(self.config) for parser in self.parsers)
+
 
 class SWITCH(Base):
     def __init__(
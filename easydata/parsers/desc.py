@@ -1,8 +1,11 @@
 from abc import ABC
+from functools import cached_property
 from typing import Any, List, Optional, Union
 
 from easytxt import parse_text
 
+from easydata.data import DataBag
+from easydata.mixins import config_property
 from easydata.parsers.base import BaseData
 
 __all__ = (
@@ -92,43 +95,70 @@ class BaseDescription(BaseData, ABC):
             **kwargs,
         )
 
-    @property
+    @config_property
     def _language(self):
         return self.__language or self.config.get("ED_LANGUAGE", "en")
 
-    def _get_text_parser(self, text=Any):
+    @cached_property
+    def _text_parser_options(self) -> dict:
+        return {
+            "from_allow": self._from_allow,
+            "from_callow": self._from_callow,
+            "to_allow": self._to_allow,
+            "to_callow": self._to_callow,
+            "deny": self._deny,
+            "cdeny": self._cdeny,
+            "normalize": self._normalize,
+            "capitalize": self._capitalize,
+            "title": self._title,
+            "uppercase": self._uppercase,
+            "lowercase": self._lowercase,
+            "min_chars": self._min_chars,
+            "replace_keys": self._replace_keys,
+            "remove_keys": self._remove_keys,
+            "replace_keys_raw_text": self._replace_keys_raw_text,
+            "remove_keys_raw_text": self._remove_keys_raw_text,
+            "split_inline_breaks": self._split_inline_breaks,
+            "inline_breaks": self._inline_breaks,
+            "merge_sentences": self._merge_sentences,
+            "stop_key": self._stop_key,
+            "stop_keys_split": self._stop_keys_split,
+            "stop_keys_ignore": self._stop_keys_ignore,
+            "sentence_separator": self._sentence_separator,
+            "feature_split_keys": self._feature_split_keys,
+            "text_num_to_numeric": self._text_num_to_numeric,
+            "autodetect_html": self._autodetect_html,
+            "html_text_to_sentences": self._html_text_to_sentences,
+            "css_query": self._css_query,
+            "exclude_css": self._exclude_css,
+        }
+
+    @cached_property
+    def _text_parser_options_key(self) -> tuple:
+        return _freeze(tuple(self._text_parser_options.items()))
+
+    def _get_text_parser(self, text: Any, data: Any = None):
+        if not isinstance(data, DataBag):
+            return self._parse_text(text)
+
+        # Strings are equal by value, while other values like PyQuery objects
+        # are shared between parsers only through the query memo
+        text_key = text if isinstance(text, str) else id(text)
+
+        memo_key = (
+            "description",
+            text_key,
+            self._language,
+            self._text_parser_options_key,
+        )
+
+        return data.memoize(memo_key, lambda: self._parse_text(text), pin=text)
+
+    def _parse_text(self, text: Any):
         return parse_text(
             text=text,
             language=self._language,
-            from_allow=self._from_allow,
-            from_callow=self._from_callow,
-            to_allow=self._to_allow,
-            to_callow=self._to_callow,
-            deny=self._deny,
-            cdeny=self._cdeny,
-            normalize=self._normalize,
-            capitalize=self._capitalize,
-            title=self._title,
-            uppercase=self._uppercase,
-            lowercase=self._lowercase,
-            min_chars=self._min_chars,
-            replace_keys=self._replace_keys,
-            remove_keys=self._remove_keys,
-            replace_keys_raw_text=self._replace_keys_raw_text,
-            remove_keys_raw_text=self._remove_keys_raw_text,
-            split_inline_breaks=self._split_inline_breaks,
-            inline_breaks=self._inline_breaks,
-            merge_sentences=self._merge_sentences,
-            stop_key=self._stop_key,
-            stop_keys_split=self._stop_keys_split,
-            stop_keys_ignore=self._stop_keys_ignore,
-            sentence_separator=self._sentence_separator,
-            feature_split_keys=self._feature_split_keys,
-            text_num_to_numeric=self._text_num_to_numeric,
-            autodetect_html=self._autodetect_html,
-            html_text_to_sentences=self._html_text_to_sentences,
-            css_query=self._css_query,
-            exclude_css=self._exclude_css,
+            **self._text_parser_options,
         )
 
 
@@ -141,7 +171,7 @@ class Description(BaseDescription):
         if not value:
             return None
 
-        return self._get_text_parser(value).text or None
+        return self._get_text_parser(value, data).text or None
 
 
 class Sentences(BaseDescription):
@@ -153,7 +183,8 @@ class Sentences(BaseDescription):
         if not value:
             return None
 
-        return self._get_text_parser(value).sentences
+        # Sentences are cached in a shared text parser
+        return list(self._get_text_parser(value, data).sentences)
 
 
 class Features(BaseDescription):
@@ -165,7 +196,7 @@ class Features(BaseDescription):
         if not value:
             return None
 
-        return self._get_text_parser(value).features
+        return self._get_text_parser(value, data).features
 
 
 class FeaturesDict(BaseDescription):
@@ -177,7 +208,7 @@ class FeaturesDict(BaseDescription):
         if not value:
             return None
 
-        return self._get_text_parser(value).features_dict
+        return self._get_text_parser(value, data).features_dict
 
 
 class Feature(BaseDescription):
@@ -204,9 +235,16 @@ class Feature(BaseDescription):
         if not value:
             return None
 
-        text_parser = self._get_text_parser(value)
+        text_parser = self._get_text_parser(value, data)
 
         if self._key_exact:
             return text_parser.feature_exact(self._key_exact)
 
         return text_parser.feature(self._key)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+
+    return value
@@ -23,6 +23,9 @@ __all__ = (
 
 
 class Dict(BaseData):
+    # Keys and values of a dict are parsed by other parsers from a whole data
+    cacheable = False
+
     def __init__(
         self,
         query: Optional[QuerySearchBase] = None,
@@ -33,6 +33,10 @@ class DropContains(Text):
             **kwargs,
         )
 
+    @property
+    def cacheable(self):
+        return self._contains_query is None
+
     def _exception(self, msg: str):
         return self.config["ED_DROP_ITEM_EXCEPTION"](msg)
 
@@ -60,6 +60,10 @@ class Has(Text):
             **kwargs,
         )
 
+    @property
+    def cacheable(self):
+        return self._contains_query is None
+
     def parse_value(
         self,
         value: Any,
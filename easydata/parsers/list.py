@@ -21,6 +21,9 @@ __all__ = (
 
 
 class List(BaseData):
+    # Values of a list are parsed by other parsers from a whole data
+    cacheable = False
+
     def __init__(
         self,
         query: Optional[QuerySearchBase] = None,
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Any, Optional
 
+from easydata.mixins import config_property
 from easydata.parsers.base import BaseData
 from easydata.parsers.price import BaseNum, BasePriceFloat
 from easydata.utils import mix
@@ -49,15 +50,15 @@ class NumToIntMixin(_NumToStrMixin):
 
 
 class DefaultNumConfigMixin:
-    @property
+    @config_property
     def _decimals_config(self):
         return self.config.get("ED_NUMBER_DECIMALS")
 
-    @property
+    @config_property
     def _min_value_config(self):
         return self.config.get("ED_NUMBER_MIN_VALUE")
 
-    @property
+    @config_property
     def _max_value_config(self):
         return self.config.get("ED_NUMBER_MAX_VALUE")
 
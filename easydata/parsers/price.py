@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Optional, Union
 
+from easydata.mixins import config_property
 from easydata.parsers.text import Str
 from easydata.utils import price
 
@@ -35,7 +36,7 @@ class BaseNum(Str, ABC):
             **kwargs,
         )
 
-    @property
+    @config_property
     def _decimals(self):
         if isinstance(self.__decimals, int):
             return self.__decimals
@@ -44,23 +45,23 @@ class BaseNum(Str, ABC):
 
         return decimals if isinstance(decimals, int) else None
 
-    @property
+    @config_property
     def _min_value(self):
         return self.__min_value or self._min_value_config
 
-    @property
+    @config_property
     def _max_value(self):
         return self.__max_value or self._max_value_config
 
-    @property
+    @config_property
     def _decimals_config(self):
         return None
 
-    @property
+    @config_property
     def _min_value_config(self):
         return None
 
-    @property
+    @config_property
     def _max_value_config(self):
         return None
 
@@ -121,15 +122,15 @@ class BasePriceFloat(BaseNum, ABC):
 
 
 class PriceFloat(BasePriceFloat):
-    @property
+    @config_property
     def _decimals_config(self) -> Optional[int]:
         return self.config.get("ED_PRICE_DECIMALS")
 
-    @property
+    @config_property
     def _min_value_config(self) -> Optional[int]:
         return self.config.get("ED_PRICE_MIN_VALUE")
 
-    @property
+    @config_property
     def _max_value_config(self) -> Optional[int]:
         return self.config.get("ED_PRICE_MAX_VALUE")
 
@@ -1,9 +1,11 @@
 from typing import Any, List, Optional, Union
 
-from easytxt import parse_string, text
-from pyquery import PyQuery
-
+from easydata.mixins import config_property
 from easydata.parsers.base import BaseData
+from easydata.utils import mix
+from easydata.utils.imports import lazy_import
+
+easytxt = lazy_import("easytxt")
 
 __all__ = (
     "Text",
@@ -65,7 +67,7 @@ class Text(BaseData):
             **kwargs,
         )
 
-    @property
+    @config_property
     def _language(self):
         return self.__language or self.config["ED_LANGUAGE"]
 
@@ -80,8 +82,8 @@ class Text(BaseData):
             data=data,
         )
 
-        if not isinstance(value, PyQuery) and isinstance(value, (list, tuple)):
-            value = [text.to_str(v) for v in value if v is not None]
+        if not mix.is_pyquery(value) and isinstance(value, (list, tuple)):
+            value = [easytxt.text.to_str(v) for v in value if v is not None]
 
             if not value:
                 return None
@@ -97,7 +99,7 @@ class Text(BaseData):
         if isinstance(value, str) and self._strip:
             value = value.strip()
 
-        value = parse_string(
+        value = easytxt.parse_string(
             raw_text=value,
             normalize=self._normalize,
             title=self._title,
@@ -1,12 +1,23 @@
+import re
+import time
 from abc import abstractmethod
 from datetime import datetime
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, List, Optional
-
-from dateparser import parse as parse_date
-from dateparser.search import search_dates
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Sequence
 
+from easydata.mixins import config_property
+from easydata.parsers.base import _map_documents
 from easydata.parsers.text import Text
+from easydata.utils.cache import LRUCache
+from easydata.utils.imports import lazy_import
+
+if TYPE_CHECKING:
+    from dateparser.date import DateDataParser
+
+# Dateparser takes long to import, so it's imported on a first parsed date
+dateparser_date = lazy_import("dateparser.date")
+
+dateparser_search = lazy_import("dateparser.search")
 
 __all__ = (
     "DateTime",
@@ -21,8 +32,23 @@ __all__ = (
     "SPDate",
 )
 
+_iso_datetime_re = re.compile(
+    r"\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d{1,6})?)?)?",
+)
+
+_date_data_parsers = LRUCache(maxsize=128)
+
+# Parsed datetime objects by raw value and parser options
+_datetime_objs = LRUCache(maxsize=4096)
+
 
 class BaseDateTime(Text):
+    # Relative dates like "yesterday" depend on a current time, which is the
+    # same for all documents of a batch
+    cacheable = False
+
+    dedupable = True
+
     def __init__(
         self,
         *args,
@@ -44,7 +70,7 @@ class BaseDateTime(Text):
             **kwargs,
         )
 
-    @property
+    @config_property
     def _datetime_format(self):
         return self.__datetime_format or self.config["ED_DATETIME_FORMAT"]
 
@@ -62,6 +88,17 @@ class BaseDateTime(Text):
 
         return super().parse(data, parent_data, with_parent_data)
 
+    def parse_values(
+        self,
+        data_list: Sequence[Any],
+        errors: Optional[Dict[int, Exception]] = None,
+    ) -> List[Any]:
+
+        if self._today:
+            return _map_documents(self.parse, data_list, errors)
+
+        return self._parse_values(data_list, errors)
+
     def parse_value(
         self,
         value: Any,
@@ -228,7 +265,11 @@ class DateTime(BaseDateTime):
 
         return settings or None
 
-    @property
+    @cached_property
+    def _settings_key(self) -> Hashable:
+        return repr(sorted(self._settings.items())) if self._settings else None
+
+    @config_property
     def _languages(self):
         if self.__language:
             return [self.__language]
@@ -238,35 +279,87 @@ class DateTime(BaseDateTime):
 
         return [self.config["ED_LANGUAGE"]]
 
-    @property
+    @config_property
     def _locales(self):
         return self.__locales or self.config["ED_DATETIME_LOCALES"]
 
-    @property
+    @config_property
     def _region(self):
         return self.__region or self.config["ED_DATETIME_REGION"]
 
-    @property
+    @config_property
     def _date_formats(self):
         return self.__date_formats or self.config["ED_DATETIME_FORMATS"]
 
     def _get_datetime_obj_from_value(self, value: str) -> Optional[datetime]:
+        languages = self._languages
+        date_formats = self._date_formats
+
+        if not self.search and not self._settings:
+            datetime_obj = _parse_datetime_fast(value, date_formats, languages)
+
+            if datetime_obj:
+                return datetime_obj
+
+        # Relative dates like "2 days ago" depend on a current time, so memoized
+        # values are reused only within a minute, unless relative base is set.
+        time_key = None if self._relative_base else int(time.time() // 60)
+
+        memo_key = (
+            value,
+            self.search,
+            tuple(languages),
+            tuple(self._locales or ()),
+            self._region,
+            tuple(date_formats or ()),
+            self._settings_key,
+            time_key,
+        )
+
+        return _datetime_objs.get_or_set(
+            memo_key,
+            lambda: self._parse_datetime_obj(value, languages, date_formats),
+        )
+
+    def _parse_datetime_obj(
+        self,
+        value: str,
+        languages: List[str],
+        date_formats: Optional[List[str]],
+    ) -> Optional[datetime]:
+
         if self.search:
-            matches = search_dates(
+            matches = dateparser_search.search_dates(
                 text=value,
-                languages=self._languages,
+                languages=languages,
                 settings=self._settings,
             )
 
             return matches[0][-1] if matches else None
 
-        return parse_date(
-            date_string=value,
-            date_formats=self._date_formats,
-            languages=self._languages,
-            locales=self._locales,
-            region=self._region,
-            settings=self._settings,  # type: ignore
+        date_data = self._date_data_parser.get_date_data(value, date_formats)
+
+        return date_data["date_obj"] if date_data else None
+
+    @property
+    def _date_data_parser(self) -> "DateDataParser":
+        locales = self._locales
+
+        parser_key = (
+            tuple(self._languages),
+            tuple(locales or ()),
+            self._region,
+            self._settings_key,
+        )
+
+        return _date_data_parsers.get_or_set(
+            parser_key,
+            lambda: dateparser_date.DateDataParser(
+                languages=self._languages,
+                locales=locales,
+                region=self._region,
+                settings=self._settings,
+            ),
         )
 
 
@@ -285,7 +378,7 @@ class Date(DateTime):
             **kwargs,
         )
 
-    @property
+    @config_property
     def _date_format(self):
         return self.__date_format or self.config["ED_DATE_FORMAT"]
 
@@ -308,7 +401,7 @@ class Time(DateTime):
             **kwargs,
         )
 
-    @property
+    @config_property
     def _time_format(self):
         return self.__time_format or self.config["ED_TIME_FORMAT"]
 
@@ -352,7 +445,7 @@ class SPDateTime(BaseDateTime):
             **kwargs,
         )
 
-    @property
+    @config_property
     def _sp_datetime_format(self):
         return self.__sp_datetime_format or self.config["ED_SP_DATETIME_FORMAT"]
 
@@ -377,16 +470,64 @@ class SPDate(SPDateTime):
             **kwargs,
         )
 
-    @property
+    @config_property
     def _date_format(self):
         return self.__date_format or self.config["ED_DATE_FORMAT"]
 
     def _parse_datetime_obj_to_str(self, datetime_obj: datetime) -> str:
         return datetime_obj.strftime(self._date_format)
 
-    @property
+    @config_property
     def _sp_date_format(self):
         return self.__sp_date_format or self.config["ED_SP_DATE_FORMAT"]
 
     def _get_datetime_obj_from_value(self, value: str) -> Optional[datetime]:
         return datetime.strptime(value, self._sp_date_format)
+
+
+def _parse_datetime_fast(
+    value: str,
+    date_formats: Optional[List[str]],
+    languages: List[str],
+) -> Optional[datetime]:
+    """Parses values which dateparser would parse to the same datetime object
+    with default settings, without going through dateparser."""
+
+    if date_formats:
+        for date_format in date_formats:
+            if not _is_fast_date_format(date_format, languages):
+                continue
+
+            try:
+                return datetime.strptime(value, date_format)
+            except ValueError:
+                continue
+
+        return None
+
+    if _iso_datetime_re.fullmatch(value):
+        # Invalid dates like 2021-02-30 are left to dateparser
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    return None
+
+
+def _is_fast_date_format(date_format: str, languages: List[str]) -> bool:
+    # Formats with missing date parts or timezone are completed or converted
+    # by dateparser and names of months and days are translated.
+    if "%Y" not in date_format or "%d" not in date_format:
+        return False
+
+    if "%m" not in date_format and "%b" not in date_format and "%B" not in date_format:
+        return False
+
+    if "%y" in date_format or "%z" in date_format or "%Z" in date_format:
+        return False
+
+    if languages != ["en"] and any(d in date_format for d in ("%a", "%A", "%b", "%B")):
+        return False
+
+    return True
@@ -1,5 +1,6 @@
 from typing import Any, Optional, Union
 
+from easydata.mixins import config_property
 from easydata.parsers.text import Text
 from easydata.utils import url
 
@@ -37,11 +38,11 @@ class Url(Text):
             **kwargs,
         )
 
-    @property
+    @config_property
     def _domain(self):
         return self.__domain or self.config.get("ED_URL_DOMAIN")
 
-    @property
+    @config_property
     def _protocol(self):
         return self.__protocol or self.config.get("ED_URL_PROTOCOL")
 
@@ -1,2 +1,39 @@
-from easydata.processors.data import *  # noqa: F401 F403
-from easydata.processors.item import *  # noqa: F401 F403
+from typing import TYPE_CHECKING
+
+from easydata.utils.imports import lazy_module
+
+if TYPE_CHECKING:
+    from easydata.processors.data import *  # noqa: F401 F403
+    from easydata.processors.item import *  # noqa: F401 F403
+
+__all__ = lazy_module(
+    __name__,
+    {
+        "easydata.processors.data": (
+            "DataProcessor",
+            "DataBaseProcessor",
+            "DataToPqProcessor",
+            "DataJsonToDictProcessor",
+            "DataJsonFromQueryToDictProcessor",
+            "DataFromIterQueryProcessor",
+            "DataYamlToDictProcessor",
+            "DataXmlToDictProcessor",
+            "DataXmlStreamProcessor",
+            "DataJsonStreamProcessor",
+            "DataJsonLinesProcessor",
+            "DataTextFromReProcessor",
+            "DataJsonFromReToDictProcessor",
+            "DataFromQueryProcessor",
+            "DataVariantsProcessor",
+        ),
+        "easydata.processors.item": (
+            "ItemBaseProcessor",
+            "ItemKeysMergeIntoListProcessor",
+            "ItemKeysMergeProcessor",
+            "ItemKeysMergeIntoDictProcessor",
+            "ItemValueToStrProcessor",
+            "ItemRemoveKeysProcessor",
+            "ItemDiscountProcessor",
+        ),
+    },
+)
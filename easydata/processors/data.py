@@ -1,21 +1,32 @@
-import json
 from abc import ABC, abstractmethod
 from functools import cached_property
-from typing import Any, Dict, Iterator, List, Optional
-
-import xmltodict
-import yaml
-from easytxt.text import replace_chars_by_keys
-from pyquery import PyQuery
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from easydata.data import DataBag
+from easydata.mixins import config_property
 from easydata.parsers.base import BaseData
 from easydata.parsers.data import Data
 from easydata.processors.base import BaseProcessor
 from easydata.queries.base import QuerySearchBase
 from easydata.queries.re import ReSearch
 from easydata.typing import QueryDataParser
-from easydata.utils import parse
+from easydata.utils import codec, parse, stream
+from easydata.utils.imports import lazy_import
+
+if TYPE_CHECKING:
+    from lxml import etree
+    from pyquery import PyQuery
+else:
+    etree = lazy_import("lxml.etree")
+
+easytxt_text = lazy_import("easytxt.text")
+
+pyquery = lazy_import("pyquery")
+
+xmltodict = lazy_import("xmltodict")
+
+yaml = lazy_import("yaml")
 
 __all__ = (
     "DataProcessor",
@@ -26,6 +37,9 @@ __all__ = (
     "DataFromIterQueryProcessor",
     "DataYamlToDictProcessor",
     "DataXmlToDictProcessor",
+    "DataXmlStreamProcessor",
+    "DataJsonStreamProcessor",
+    "DataJsonLinesProcessor",
     "DataTextFromReProcessor",
     "DataJsonFromReToDictProcessor",
     "DataFromQueryProcessor",
@@ -67,7 +81,8 @@ class DataBaseProcessor(BaseProcessor, ABC):
 
         if self._multi:
             for iter_transformed_data in transformed_data:
-                data_copy = data.copy()
+                # Memos of each document are released together with its copy
+                data_copy = data.copy(new_document=True)
 
                 yield self._transformed_data_to_data(iter_transformed_data, data_copy)
         else:
@@ -105,13 +120,13 @@ class DataProcessor(DataBaseProcessor):
 
 
 class DataToPqProcessor(DataBaseProcessor):
-    def process_data(self, source_data: str) -> PyQuery:
-        return PyQuery(source_data)
+    def process_data(self, source_data: str) -> "PyQuery":
+        return pyquery.PyQuery(source_data)
 
 
 class DataJsonToDictProcessor(DataBaseProcessor):
     def process_data(self, source_data: str) -> dict:
-        return json.loads(source_data)
+        return codec.loads(source_data)
 
 
 class DataYamlToDictProcessor(DataBaseProcessor):
@@ -172,18 +187,21 @@ class DataXmlToDictProcessor(DataBaseProcessor):
 
         super().__init__(*args, **kwargs)
 
-    @property
+    @config_property
     def _item_depth(self):
         config_key = "ED_DATA_XML_TO_DICT_ITEM_DEPTH"
         return self.__item_depth or self.config[config_key]
 
     def process_data(self, data: Any) -> Any:
+        return self._xml_to_dict(data, item_depth=self._item_depth)
+
+    def _xml_to_dict(self, data: Any, item_depth: int = 0) -> Any:
         return xmltodict.parse(
             xml_input=data,
             encoding=self._encoding,
             process_namespaces=self._process_namespaces,
             namespace_separator=self._namespace_separator,
-            item_depth=self._item_depth,
+            item_depth=item_depth,
             strip_whitespace=self._strip_whitespace,
             attr_prefix=self._attr_prefix,
             cdata_key=self._cdata_key,
@@ -194,6 +212,153 @@ class DataXmlToDictProcessor(DataBaseProcessor):
         )
 
 
+class DataXmlStreamProcessor(DataXmlToDictProcessor):
+    """Iterates over record elements of a XML file or file object without
+    loading it whole into memory. Each record is yielded in its own data bag,
+    either converted to a dict or as a detached lxml element."""
+
+    _multi = True
+
+    def __init__(
+        self,
+        *args,
+        tag: Optional[Union[str, List[str]]] = None,
+        to_dict: bool = True,
+        **kwargs,
+    ):
+
+        self._tag = tag
+        self._to_dict = to_dict
+
+        super().__init__(*args, **kwargs)
+
+    def process_data(self, data: Any) -> Iterator[Any]:
+        for element in self._iter_elements(data):
+            if self._to_dict:
+                xml_dict = self._xml_to_dict(etree.tostring(element))
+
+                element.clear()
+
+                yield xml_dict
+            else:
+                yield element
+
+    def _iter_elements(self, data: Any) -> Iterator["etree._Element"]:
+        if isinstance(data, str) and data.lstrip().startswith("<"):
+            data = data.encode(self._encoding or "utf-8")
+
+        if isinstance(data, bytes):
+            data = BytesIO(data)
+
+        # Feeds from suppliers are untrusted, so entities and network are disabled
+        iterparse_kwargs = {"resolve_entities": False, "no_network": True}
+
+        if self._tag:
+            events = etree.iterparse(
+                data,
+                events=("end",),
+                tag=self._tag,
+                **iterparse_kwargs,
+            )
+        else:
+            # Without a tag, records are child elements of a root element
+            events = etree.iterparse(data, events=("start", "end"), **iterparse_kwargs)
+
+        depth = 0
+
+        for event, element in events:
+            if not self._tag:
+                depth += 1 if event == "start" else -1
+
+                if event == "start" or depth != 1:
+                    continue
+
+            # Processed records and elements before them, including those which
+            # don't match a tag, are removed from a tree, so that memory usage
+            # doesn't grow with a size of a file
+            for ancestor in element.iterancestors():
+                while (
+                    ancestor.getprevious() is not None
+                    and ancestor.getparent() is not None
+                ):
+                    del ancestor.getparent()[0]
+
+            parent = element.getparent()
+
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+                parent.remove(element)
+
+            yield element
+
+
+class DataJsonStreamProcessor(DataBaseProcessor):
+    """Iterates over json values under a prefix, e.g. data.products.item, of a
+    json string, bytes, file path or file object without decoding whole json
+    data. Each value is yielded in its own data bag."""
+
+    _multi = True
+
+    def __init__(
+        self,
+        *args,
+        prefix: str = "item",
+        chunk_size: int = 65536,
+        encoding: str = "utf-8",
+        **kwargs,
+    ):
+
+        self._prefix = prefix
+        self._chunk_size = chunk_size
+        self._encoding = encoding
+
+        super().__init__(*args, **kwargs)
+
+    def process_data(self, data: Any) -> Iterator[Any]:
+        return stream.iter_json_items(
+            data,
+            prefix=self._prefix,
+            chunk_size=self._chunk_size,
+            encoding=self._encoding,
+        )
+
+
+class DataJsonLinesProcessor(DataBaseProcessor):
+    """Iterates over records of a json lines file. Each record is yielded in its
+    own data bag together with its byte offset and byte offset of a next record,
+    which can be used to resume processing."""
+
+    _multi = True
+
+    def __init__(
+        self,
+        *args,
+        offset: int = 0,
+        **kwargs,
+    ):
+
+        self._offset = offset
+
+        super().__init__(*args, **kwargs)
+
+    def process_data(self, data: Any) -> Iterator[Tuple[int, int, Any]]:
+        return stream.iter_json_lines(data, offset=self._offset)
+
+    def _transformed_data_to_data(self, transformed_data, data):
+        offset, next_offset, value = transformed_data
+
+        data = super()._transformed_data_to_data(value, data)
+
+        new_source = self._new_source or self._source
+
+        data["{}_offset".format(new_source)] = offset
+        data["{}_next_offset".format(new_source)] = next_offset
+
+        return data
+
+
 class DataFromQueryProcessor(DataBaseProcessor):
     def __init__(
         self,
@@ -220,7 +385,7 @@ class DataJsonFromQueryToDictProcessor(DataFromQueryProcessor):
     def process_data(self, data: Any) -> Any:
         jt = super().process_data(data)
 
-        return json.loads(jt)
+        return codec.loads(jt)
 
 
 class DataTextFromReProcessor(DataBaseProcessor):
@@ -269,7 +434,7 @@ class DataTextFromReProcessor(DataBaseProcessor):
                 value = self._process_value(value)
 
         if value and self._replace_keys:
-            value = replace_chars_by_keys(value, self._replace_keys)
+            value = easytxt_text.replace_chars_by_keys(value, self._replace_keys)
 
         return value
 
@@ -282,9 +447,9 @@ class DataJsonFromReToDictProcessor(DataTextFromReProcessor):
             return None
 
         if isinstance(value, list):
-            return [json.loads(v) for v in value]
+            return [codec.loads(v) for v in value]
 
-        return json.loads(value)
+        return codec.loads(value)
 
 
 class DataVariantsProcessor(DataBaseProcessor):
@@ -295,6 +460,8 @@ class DataVariantsProcessor(DataBaseProcessor):
         parser: Optional[BaseData] = None,
         key_parser: Optional[BaseData] = None,
         key_query: Optional[QuerySearchBase] = None,
+        invariant_keys: Optional[List[str]] = None,
+        detect_invariant_keys: bool = False,
         **kwargs,
     ):
 
@@ -307,6 +474,8 @@ class DataVariantsProcessor(DataBaseProcessor):
         self._query = query
         self._key_parser = key_parser
         self._key_query = key_query
+        self._invariant_keys = invariant_keys or []
+        self._detect_invariant_keys = detect_invariant_keys
 
         self.__parser = parser
 
@@ -319,8 +488,25 @@ class DataVariantsProcessor(DataBaseProcessor):
         variants_source = self._new_source or self._source
 
         for iter_data in super(DataVariantsProcessor, self).parse(data):
-            for var_iter_data in parse.variants_data(iter_data, variants_source):
-                yield var_iter_data
+            invariant_keys = self._get_invariant_keys(iter_data, variants_source)
+
+            yield from parse.variants_data(iter_data, variants_source, invariant_keys)
+
+    def _get_invariant_keys(self, data: DataBag, variants_source: str) -> List[str]:
+        model_manager = data._model_manager
+
+        # Item values can be shared only by data bags of a model
+        if not model_manager:
+            return []
+
+        if not self._detect_invariant_keys:
+            return self._invariant_keys
+
+        detected_keys = model_manager.variant_invariant_item_keys(variants_source)
+
+        return self._invariant_keys + [
+            k for k in detected_keys if k not in self._invariant_keys
+        ]
 
     @cached_property
     def _parser(self) -> Optional[BaseData]:
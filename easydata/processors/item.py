@@ -1,6 +1,7 @@
 from abc import ABC
 from typing import List, Optional, Union
 
+from easydata.mixins import config_property
 from easydata.processors.base import BaseProcessor
 from easydata.utils import price, validate
 
@@ -16,7 +17,12 @@ __all__ = (
 
 
 class ItemBaseProcessor(BaseProcessor, ABC):
-    pass
+    @property
+    def required_item_keys(self) -> Optional[List[str]]:
+        """Item keys that processor reads. None means that all item keys
+        are required."""
+
+        return None
 
 
 class ItemKeysMergeIntoListProcessor(ItemBaseProcessor):
@@ -33,6 +39,10 @@ class ItemKeysMergeIntoListProcessor(ItemBaseProcessor):
         self._preserve_original = preserve_original
         self._ignore_none = ignore_none
 
+    @property
+    def required_item_keys(self) -> Optional[List[str]]:
+        return self._item_keys
+
     def parse(self, item: dict) -> dict:
         new_item_value_list = [v for f, v in self._get_item_values(item)]
 
@@ -105,6 +115,10 @@ class ItemValueToStrProcessor(ItemBaseProcessor):
         self._item_keys = item_keys
         self._none_as_empty_string = none_as_empty_string
 
+    @property
+    def required_item_keys(self) -> Optional[List[str]]:
+        return self._item_keys
+
     def parse(self, item: dict) -> dict:
         for item_key in self._item_keys:
             value = item[item_key]
@@ -125,6 +139,10 @@ class ItemRemoveKeysProcessor(ItemBaseProcessor):
 
         self._item_keys = item_keys
 
+    @property
+    def required_item_keys(self) -> Optional[List[str]]:
+        return self._item_keys
+
     def parse(self, item: dict) -> dict:
         for item_key in self._item_keys:
             del item[item_key]
@@ -150,36 +168,40 @@ class ItemDiscountProcessor(ItemBaseProcessor):
         self.__no_decimals = no_decimals
         self.__remove_item_sale_price_key = remove_item_sale_price_key
 
-    @property
+    @config_property
     def _item_price_key(self):
         config_key = "ED_ITEM_DISCOUNT_ITEM_PRICE_KEY"
         return self.__item_price_key or self.config[config_key]
 
-    @property
+    @config_property
     def _item_sale_price_key(self):
         config_key = "ED_ITEM_DISCOUNT_ITEM_SALE_PRICE_KEY"
         return self.__item_sale_price_key or self.config[config_key]
 
-    @property
+    @config_property
     def _item_discount_key(self):
         config_key = "ED_ITEM_DISCOUNT_ITEM_DISCOUNT_KEY"
         return self.__item_discount_key or self.config[config_key]
 
-    @property
+    @config_property
     def _decimals(self):
         config_key = "ED_ITEM_DISCOUNT_DECIMALS"
         return self.__decimals or self.config[config_key]
 
-    @property
+    @config_property
     def _no_decimals(self):
         config_key = "ED_ITEM_DISCOUNT_NO_DECIMALS"
         return self.__no_decimals or self.config[config_key]
 
-    @property
+    @config_property
     def _remove_item_sale_price_key(self):
         config_key = "ED_ITEM_DISCOUNT_REMOVE_ITEM_SALE_PRICE_KEY"
         return self.__remove_item_sale_price_key or self.config[config_key]
 
+    @property
+    def required_item_keys(self) -> Optional[List[str]]:
+        return [self._item_price_key, self._item_sale_price_key]
+
     def parse(self, item: dict) -> dict:
         item_price = self._get_float_price_value_from_item_by_key(
             item=item,
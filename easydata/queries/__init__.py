@@ -1,23 +1,80 @@
-from easydata.queries.clause import OrClause, WithClause
-from easydata.queries.jp import JMESPathSearch, JMESPathStrictSearch
-from easydata.queries.key import KeySearch, KeyStrictSearch, NKeySearch, NKeyStrictSearch
-from easydata.queries.pq import PyQuerySearch, PyQueryStrictSearch
-from easydata.queries.re import ReSearch, ReStrictSearch
+from typing import TYPE_CHECKING
 
-cwith = WithClause
-cor = OrClause
+from easydata.utils.imports import lazy_module
 
-jp = JMESPathSearch
-jp_strict = JMESPathStrictSearch
+if TYPE_CHECKING:
+    from easydata.queries.clause import OrClause, WithClause
+    from easydata.queries.jp import JMESPathSearch, JMESPathStrictSearch
+    from easydata.queries.key import (
+        KeySearch,
+        KeyStrictSearch,
+        NKeySearch,
+        NKeyStrictSearch,
+    )
+    from easydata.queries.lx import (
+        CssSearch,
+        CssStrictSearch,
+        XPathSearch,
+        XPathStrictSearch,
+    )
+    from easydata.queries.pq import PyQuerySearch, PyQueryStrictSearch
+    from easydata.queries.re import ReSearch, ReStrictSearch
 
-key = KeySearch
-key_strict = KeyStrictSearch
+    cwith = WithClause
+    cor = OrClause
+    css = CssSearch
+    css_strict = CssStrictSearch
+    jp = JMESPathSearch
+    jp_strict = JMESPathStrictSearch
+    key = KeySearch
+    key_strict = KeyStrictSearch
+    nkey = NKeySearch
+    nkey_strict = NKeyStrictSearch
+    pq = PyQuerySearch
+    pq_strict = PyQueryStrictSearch
+    re = ReSearch
+    re_strict = ReStrictSearch
+    xpath = XPathSearch
+    xpath_strict = XPathStrictSearch
 
-nkey = NKeySearch
-nkey_strict = NKeyStrictSearch
-
-pq = PyQuerySearch
-pq_strict = PyQueryStrictSearch
-
-re = ReSearch
-re_strict = ReStrictSearch
+# Shortcuts like pq have the same name as their submodule, but they still
+# refer to a search class after the submodule is imported
+__all__ = lazy_module(
+    __name__,
+    {
+        "easydata.queries.clause": ("OrClause", "WithClause"),
+        "easydata.queries.jp": ("JMESPathSearch", "JMESPathStrictSearch"),
+        "easydata.queries.key": (
+            "KeySearch",
+            "KeyStrictSearch",
+            "NKeySearch",
+            "NKeyStrictSearch",
+        ),
+        "easydata.queries.lx": (
+            "CssSearch",
+            "CssStrictSearch",
+            "XPathSearch",
+            "XPathStrictSearch",
+        ),
+        "easydata.queries.pq": ("PyQuerySearch", "PyQueryStrictSearch"),
+        "easydata.queries.re": ("ReSearch", "ReStrictSearch"),
+    },
+    aliases={
+        "cwith": ("easydata.queries.clause", "WithClause"),
+        "cor": ("easydata.queries.clause", "OrClause"),
+        "css": ("easydata.queries.lx", "CssSearch"),
+        "css_strict": ("easydata.queries.lx", "CssStrictSearch"),
+        "jp": ("easydata.queries.jp", "JMESPathSearch"),
+        "jp_strict": ("easydata.queries.jp", "JMESPathStrictSearch"),
+        "key": ("easydata.queries.key", "KeySearch"),
+        "key_strict": ("easydata.queries.key", "KeyStrictSearch"),
+        "nkey": ("easydata.queries.key", "NKeySearch"),
+        "nkey_strict": ("easydata.queries.key", "NKeyStrictSearch"),
+        "pq": ("easydata.queries.pq", "PyQuerySearch"),
+        "pq_strict": ("easydata.queries.pq", "PyQueryStrictSearch"),
+        "re": ("easydata.queries.re", "ReSearch"),
+        "re_strict": ("easydata.queries.re", "ReStrictSearch"),
+        "xpath": ("easydata.queries.lx", "XPathSearch"),
+        "xpath_strict": ("easydata.queries.lx", "XPathStrictSearch"),
+    },
+)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Hashable, Optional
 
+from easydata.data import DataBag, QueryMemo
 from easydata.exceptions import QuerySearchDataEmpty, QuerySearchResultNotFound
 from easydata.utils import validate
 
@@ -24,6 +25,11 @@ class QuerySearchBase(ABC):
 class QuerySearch(QuerySearchBase, ABC):
     strict: bool = False
 
+    # Queries with memo kind can share raw selections through a query memo.
+    # By default whole parsed values are shared, unless queries split parsing
+    # with _select and _parse_selection methods.
+    _memo_kind: Optional[Hashable] = None
+
     def __init__(
         self,
         query: str,
@@ -66,6 +72,8 @@ class QuerySearch(QuerySearchBase, ABC):
 
         query_params = self._parse_query_params(parent_data or data)
 
+        query_memo = data.query_memo if isinstance(data, DataBag) else None
+
         if not data:
             if self.strict and data is None:
                 error_msg = 'Query: "%s" cannot be performed because data is empty!'
@@ -74,8 +82,6 @@ class QuerySearch(QuerySearchBase, ABC):
 
             return None
 
-        data = self.process_data(data, source)
-
         if self._query and query_params:
             query = self._apply_query_params(self._query, query_params)
         else:
@@ -84,7 +90,12 @@ class QuerySearch(QuerySearchBase, ABC):
         if self._debug_query:
             print(query)
 
-        value = self.parse(data, query)
+        if query_memo and self._memo_kind is not None:
+            value = self._parse_selection(
+                self._memo_select(query_memo, data, source, query)
+            )
+        else:
+            value = self.parse(self.process_data(data, source), query)
 
         if not value and self._empty_as_none:
             value = None
@@ -121,6 +132,34 @@ class QuerySearch(QuerySearchBase, ABC):
     ):
         pass
 
+    def _memo_select(
+        self,
+        query_memo: QueryMemo,
+        data: DataBag,
+        source: str,
+        query: Optional[str],
+    ) -> Any:
+
+        # Selections are stored under a source value instead of processed data,
+        # since processing can create new data on each call, e.g. decoded text
+        return query_memo.select(
+            data[source],
+            self._memo_kind,
+            query,
+            lambda _, query: self._select(self.process_data(data, source), query),
+        )
+
+    def _select(
+        self,
+        data: Any,
+        query: Optional[str],
+    ) -> Any:
+
+        return self.parse(data, query)
+
+    def _parse_selection(self, selection: Any) -> Any:
+        return selection
+
     @abstractmethod
     def process_data(
         self,
@@ -1,6 +1,8 @@
+from functools import lru_cache
 from typing import Any, Optional
 
 import jmespath
+from jmespath.parser import ParsedResult
 
 from easydata.queries.key import KeySearch
 
@@ -11,20 +13,24 @@ __all__ = (
 
 
 class JMESPathSearch(KeySearch):
-    def parse(
+    _memo_kind = "jp"
+
+    def _select(
         self,
         data: Any,
         query: Optional[str],
-    ):
+    ) -> Any:
 
-        if query:
-            data = jmespath.search(
-                expression=query,
-                data=data,
-            )
+        if not query:
+            return data
 
-        return self._process_data_key_values(data)
+        return compile_expression(query).search(data)
 
 
 class JMESPathStrictSearch(JMESPathSearch):
     strict = True
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(query: str) -> ParsedResult:
+    return jmespath.compile(query)
@@ -1,11 +1,12 @@
-import json
-from typing import Any, List, Optional, Tuple
-
-import yaml
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
 from easydata.data import DataBag
 from easydata.queries.base import QuerySearch
-from easydata.utils import pseudo
+from easydata.utils import codec, pseudo
+from easydata.utils.imports import lazy_import
+
+yaml = lazy_import("yaml")
 
 __all__ = (
     "KeySearch",
@@ -16,6 +17,8 @@ __all__ = (
 
 
 class KeySearch(QuerySearch):
+    _memo_kind = "key"
+
     def __init__(
         self,
         query: str,
@@ -40,10 +43,18 @@ class KeySearch(QuerySearch):
         query: Optional[str],
     ):
 
-        if query:
-            data = data.get(query)
+        return self._parse_selection(self._select(data, query))
 
-        return self._process_data_key_values(data)
+    def _select(
+        self,
+        data: Any,
+        query: Optional[str],
+    ) -> Any:
+
+        return data.get(query) if query else data
+
+    def _parse_selection(self, selection: Any) -> Any:
+        return self._process_data_key_values(selection)
 
     def process_data(
         self,
@@ -64,9 +75,9 @@ class KeySearch(QuerySearch):
                 return data[data_dict_source]
 
             try:
-                data_dict = json.loads(data[source])
+                data_dict = codec.loads(data[source])
 
-                data[data_dict_source] = data_dict
+                data.add_derived(source, data_dict_source, data_dict)
 
                 return data_dict
             except Exception:
@@ -77,7 +88,7 @@ class KeySearch(QuerySearch):
         elif isinstance(data, (dict, list)):
             return data
 
-        return json.loads(data)
+        return codec.loads(data)
 
     def _process_data_key_values(self, data):
         if data:
@@ -99,7 +110,7 @@ class KeySearch(QuerySearch):
                 data = list(data.keys())
 
             if self._json:
-                data = json.dumps(data)
+                data = codec.dumps(data)
 
             if self._yaml:
                 data = yaml.dump(data)
@@ -165,33 +176,39 @@ class KeyStrictSearch(KeySearch):
 
 
 class NKeySearch(KeySearch):
-    def parse(
+    _memo_kind = "nkey"
+
+    def _select(
         self,
         data: Any,
         query: Optional[str],
-    ):
-
-        if query:
-            data = self._multi_query_data(
-                data=data,
-                queries=query.split("."),
-            )
+    ) -> Any:
 
-        return self._process_data_key_values(data)
+        if not query:
+            return data
 
-    def _multi_query_data(self, data: Any, queries: List[str]):
-        query = queries.pop(0)
+        return self._multi_query_data(
+            data=data,
+            queries=compile_key_path(query),
+        )
 
-        data = data.get(query)
+    def _multi_query_data(self, data: Any, queries: Tuple[str, ...]):
+        for index, query in enumerate(queries):
+            if index and not isinstance(data, dict):
+                raise TypeError("key can perform nested queries only on dict objects")
 
-        if not queries or data is None:
-            return data
+            data = data.get(query)
 
-        if not isinstance(data, dict):
-            raise TypeError("key can perform nested queries only on dict objects")
+            if data is None:
+                break
 
-        return self._multi_query_data(data, queries)
+        return data
 
 
 class NKeyStrictSearch(NKeySearch):
     strict = True
+
+
+@lru_cache(maxsize=1024)
+def compile_key_path(query: str) -> Tuple[str, ...]:
+    return tuple(query.split("."))
@@ -0,0 +1,321 @@
+from copy import deepcopy
+from functools import lru_cache
+from html import escape
+from typing import Any, Iterable, List, Optional
+
+from easytxt.text import normalize
+from lxml import etree
+from pyquery import PyQuery
+from pyquery.cssselectpatch import JQueryTranslator
+from pyquery.pyquery import fromstring
+from pyquery.text import extract_text
+
+from easydata.data import DataBag
+from easydata.queries.pq import PyQuerySearch, _attr_shortcut_mappings
+from easydata.utils import pseudo
+
+__all__ = (
+    "CssSearch",
+    "CssStrictSearch",
+    "XPathSearch",
+    "XPathStrictSearch",
+)
+
+_css_translator = JQueryTranslator(xhtml=False)
+
+_xpath_axes = frozenset(
+    (
+        "ancestor",
+        "ancestor-or-self",
+        "attribute",
+        "child",
+        "descendant",
+        "descendant-or-self",
+        "following",
+        "following-sibling",
+        "namespace",
+        "parent",
+        "preceding",
+        "preceding-sibling",
+        "self",
+    )
+)
+
+_pseudo_keys = frozenset(("text", "ntext", "html", "ohtml", "items", "iter"))
+
+
+class CssSearch(PyQuerySearch):
+    """Css selector with same pseudo keys as PyQuerySearch, which runs compiled
+    xpath expressions directly on lxml elements."""
+
+    _memo_kind = "css"
+
+    def _compile_query(self, query: str) -> etree.XPath:
+        return compile_css(query)
+
+    def _select(
+        self,
+        elements: List[etree._Element],
+        query: Optional[str],
+    ) -> List[etree._Element]:
+
+        if not query:
+            return elements
+
+        xpath = self._compile_query(query)
+
+        if len(elements) == 1:
+            return xpath(elements[0])
+
+        selected_elements = []
+
+        for element in elements:
+            selected_elements.extend(xpath(element))
+
+        return selected_elements
+
+    def _parse_selection(self, elements: List[etree._Element]) -> Any:
+        if self._iter:
+            return self._iter_parse(elements)
+        if self._items:
+            return list(self._iter_parse(elements))
+        else:
+            elements = self._process_elements(elements, first=self._first)
+
+            return self._extract_data_from_elements(elements)
+
+    def _iter_parse(self, elements: List[etree._Element]) -> Iterable[Any]:
+        for element in self._process_elements(elements, first=False):
+            yield self._extract_data_from_elements([element])
+
+    def process_data(
+        self,
+        data: Any,
+        source: Optional[str] = None,
+    ) -> List[etree._Element]:
+
+        if isinstance(data, DataBag):
+            source_data = data[source]
+
+            if not isinstance(source_data, (str, bytes)):
+                return self.process_data(source_data)
+
+            lxml_source = "{}_lxml".format(source)
+
+            if not hasattr(data, lxml_source):
+                pq_source = "{}_pq".format(source)
+
+                # Elements are shared with pq query if it already loaded them
+                if hasattr(data, pq_source):
+                    elements = list(data[pq_source])
+                else:
+                    elements = fromstring(source_data)
+
+                data.add_derived(source, lxml_source, elements)
+
+            return data[lxml_source]
+        elif isinstance(data, PyQuery):
+            return list(data)
+        elif isinstance(data, etree._Element):
+            return [data]
+        elif isinstance(data, list):
+            return data
+
+        return fromstring(data)
+
+    def _extract_data_from_elements(self, elements: List[etree._Element]) -> Any:
+        if self._text:
+            return " ".join(_element_text(e) for e in elements) or None
+        elif self._ntext:
+            text = " ".join(_element_text(e) for e in elements)
+
+            return normalize(text) or None if elements else None
+        elif self._html:
+            return _element_html(elements[0]) or None if elements else None
+        elif self._outer_html:
+            return _element_outer_html(elements[0]) or None if elements else None
+        elif self._has_class:
+            # Returns bool
+            return any(_element_has_class(e, self._has_class) for e in elements)
+        elif self._attr:
+            return elements[0].get(self._attr) or None if elements else None
+
+        # Same as PyQuery objects, selected elements are always returned in a list
+        # since element without children evaluates as False.
+        return elements
+
+    def _process_elements(
+        self,
+        elements: List[etree._Element],
+        first: bool = True,
+    ) -> List[etree._Element]:
+
+        if elements and first:
+            elements = elements[:1]
+
+        # Xpath queries can also select strings, e.g. attribute values
+        if self._remove_query and elements and _is_element(elements[0]):
+            elements = [deepcopy(e) for e in elements]
+
+            for removed_element in self._select(elements, self._remove_query):
+                _remove_element(removed_element)
+
+        return elements
+
+
+class CssStrictSearch(CssSearch):
+    strict = True
+
+
+class XPathSearch(CssSearch):
+    """Xpath query with same pseudo keys as PyQuerySearch, which can also
+    select attribute values, text nodes and results of xpath functions."""
+
+    _memo_kind = "xpath"
+
+    def _compile_query(self, query: str) -> etree.XPath:
+        return compile_xpath(query)
+
+    def _select(
+        self,
+        elements: List[etree._Element],
+        query: Optional[str],
+    ) -> List[Any]:
+
+        if not query:
+            return elements
+
+        xpath = self._compile_query(query)
+
+        selected_values: List[Any] = []
+
+        for element in elements:
+            values = xpath(element)
+
+            # Functions like count or boolean return a single value
+            if isinstance(values, list):
+                selected_values.extend(values)
+            else:
+                selected_values.append(values)
+
+        return selected_values
+
+    def _extract_data_from_elements(self, elements: List[Any]) -> Any:
+        if not elements or _is_element(elements[0]):
+            return super()._extract_data_from_elements(elements)
+
+        # Smart strings are converted, so that they don't keep whole documents
+        values = [str(v) if isinstance(v, str) else v for v in elements]
+
+        if self._text:
+            return " ".join(str(v) for v in values) or None
+        elif self._ntext:
+            return normalize(" ".join(str(v) for v in values)) or None
+
+        return values[0] if self._first else values
+
+    def _initialize_custom_pseudo_keys(self):
+        # Only a last part of a query is a pseudo key, since :: also separates
+        # xpath axes and node tests, e.g. following-sibling::p
+        query, _, pseudo_key = self._query.rpartition("::")
+
+        if query.rsplit("/", 1)[-1].strip() in _xpath_axes:
+            return
+
+        if not _is_pseudo_key(pseudo_key):
+            return
+
+        self._query = query or None
+
+        pseudo_key = self._process_pseudo_key_extension(pseudo_key)
+
+        self._process_pseudo_key(pseudo_key)
+
+
+class XPathStrictSearch(XPathSearch):
+    strict = True
+
+
+@lru_cache(maxsize=1024)
+def compile_css(query: str) -> etree.XPath:
+    xpath = _css_translator.css_to_xpath(
+        query.replace("[@", "["),
+        "descendant-or-self::",
+    )
+
+    return etree.XPath(xpath)
+
+
+@lru_cache(maxsize=1024)
+def compile_xpath(query: str) -> etree.XPath:
+    return etree.XPath(query)
+
+
+def _is_element(value: Any) -> bool:
+    return isinstance(value, etree._Element)
+
+
+def _is_pseudo_key(pseudo_key: str) -> bool:
+    pseudo_key, extension = pseudo.get_extension_value(
+        pseudo_key=pseudo_key,
+        pseudo_keys_with_separator_value=["attr", "has_class"],
+    )
+
+    if extension not in (None, "iter", "items", "all"):
+        return False
+
+    return (
+        pseudo_key in _pseudo_keys
+        or pseudo_key in _attr_shortcut_mappings
+        or pseudo_key.startswith("attr(")
+        or pseudo_key.startswith("has_class(")
+    )
+
+
+def _element_text(element: etree._Element) -> str:
+    if element.tag == "textarea":
+        return _element_html(element, escape_text=False)
+
+    return extract_text(element)
+
+
+def _element_html(element: etree._Element, escape_text: bool = True) -> str:
+    html = element.text or ""
+
+    if escape_text:
+        html = escape(html, quote=False)
+
+    for child in element:
+        html += etree.tostring(child, encoding=str)
+
+    return html
+
+
+def _element_outer_html(element: etree._Element) -> str:
+    if element.tail:
+        element = deepcopy(element)
+        element.tail = ""
+
+    return etree.tostring(element, encoding=str, method="html")
+
+
+def _element_has_class(element: etree._Element, class_name: str) -> bool:
+    return class_name in (element.get("class") or "").split()
+
+
+def _remove_element(element: etree._Element) -> None:
+    parent = element.getparent()
+
+    if parent is None:
+        return
+
+    # Tail text belongs to the parent and it's kept, same as in PyQuery
+    if element.tail:
+        previous = element.getprevious()
+
+        if previous is None:
+            parent.text = (parent.text or "") + element.tail
+        else:
+            previous.tail = (previous.tail or "") + element.tail
+
+    parent.remove(element)
@@ -28,6 +28,8 @@ _attr_shortcut_mappings = {
 
 
 class PyQuerySearch(QuerySearch):
+    _memo_kind = "pq"
+
     def __init__(
         self,
         query: str,
@@ -58,22 +60,28 @@ class PyQuerySearch(QuerySearch):
         query: Optional[str],
     ) -> Any:
 
+        return self._parse_selection(self._select(pq, query))
+
+    def _select(
+        self,
+        pq: PyQuery,
+        query: Optional[str],
+    ) -> PyQuery:
+
+        return pq(query) if query else pq
+
+    def _parse_selection(self, pq: PyQuery) -> Any:
         if self._iter:
-            return self._iter_parse(pq, query=query)
+            return self._iter_parse(pq)
         if self._items:
-            return list(self._iter_parse(pq, query=query))
+            return list(self._iter_parse(pq))
         else:
-            pq = self._parse_pq(pq, query=query, first=self._first)
+            pq = self._process_pq(pq, first=self._first)
 
             return self._extract_data_from_pq(pq)
 
-    def _iter_parse(
-        self,
-        pq: PyQuery,
-        query: Optional[str],
-    ) -> Iterable[Any]:
-
-        pq = self._parse_pq(pq, query=query, first=False)
+    def _iter_parse(self, pq: PyQuery) -> Iterable[Any]:
+        pq = self._process_pq(pq, first=False)
 
         for spq in pq.items():
             yield self._extract_data_from_pq(spq)
@@ -91,7 +99,15 @@ class PyQuerySearch(QuerySearch):
             pq_source = "{}_pq".format(source)
 
             if not hasattr(data, pq_source):
-                data[pq_source] = PyQuery(data[source])
+                lxml_source = "{}_lxml".format(source)
+
+                # Elements are shared with css and xpath queries if they loaded them
+                if hasattr(data, lxml_source):
+                    pq = PyQuery(data[lxml_source])
+                else:
+                    pq = PyQuery(data[source])
+
+                data.add_derived(source, pq_source, pq)
 
             return data[pq_source]
         elif isinstance(data, PyQuery):
@@ -116,16 +132,12 @@ class PyQuerySearch(QuerySearch):
 
         return pq
 
-    def _parse_pq(
+    def _process_pq(
         self,
         pq: PyQuery,
-        query: Optional[str],
         first: bool = True,
     ) -> PyQuery:
 
-        if query:
-            pq = pq(query)
-
         if pq and first:
             pq = pq.eq(0)
 
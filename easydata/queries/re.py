@@ -1,11 +1,12 @@
 import re
-from json import dumps
-from typing import Any, Iterable, Optional
-
-from pyquery import PyQuery
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, Pattern
 
 from easydata.data import DataBag
 from easydata.queries.base import QuerySearch
+from easydata.utils import codec
+from easydata.utils.imports import is_instance_of
 
 __all__ = (
     "ReSearch",
@@ -38,6 +39,16 @@ class ReSearch(QuerySearch):
         self._ignore_case = ignore_case
         self._bytes_to_string_decode = bytes_to_string_decode
 
+        self._flags = 0
+
+        if dotall:
+            self._flags |= re.DOTALL
+
+        if ignore_case:
+            self._flags |= re.IGNORECASE
+
+        self._memo_kind = ("re", dotall, ignore_case, bytes_to_string_decode)
+
     def parse(
         self,
         data: Any,
@@ -50,19 +61,25 @@ class ReSearch(QuerySearch):
         for result in self._iter_parse(data, query=query):
             return result
 
-    def _iter_parse(self, data: Any, query: Optional[str]) -> Iterable[Any]:
-        if not query:
-            raise ValueError("Query cannot be empty")
+    def _select(
+        self,
+        data: Any,
+        query: Optional[str],
+    ) -> "_ReResults":
 
-        flags = 0
+        return _ReResults(self._iter_parse(data, query=query))
 
-        if self._dotall:
-            flags = re.DOTALL
+    def _parse_selection(self, selection: "_ReResults") -> Any:
+        if self._all:
+            return selection.all()
 
-        if self._ignore_case:
-            flags = flags | re.IGNORECASE if flags else re.IGNORECASE
+        return selection.first()
 
-        results = re.finditer(query, data, flags)
+    def _iter_parse(self, data: Any, query: Optional[str]) -> Iterable[Any]:
+        if not query:
+            raise ValueError("Query cannot be empty")
+
+        results = compile_pattern(query, self._flags).finditer(data)
 
         for result in results:
             yield result.group(1)
@@ -76,11 +93,11 @@ class ReSearch(QuerySearch):
         if isinstance(data, DataBag):
             data = data[source]
 
-        if isinstance(data, PyQuery):
+        if is_instance_of(data, "pyquery", "PyQuery"):
             data = data.outer_html()
 
         if isinstance(data, (dict, list)):
-            data = dumps(data)
+            data = codec.dumps(data)
 
         if isinstance(data, bytes):
             data = data.decode(self._bytes_to_string_decode)
@@ -96,3 +113,28 @@ class ReSearch(QuerySearch):
 
 class ReStrictSearch(ReSearch):
     strict = True
+
+
+class _ReResults:
+    """Regex results which are matched only as far as they are read, so that
+    queries without the all pseudo key stop at a first match."""
+
+    def __init__(self, results: Iterable[Any]):
+        self._results: Iterator[Any] = iter(results)
+        self._matched_results: List[Any] = []
+
+    def first(self) -> Any:
+        if not self._matched_results:
+            self._matched_results.extend(islice(self._results, 1))
+
+        return self._matched_results[0] if self._matched_results else None
+
+    def all(self) -> List[Any]:
+        self._matched_results.extend(self._results)
+
+        return list(self._matched_results)
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(query: str, flags: int = 0) -> Pattern:
+    return re.compile(query, flags)
@@ -0,0 +1,82 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable
+
+__all__ = ("LRUCache",)
+
+_missing = object()
+
+
+class LRUCache:
+    """Bounded mapping which discards least recently used values when it's
+    full. It's safe to share it between threads."""
+
+    def __init__(self, maxsize: int = 1024):
+        self._maxsize = maxsize
+        self._values: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._values.get(key, _missing)
+
+            if value is _missing:
+                self.misses += 1
+
+                return default
+
+            self.hits += 1
+
+            self._values.move_to_end(key)
+
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self._maxsize <= 0:
+            return
+
+        with self._lock:
+            self._values[key] = value
+
+            self._values.move_to_end(key)
+
+            if len(self._values) > self._maxsize:
+                self._values.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, create_value: Callable[[], Any]) -> Any:
+        value = self.get(key, _missing)
+
+        if value is _missing:
+            value = create_value()
+
+            self.set(key, value)
+
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self._maxsize,
+            "size": len(self._values),
+        }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
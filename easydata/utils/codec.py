@@ -0,0 +1,119 @@
+import json
+from importlib import import_module
+from typing import Any, Callable, Optional
+
+from easydata.utils import config
+
+__all__ = (
+    "loads",
+    "loads_buffer",
+    "dumps",
+    "get_backend",
+    "set_backend",
+)
+
+_backends = ("auto", "orjson", "ujson", "json")
+
+_backend: str = "json"
+
+_loads: Callable[[Any], Any] = json.loads
+
+_dumps: Callable[[Any], str] = json.dumps
+
+
+def loads(data: Any) -> Any:
+    return _loads(data)
+
+
+def loads_buffer(data: memoryview) -> Any:
+    """Decodes json from a buffer, e.g. a line of a memory mapped file. Buffer
+    is copied to bytes only if a backend doesn't accept buffers."""
+
+    if _backend == "orjson":
+        return _loads(data)
+
+    return _loads(bytes(data))
+
+
+def dumps(value: Any) -> str:
+    return _dumps(value)
+
+
+def get_backend() -> str:
+    return _backend
+
+
+def set_backend(backend: Optional[str] = None) -> str:
+    """Sets json backend used by queries and processors. If backend is not
+    provided, ED_JSON_BACKEND config value is used. Returns name of a backend
+    that was loaded, which in an auto mode is first one installed."""
+
+    global _backend, _loads, _dumps
+
+    backend = backend or config["ED_JSON_BACKEND"]
+
+    if backend not in _backends:
+        raise ValueError(
+            "Json backend {} is not supported. Supported are: {}".format(
+                backend, ", ".join(_backends)
+            )
+        )
+
+    if backend == "json":
+        _backend, _loads, _dumps = "json", json.loads, json.dumps
+
+        return _backend
+
+    if backend == "auto":
+        for auto_backend in ("orjson", "ujson"):
+            try:
+                fast_loads = import_module(auto_backend).loads
+            except ImportError:
+                continue
+
+            # Data which fast backend rejects, e.g. NaN or very big integers, is
+            # still decoded by stdlib json, while encoding is left to stdlib json
+            # so that output stays the same regardless of installed packages.
+            _backend = auto_backend
+            _loads = _auto_loads(fast_loads)
+            _dumps = json.dumps
+
+            return _backend
+
+        return set_backend("json")
+
+    backend_module = import_module(backend)
+
+    _backend = backend
+    _loads = backend_module.loads
+
+    if backend == "orjson":
+        _dumps = _orjson_dumps(backend_module.dumps)
+    else:
+        _dumps = backend_module.dumps
+
+    return _backend
+
+
+def _auto_loads(fast_loads: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def auto_loads(data: Any) -> Any:
+        try:
+            return fast_loads(data)
+        except ValueError:
+            # Stdlib json doesn't accept buffers
+            if isinstance(data, memoryview):
+                data = bytes(data)
+
+            return json.loads(data)
+
+    return auto_loads
+
+
+def _orjson_dumps(orjson_dumps: Callable[[Any], bytes]) -> Callable[[Any], str]:
+    def dumps(value: Any) -> str:
+        return orjson_dumps(value).decode("utf-8")
+
+    return dumps
+
+
+set_backend()
@@ -0,0 +1,99 @@
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+__all__ = (
+    "LazyImport",
+    "LazyModule",
+    "lazy_import",
+    "lazy_module",
+    "is_instance_of",
+)
+
+
+class LazyImport:
+    """Module proxy which imports a module when one of its attributes is
+    accessed for the first time."""
+
+    def __init__(self, module_name: str):
+        self.__dict__["_module_name"] = module_name
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(import_module(self._module_name), name)
+
+        # Next lookups find a value directly in a proxy dict
+        self.__dict__[name] = value
+
+        return value
+
+    def __repr__(self):
+        return "<lazy module '{}'>".format(self._module_name)
+
+
+class LazyModule(ModuleType):
+    """Package whose public attributes are imported from its submodules when
+    they are accessed for the first time, similar to PEP 562 __getattr__."""
+
+    _lazy_attrs: Dict[str, Tuple[str, str]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            module_name, attr_name = self._lazy_attrs[name]
+        except KeyError:
+            raise AttributeError(
+                "module '{}' has no attribute '{}'".format(self.__name__, name)
+            ) from None
+
+        value = getattr(import_module(module_name), attr_name)
+
+        super().__setattr__(name, value)
+
+        return value
+
+    def __setattr__(self, name: str, value: Any):
+        # Import of a submodule binds it to a package attribute, which would
+        # hide an attribute with the same name, e.g. queries.pq search class
+        if isinstance(value, ModuleType) and name in self._lazy_attrs:
+            return
+
+        super().__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._lazy_attrs))
+
+
+def lazy_import(module_name: str) -> Any:
+    return LazyImport(module_name)
+
+
+def lazy_module(
+    module_name: str,
+    submodules_attrs: Dict[str, Iterable[str]],
+    aliases: Optional[Dict[str, Tuple[str, str]]] = None,
+) -> Tuple[str, ...]:
+    """Makes attributes of submodules available on a package without importing
+    submodules in advance. Returns names of lazy attributes for __all__."""
+
+    lazy_attrs = dict(aliases or {})
+
+    for submodule_name, attr_names in submodules_attrs.items():
+        for attr_name in attr_names:
+            lazy_attrs[attr_name] = (submodule_name, attr_name)
+
+    module = sys.modules[module_name]
+
+    module.__class__ = LazyModule
+
+    module._lazy_attrs = lazy_attrs  # type: ignore
+
+    return tuple(lazy_attrs)
+
+
+def is_instance_of(value: Any, module_name: str, class_name: str) -> bool:
+    """Checks if value is an instance of a class without importing its module,
+    since value can't be its instance if module wasn't imported yet."""
+
+    module = sys.modules.get(module_name)
+
+    return module is not None and isinstance(value, getattr(module, class_name))
@@ -1,14 +1,25 @@
 from types import GeneratorType
-from typing import Any, Callable, List, Optional, Union
-
-from easytxt.text import to_list as multiply_to_list
-from pyquery import PyQuery
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
+from weakref import WeakKeyDictionary
 
 from easydata import groups
 from easydata.config.loader import ConfigLoader
 from easydata.data import DataBag
 from easydata.parsers.base import Base
 from easydata.processors.base import BaseProcessor
+from easydata.utils.imports import is_instance_of, lazy_import
+
+if TYPE_CHECKING:
+    from pyquery import PyQuery
+
+easytxt_text = lazy_import("easytxt.text")
+
+# Both are keyed by a class, so classes created at runtime can still be freed
+_attr_names_cache: "WeakKeyDictionary[type, Dict[tuple, List[str]]]" = (
+    WeakKeyDictionary()
+)
+
+_item_groups_cache: "WeakKeyDictionary[type, groups.ItemGroup]" = WeakKeyDictionary()
 
 
 def _parse_float(
@@ -59,10 +70,14 @@ def tuple_list_to_dict(
     return dict_data
 
 
+def is_pyquery(value: Any) -> bool:
+    return is_instance_of(value, "pyquery", "PyQuery")
+
+
 def pq_remove_nodes(
-    pq: PyQuery,
+    pq: "PyQuery",
     css_remove: Union[str, list],
-) -> PyQuery:
+) -> "PyQuery":
 
     pq = pq.clone()
 
@@ -76,7 +91,7 @@ def pq_remove_nodes(
 
 
 def pq_extract_value_items(
-    pq: PyQuery,
+    pq: "PyQuery",
     css: Optional[str] = None,
     css_remove: Optional[Union[str, list]] = None,
 ):
@@ -118,23 +133,59 @@ def apply_processors(
     return value
 
 
+def compile_processor(processor: Any) -> Callable[[Any], Any]:
+    if isinstance(processor, BaseProcessor):
+        return processor.parse
+
+    return processor
+
+
 def extract_attr_names_from_obj(
     obj: object,
     attr_prefixes: List[str],
     ignore_attr_prefix: Optional[List[str]] = None,
 ):
 
-    attr_names = []
+    if isinstance(obj, type):
+        return _filter_attr_names(dir(obj), attr_prefixes, ignore_attr_prefix)
 
-    for attr_name in dir(obj):
-        if ignore_attr_prefix:
-            if any(attr_name.startswith(sk) for sk in ignore_attr_prefix):
-                continue
+    # Class attribute names are discovered once per class, since models are
+    # usually created many times, and only instance attributes are checked
+    # for each object.
+    class_attr_names = _attr_names_cache.setdefault(type(obj), {})
 
-        if any(attr_name.startswith(ap) for ap in attr_prefixes):
-            attr_names.append(attr_name)
+    cache_key = (tuple(attr_prefixes), tuple(ignore_attr_prefix or ()))
+
+    attr_names = class_attr_names.get(cache_key)
+
+    if attr_names is None:
+        attr_names = _filter_attr_names(
+            dir(type(obj)),
+            attr_prefixes,
+            ignore_attr_prefix,
+        )
+
+        class_attr_names[cache_key] = attr_names
+
+    instance_attr_names = _filter_attr_names(
+        getattr(obj, "__dict__", ()),
+        attr_prefixes,
+        ignore_attr_prefix,
+    )
+
+    if not instance_attr_names:
+        return list(attr_names)
+
+    return sorted(set(attr_names).union(instance_attr_names))
+
+
+def clear_attr_names_cache():
+    """Clears discovered attribute names of classes. Needed only if item
+    parsers are added to a model class after its first model was created."""
+
+    _attr_names_cache.clear()
 
-    return attr_names
+    _item_groups_cache.clear()
 
 
 def iter_attr_data_from_obj(
@@ -153,11 +204,46 @@ def iter_attr_data_from_obj(
         attr_value = getattr(obj, attr_name)
 
         if isinstance(attr_value, type(groups.ItemGroup)):
-            attr_value = attr_value()
+            attr_value = _create_attr_instance(attr_value)
 
         yield attr_name, attr_value
 
 
+def _filter_attr_names(
+    attr_names: Iterable[str],
+    attr_prefixes: List[str],
+    ignore_attr_prefix: Optional[List[str]] = None,
+) -> List[str]:
+
+    filtered_attr_names = []
+
+    for attr_name in attr_names:
+        if ignore_attr_prefix:
+            if any(attr_name.startswith(sk) for sk in ignore_attr_prefix):
+                continue
+
+        if any(attr_name.startswith(ap) for ap in attr_prefixes):
+            filtered_attr_names.append(attr_name)
+
+    return filtered_attr_names
+
+
+def _create_attr_instance(attr_class: type) -> Any:
+    # Item groups only hold parsers of their class, so one group instance is
+    # shared by all models instead of creating a new one for each model.
+    if not issubclass(attr_class, groups.ItemGroup):
+        return attr_class()
+
+    item_group = _item_groups_cache.get(attr_class)
+
+    if item_group is None:
+        item_group = attr_class()
+
+        _item_groups_cache[attr_class] = item_group
+
+    return item_group
+
+
 def data_to_data_bag(
     data: Optional[Union[Any, DataBag]] = None,
     **kwargs,
@@ -226,7 +312,7 @@ def multiply_list_values(
         if not list_value:
             continue
 
-        new_list_values = multiply_to_list(
+        new_list_values = easytxt_text.to_list(
             value=list_value,
             multiply_keys=multiply_keys,
         )
@@ -351,3 +437,16 @@ def process_item_parser(
         return parser(parent_data, data)
 
     return parser(data)
+
+
+def compile_item_parser(parser) -> Callable[[Any], Any]:
+    if parser is None or isinstance(parser, (str, bool, float, int, list, dict)):
+
+        def parse_constant(data: Any):
+            return parser
+
+        return parse_constant
+    elif isinstance(parser, Base):
+        return parser.parse
+
+    return parser
@@ -1,5 +1,5 @@
 from types import FunctionType
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from easydata.data import DataBag
 from easydata.queries.base import QuerySearchBase
@@ -30,11 +30,19 @@ def default_data_value(
     return data[source] if isinstance(data, DataBag) else data
 
 
-def variants_data(data: DataBag, source: str):
+def variants_data(
+    data: DataBag,
+    source: str,
+    invariant_keys: Iterable[str] = (),
+):
+
     original_variants_data: dict = data[source]
 
     total_variants = len(original_variants_data)
 
+    # Invariant item values are parsed by a first variant and reused by others
+    shared_results: dict = {}
+
     for variant_key, variant_multi_data in original_variants_data.items():
         data_copy = data.copy()
 
@@ -45,6 +53,9 @@ def variants_data(data: DataBag, source: str):
         data_copy["{}_variants_len".format(source)] = total_variants
         data_copy["{}_key".format(source)] = variant_key
 
+        if invariant_keys:
+            data_copy.share_results(invariant_keys, shared_results)
+
         yield data_copy
 
 
@@ -1,7 +1,37 @@
+import re
 from typing import Optional, Union
 
-from easytxt import text
-from price_parser import Price
+from easydata.utils.cache import LRUCache
+from easydata.utils.imports import lazy_import
+
+price_parser = lazy_import("price_parser")
+
+text = lazy_import("easytxt.text")
+
+_currency_pattern = r"(?:[$€£¥]|[A-Z]{3})?"
+
+# Common price shapes, e.g. 1299, $1,299.00 or 1.299,00 €, by decimal separator.
+# Without a known decimal separator, only decimals with up to 2 digits are
+# matched, since 1.299 could also be a price with a thousands separator.
+_fast_price_res = {
+    None: re.compile(
+        r"\s*{c}\s*(\d{{1,3}}(?:,\d{{3}})+|\d+)(?:\.(\d{{1,2}}))?\s*{c}\s*".format(
+            c=_currency_pattern
+        )
+    ),
+    ".": re.compile(
+        r"\s*{c}\s*(\d{{1,3}}(?:,\d{{3}})+|\d+)(?:\.(\d+))?\s*{c}\s*".format(
+            c=_currency_pattern
+        )
+    ),
+    ",": re.compile(
+        r"\s*{c}\s*(\d{{1,3}}(?:\.\d{{3}})+|\d+)(?:,(\d+))?\s*{c}\s*".format(
+            c=_currency_pattern
+        )
+    ),
+}
+
+_prices = LRUCache(maxsize=4096)
 
 
 def to_float(
@@ -13,11 +43,29 @@ def to_float(
 
     price_str_value: str = text.to_str(price_value)
 
-    price = Price.fromstring(
-        price=price_str_value,
-        currency_hint=currency_hint,
-        decimal_separator=decimal_separator,
-    ).amount_float
+    memo_key = (price_str_value, currency_hint, decimal_separator, decimals)
+
+    return _prices.get_or_set(
+        memo_key,
+        lambda: _to_float(price_str_value, decimals, currency_hint, decimal_separator),
+    )
+
+
+def _to_float(
+    price_str_value: str,
+    decimals: Union[int, bool] = 2,
+    currency_hint: Optional[str] = None,
+    decimal_separator: Optional[str] = None,
+):
+
+    price = _parse_price_fast(price_str_value, decimal_separator)
+
+    if price is None:
+        price = price_parser.Price.fromstring(
+            price=price_str_value,
+            currency_hint=currency_hint,
+            decimal_separator=decimal_separator,
+        ).amount_float
 
     if not price:
         return price
@@ -25,6 +73,28 @@ def to_float(
     return round(price, decimals) if decimals is not None else price
 
 
+def _parse_price_fast(
+    price_str_value: str,
+    decimal_separator: Optional[str] = None,
+) -> Optional[float]:
+
+    fast_price_re = _fast_price_res.get(decimal_separator)
+
+    if not fast_price_re:
+        return None
+
+    price_match = fast_price_re.fullmatch(price_str_value)
+
+    if not price_match:
+        return None
+
+    integer_part, decimal_part = price_match.groups()
+
+    integer_part = integer_part.replace("," if decimal_separator != "," else ".", "")
+
+    return float("{}.{}".format(integer_part, decimal_part or "0"))
+
+
 def to_string(
     price_value: Union[str, int, float],
     decimals: Union[int, bool] = 2,
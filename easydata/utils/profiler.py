@@ -0,0 +1,201 @@
+import math
+import random
+from collections import defaultdict
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+__all__ = (
+    "Profiler",
+    "TimingStats",
+    "timings_stats",
+)
+
+SECTIONS = (
+    "items",
+    "data_processors",
+    "item_processors",
+    "callbacks",
+)
+
+
+class TimingStats:
+    """Running count, total and max time of a profiled name. Percentiles are
+    computed from a bounded random sample of times, so that memory doesn't
+    grow with a number of parsed items."""
+
+    def __init__(
+        self,
+        sample_size: int = 1024,
+        rng: Optional[random.Random] = None,
+    ):
+
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+        self._sample: List[float] = []
+        self._sample_size = sample_size
+        self._rng = rng or random.Random()
+
+    def add(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+
+        if elapsed > self.max:
+            self.max = elapsed
+
+        if len(self._sample) < self._sample_size:
+            self._sample.append(elapsed)
+
+            return
+
+        # Reservoir sampling keeps each time in a sample with equal probability
+        sample_index = self._rng.randrange(self.count)
+
+        if sample_index < self._sample_size:
+            self._sample[sample_index] = elapsed
+
+    def stats(self) -> Dict[str, Any]:
+        sorted_sample = sorted(self._sample)
+
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count,
+            "p50": _percentile(sorted_sample, 50),
+            "p95": _percentile(sorted_sample, 95),
+            "p99": _percentile(sorted_sample, 99),
+            "max": self.max,
+        }
+
+
+class Profiler:
+    """Collects wall times of item parsers, processors and model callbacks.
+    Timed callables are wrapped only when a model manager is compiled with
+    a profiler, so models without it don't pay for timing."""
+
+    def __init__(self, sample_size: int = 1024):
+        self._sample_size = sample_size
+
+        self._rng = random.Random()
+
+        self._timings: Dict[str, Dict[str, TimingStats]] = {
+            section: defaultdict(self._create_timing_stats) for section in SECTIONS
+        }
+
+        self._lock = Lock()
+
+    def _create_timing_stats(self) -> TimingStats:
+        return TimingStats(sample_size=self._sample_size, rng=self._rng)
+
+    def record(self, section: str, name: str, elapsed: float) -> None:
+        with self._lock:
+            self._timings[section][name].add(elapsed)
+
+    def time(self, section: str, name: str, func: Callable) -> Callable:
+        def timed_func(*args, **kwargs):
+            start = perf_counter()
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(section, name, perf_counter() - start)
+
+        return timed_func
+
+    def time_iter(self, section: str, name: str, iterator: Iterator) -> Iterator:
+        """Times each step of an iterator, so that time spent by a consumer
+        between steps isn't counted."""
+
+        while True:
+            start = perf_counter()
+
+            try:
+                value = next(iterator)
+            except StopIteration:
+                self.record(section, name, perf_counter() - start)
+
+                return
+
+            self.record(section, name, perf_counter() - start)
+
+            yield value
+
+    def clear(self) -> None:
+        with self._lock:
+            for section_timings in self._timings.values():
+                section_timings.clear()
+
+    def stats(self) -> Dict[str, Dict[str, dict]]:
+        """Returns count, total, mean, p50, p95, p99 and max time in seconds
+        for each profiled name grouped by a section."""
+
+        with self._lock:
+            return {
+                section: {
+                    name: timing_stats.stats()
+                    for name, timing_stats in section_timings.items()
+                }
+                for section, section_timings in self._timings.items()
+            }
+
+    def format_table(self) -> str:
+        header = ("name", "count", "total", "mean", "p50", "p95", "p99", "max")
+
+        rows = []
+
+        for section, section_stats in self.stats().items():
+            # Slowest names are listed first
+            sorted_stats = sorted(
+                section_stats.items(),
+                key=lambda name_stats: name_stats[1]["total"],
+                reverse=True,
+            )
+
+            for name, name_stats in sorted_stats:
+                rows.append(
+                    ("{}: {}".format(section, name), str(name_stats["count"]))
+                    + tuple(
+                        "{:.3f}ms".format(name_stats[stat] * 1000)
+                        for stat in header[2:]
+                    )
+                )
+
+        widths = [
+            max(len(row[i]) for row in [header] + rows) for i in range(len(header))
+        ]
+
+        return "\n".join(
+            "  ".join(
+                value.ljust(width) if i == 0 else value.rjust(width)
+                for i, (value, width) in enumerate(zip(row, widths))
+            )
+            for row in [header] + rows
+        )
+
+    def __str__(self):
+        return self.format_table()
+
+
+def timings_stats(timings: List[float]) -> Dict[str, Any]:
+    sorted_timings = sorted(timings)
+
+    total = sum(sorted_timings)
+
+    return {
+        "count": len(sorted_timings),
+        "total": total,
+        "mean": total / len(sorted_timings),
+        "p50": _percentile(sorted_timings, 50),
+        "p95": _percentile(sorted_timings, 95),
+        "p99": _percentile(sorted_timings, 99),
+        "max": sorted_timings[-1],
+    }
+
+
+def _percentile(sorted_timings: List[float], percent: int) -> float:
+    # Nearest rank method
+    rank = math.ceil(percent / 100 * len(sorted_timings))
+
+    return sorted_timings[max(rank, 1) - 1]
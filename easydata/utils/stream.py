@@ -0,0 +1,331 @@
+import codecs
+import json
+import mmap
+import os
+import re
+from io import BytesIO, StringIO
+from typing import IO, Any, Iterator, List, Pattern, Tuple, Union
+
+from easydata.utils import codec
+
+_json_decoder = json.JSONDecoder()
+
+_non_whitespace_re = re.compile(r"[^ \t\n\r]")
+
+_line_non_whitespace_re = re.compile(rb"[^ \t\n\r\f\v]")
+
+_scalar_end_re = re.compile(r"[ \t\n\r,:\]}]")
+
+# Chars of a container which are not brackets, including complete strings
+_container_chars = r'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*'
+
+_container_chars_re = re.compile(_container_chars, re.DOTALL)
+
+_string_chars_re = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+
+class JsonStreamReader:
+    """Reads json values from a text or binary stream, while holding in memory
+    only a part of a stream that is currently being decoded."""
+
+    def __init__(
+        self,
+        stream: IO,
+        chunk_size: int = 65536,
+        encoding: str = "utf-8",
+    ):
+
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """Returns next non whitespace char without consuming it or empty string
+        if stream has ended."""
+
+        while True:
+            match = _non_whitespace_re.search(self._buffer, self._position)
+
+            if match:
+                self._position = match.start()
+
+                return match.group()
+
+            self._position = len(self._buffer)
+
+            if not self._read():
+                return ""
+
+    def next(self) -> str:
+        char = self.peek()
+
+        self._position += 1
+
+        return char
+
+    def expect(self, expected_char: str) -> None:
+        char = self.next()
+
+        if char != expected_char:
+            raise ValueError(
+                "Expected '{}' in json stream but got '{}'".format(expected_char, char)
+            )
+
+    def read_separator(self, end_char: str) -> bool:
+        """Consumes comma or end char of an array or object and returns True
+        if end char was reached."""
+
+        char = self.next()
+
+        if char == end_char:
+            return True
+
+        if char != ",":
+            error_msg = "Expected ',' or '{}' in json stream but got '{}'"
+
+            raise ValueError(error_msg.format(end_char, char))
+
+        return False
+
+    def read_value(self) -> Any:
+        char = self.peek()
+
+        # Numbers could continue in a part of a stream which wasn't read yet,
+        # so scalars are decoded only when a char after them is read
+        if char not in ('"', "[", "{"):
+            self._find_scalar_end()
+
+        while True:
+            try:
+                value, end = _json_decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._read():
+                    raise
+            else:
+                self._position = end
+
+                return value
+
+    def skip_value(self) -> None:
+        """Consumes next value without decoding it, so that values which are
+        not on a path are never held in memory whole."""
+
+        char = self.peek()
+
+        if char == '"':
+            self._position += 1
+
+            self._skip_string()
+        elif char in ("[", "{"):
+            self._skip_container()
+        else:
+            self._position = self._find_scalar_end()
+
+    def _find_scalar_end(self) -> int:
+        while True:
+            match = _scalar_end_re.search(self._buffer, self._position)
+
+            if match:
+                return match.start()
+
+            if not self._read():
+                return len(self._buffer)
+
+    def _skip_string(self) -> None:
+        while True:
+            end = _match_end(_string_chars_re, self._buffer, self._position)
+
+            if end < len(self._buffer) and self._buffer[end] == '"':
+                self._position = end + 1
+
+                return
+
+            # Escape char at the end of a buffer is kept for a next chunk
+            self._position = end
+
+            if not self._read():
+                raise ValueError("Unterminated string in json stream")
+
+    def _skip_container(self) -> None:
+        depth = 0
+
+        while True:
+            buffer = self._buffer
+
+            position = _match_end(_container_chars_re, buffer, self._position)
+
+            if position == len(buffer):
+                self._position = position
+
+                if not self._read():
+                    raise ValueError("Unterminated array or object in json stream")
+
+                continue
+
+            char = buffer[position]
+
+            self._position = position + 1
+
+            if char == '"':
+                # String continues in a next chunk
+                self._skip_string()
+            elif char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+
+                if not depth:
+                    return
+
+    def _read(self) -> bool:
+        if self._eof:
+            return False
+
+        # Values bigger than a chunk are read in growing chunks, so that their
+        # decoding isn't retried too many times
+        chunk_size = max(self._chunk_size, len(self._buffer) - self._position)
+
+        while True:
+            chunk = self._stream.read(chunk_size)
+
+            if not isinstance(chunk, bytes):
+                break
+
+            # Read which ends within a multibyte character decodes to an empty
+            # string, so only an empty read is the end of a stream
+            text = self._decoder.decode(chunk, final=not chunk)
+
+            if text or not chunk:
+                chunk = text
+
+                break
+
+        if not chunk:
+            self._eof = True
+
+            return False
+
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+
+        return True
+
+
+def _match_end(pattern: Pattern, text: str, position: int) -> int:
+    match = pattern.match(text, position)
+
+    # Patterns also match an empty string, so there is always a match
+    return match.end() if match else position
+
+
+def iter_json_items(
+    data: Union[str, bytes, IO],
+    prefix: str = "item",
+    chunk_size: int = 65536,
+    encoding: str = "utf-8",
+) -> Iterator[Any]:
+    """Yields json values under a prefix without decoding whole json data.
+    Prefix is a dot separated path of object keys where item stands for
+    each element of an array, e.g. data.products.item"""
+
+    if isinstance(data, str):
+        if data.lstrip()[:1] in ("{", "["):
+            stream: IO = StringIO(data)
+        else:
+            stream = open(data, "rb")
+    elif isinstance(data, bytes):
+        stream = BytesIO(data)
+    else:
+        stream = data
+
+    reader = JsonStreamReader(stream, chunk_size=chunk_size, encoding=encoding)
+
+    try:
+        yield from _iter_json_path(reader, prefix.split(".") if prefix else [])
+    finally:
+        if stream is not data:
+            stream.close()
+
+
+def _iter_json_path(reader: JsonStreamReader, path: List[str]) -> Iterator[Any]:
+    if not path:
+        yield reader.read_value()
+
+        return
+
+    path_key, child_path = path[0], path[1:]
+
+    char = reader.peek()
+
+    if char == "[" and path_key == "item":
+        reader.next()
+
+        if reader.peek() == "]":
+            reader.next()
+
+            return
+
+        while True:
+            yield from _iter_json_path(reader, child_path)
+
+            if reader.read_separator("]"):
+                return
+    elif char == "{":
+        reader.next()
+
+        if reader.peek() == "}":
+            reader.next()
+
+            return
+
+        while True:
+            key = reader.read_value()
+
+            reader.expect(":")
+
+            if key == path_key:
+                yield from _iter_json_path(reader, child_path)
+            else:
+                reader.skip_value()
+
+            if reader.read_separator("}"):
+                return
+    else:
+        reader.skip_value()
+
+
+def iter_json_lines(
+    path: Union[str, os.PathLike],
+    offset: int = 0,
+) -> Iterator[Tuple[int, int, Any]]:
+    """Yields byte offset of a line, byte offset of a next line and decoded json
+    value for each non empty line of a memory mapped json lines file. Lines are
+    decoded only when they are reached."""
+
+    with open(path, "rb") as json_lines_file:
+        if not os.fstat(json_lines_file.fileno()).st_size:
+            return
+
+        with mmap.mmap(
+            json_lines_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm, memoryview(mm) as mm_view:
+            size = len(mm)
+
+            while offset < size:
+                line_end = mm.find(b"\n", offset)
+
+                next_offset = size if line_end == -1 else line_end + 1
+
+                # Lines are passed to a decoder as views of a mapped file, which
+                # are released before the file is unmapped
+                if _line_non_whitespace_re.search(mm, offset, next_offset):
+                    with mm_view[offset:next_offset] as line:
+                        value = codec.loads_buffer(line)
+
+                    yield offset, next_offset, value
+
+                offset = next_offset
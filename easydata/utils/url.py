@@ -2,7 +2,9 @@ import re
 from typing import Any, List, Optional, Union
 from urllib.parse import parse_qs, urljoin, urlparse
 
-from furl import furl
+from easydata.utils.imports import lazy_import
+
+furl = lazy_import("furl")
 
 
 def get_value_from_qs(
@@ -23,7 +25,7 @@ def remove_qs(
         if isinstance(key, str):
             key = [key]
 
-        f = furl(url)
+        f = furl.furl(url)
 
         f.remove(key)
 
@@ -37,7 +39,7 @@ def set_qs_values(
     key_values: dict,
 ) -> str:
 
-    f = furl(url)
+    f = furl.furl(url)
 
     for key, value in key_values.items():
         f.args[key] = value
@@ -59,7 +61,7 @@ def get_path(
     index: Optional[int] = None,
 ):
 
-    f = furl(url)
+    f = furl.furl(url)
 
     path = f.path
 
@@ -1,3 +1,5 @@
+import asyncio
+
 from tests.factory.requests import (
     EXPECTED_PRODUCT_ITEM_RESULT,
     PRODUCT_ITEM_STACKED_MODEL,
@@ -51,3 +53,22 @@ def test_item_stacked_model_parse_res2item():
         )
         == EXPECTED_PRODUCT_ITEM_RESULT
     )
+
+
+def test_item_model_aparse_res2item():
+    product_item_model = ProductItemModel()
+
+    item = asyncio.run(product_item_model.aparse_res2item(response=fake_response()))
+
+    assert item == EXPECTED_PRODUCT_ITEM_RESULT
+
+
+def test_item_model_aparse_res2items():
+    product_item_model = ProductItemModel()
+
+    async def collect_items():
+        iter_items = product_item_model.aparse_res2items(response=fake_response())
+
+        return [item async for item in iter_items]
+
+    assert asyncio.run(collect_items()) == [EXPECTED_PRODUCT_ITEM_RESULT]
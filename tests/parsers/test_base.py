@@ -159,3 +159,117 @@ def test_base_data_field_process_value(
 
     item_data = ed.Data(query, process_value=process_value_callback)
     assert item_data.parse(test_data) == result
+
+
+def test_base_data_cache():
+    item_data = ed.Text(cache=True)
+
+    assert item_data.parse(" Easybook  Pro ") == "Easybook Pro"
+    assert item_data.parse(" Easybook  Pro ") == "Easybook Pro"
+    assert item_data.parse(13) == "13"
+
+    # Unhashable values are parsed without a cache
+    assert item_data.parse(["Easybook", "Pro"]) == "Easybook Pro"
+
+    assert item_data.cache_info() == {
+        "hits": 1,
+        "misses": 2,
+        "maxsize": 1024,
+        "size": 2,
+    }
+
+    item_data.cache_clear()
+
+    assert item_data.cache_info()["size"] == 0
+
+    assert ed.Text().cache_info() is None
+    assert ed.Text(cache_size=10).cache_info()["maxsize"] == 10
+
+
+def test_base_data_cache_value_types():
+    item_data = ed.Data(cache=True)
+
+    assert item_data.parse(1) == 1
+    assert item_data.parse(True) is True
+    assert item_data.parse(1.0) == 1.0
+
+    assert item_data.cache_info()["size"] == 3
+
+
+def test_base_data_cache_config():
+    item_data = ed.Text(cache=True)
+
+    assert item_data.parse("Easybook") == "Easybook"
+
+    item_data.init_config({"ED_LANGUAGE": "de"}, override=True)
+
+    assert item_data.cache_info()["size"] == 0
+
+
+def test_base_data_cache_not_cacheable():
+    item_data = ed.List(cache=True)
+
+    assert item_data.parse("Easybook") == ["Easybook"]
+    assert item_data.cache_info()["size"] == 0
+
+
+def test_base_data_parse_values():
+    parsed_values = []
+
+    class UpperText(ed.Text):
+        def parse_value(self, value, data):
+            parsed_values.append(value)
+
+            return value.upper()
+
+    item_data = UpperText(ed.key("name"))
+
+    data_list = [{"name": "easybook"}, {"name": "easydata"}, {"name": "easybook"}]
+
+    assert item_data.parse_values(data_list) == ["EASYBOOK", "EASYDATA", "EASYBOOK"]
+
+    # Equal raw values are parsed only once
+    assert parsed_values == ["easybook", "easydata"]
+
+
+def test_base_data_parse_values_not_dedupable():
+    item_data = ed.List(ed.key("tags"))
+
+    data_list = [{"tags": ["phones"]}, {"tags": ["phones"]}]
+
+    values = item_data.parse_values(data_list)
+
+    assert values == [["phones"], ["phones"]]
+    assert values[0] is not values[1]
+
+
+def test_base_data_parse_values_errors():
+    processed_values = []
+
+    class StockInt(ed.Int):
+        def parse_value(self, value, data):
+            if value == "n/a":
+                raise ValueError(value)
+
+            return super().parse_value(value, data)
+
+    def process_value(value, data):
+        processed_values.append(value)
+
+        return value
+
+    item_data = StockInt(ed.key("stock"), process_value=process_value)
+
+    data_list = [{"stock": "5"}, {"stock": "n/a"}, {"stock": "7"}, {"stock": "n/a"}]
+
+    errors = {}
+
+    assert item_data.parse_values(data_list, errors) == [5, None, 7, None]
+    assert sorted(errors) == [1, 3]
+    assert isinstance(errors[1], ValueError)
+
+    # Callbacks are called only for documents which didn't raise an error
+    assert processed_values == [5, 7]
+
+    with pytest.raises(ValueError):
+        item_data.parse_values(data_list)
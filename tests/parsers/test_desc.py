@@ -1,6 +1,7 @@
 import pytest
 
 import easydata as ed
+from easydata.parsers import desc
 from tests.factory import data_html, data_text
 
 
@@ -107,3 +108,33 @@ def test_feature_html_text_to_sentences_false():
 def test_feature_key_exact(key_exact, result):
     feature_parser = ed.Feature(key_exact=key_exact)
     assert feature_parser.parse(data_text.raw_sentences) == result
+
+
+def test_description_parsers_share_text_parser(monkeypatch):
+    parse_text_calls = []
+
+    original_parse_text = desc.parse_text
+
+    def parse_text(**kwargs):
+        parse_text_calls.append(kwargs["text"])
+
+        return original_parse_text(**kwargs)
+
+    monkeypatch.setattr(desc, "parse_text", parse_text)
+
+    class DescriptionItemModel(ed.ItemModel):
+        item_description = ed.Description()
+        item_sentences = ed.Sentences()
+        item_color = ed.Feature(key="color")
+        item_material = ed.Feature(key="material")
+        item_features = ed.FeaturesDict()
+        item_upper_description = ed.Description(uppercase=True)
+
+    item = DescriptionItemModel().parse_item(data_text.raw_sentences)
+
+    assert item["color"] == "Black"
+    assert item["material"] == "Aluminium"
+    assert item["upper_description"] == item["description"].upper()
+
+    # Parsers with the same text options share one text analysis per document
+    assert len(parse_text_calls) == 2
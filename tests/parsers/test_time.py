@@ -1,3 +1,5 @@
+from datetime import date, datetime
+
 import pytest
 
 import easydata as ed
@@ -80,3 +82,43 @@ test_date_sentence = "It has happened on 10 Dec 2018 at 10:55:50."
 )
 def test_year_search(parser, test_data, result):
     assert parser.parse(test_data) == result
+
+
+@pytest.mark.parametrize(
+    "parser, test_data, result",
+    [
+        (ed.DateTime(), "2018-12-10T10:55:50", "12/10/2018 10:55:50"),
+        (ed.DateTime(), "2018-12-10 10:55", "12/10/2018 10:55:00"),
+        (ed.Date(), "2018-12-10", "12/10/2018"),
+        (ed.Date(date_formats=["%d.%m.%Y"]), "10.12.2018", "12/10/2018"),
+        (
+            ed.Date().init_config({"ED_DATETIME_FORMATS": ["%d %B %Y"]}),
+            "10 December 2018",
+            "12/10/2018",
+        ),
+        # Values which don't match fast path formats are parsed by dateparser
+        (ed.Date(date_formats=["%d.%m.%Y"]), "Dec 10 2018", "12/10/2018"),
+        (ed.Date(date_formats=["%d.%m"]), "10.12", "12/10/%s" % date.today().year),
+        # Invalid iso dates are left to dateparser
+        (ed.DateTime(), "2021-13-45", None),
+        (ed.DateTime(), "2021-02-30 10:00", None),
+        (ed.Date(), "2021-02-30", None),
+    ],
+)
+def test_datetime_fast_path(parser, test_data, result):
+    assert parser.parse(test_data) == result
+
+
+def test_datetime_memo():
+    relative_base = datetime(2020, 5, 10, 12, 30)
+
+    parser = ed.Date(relative_base=relative_base)
+
+    assert parser.parse("2 days ago") == "05/08/2020"
+
+    # Same value with different settings isn't shared
+    assert ed.Date(relative_base=datetime(2021, 5, 10)).parse("2 days ago") == (
+        "05/08/2021"
+    )
+
+    assert ed.Date(relative_base=relative_base).parse("2 days ago") == "05/08/2020"
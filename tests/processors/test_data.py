@@ -152,6 +152,127 @@ def test_data_yaml_to_dict_processors():
     assert json_dict["main"]["info"]["title"] == "Macbook Pro 13"
 
 
+xml_feed = """<?xml version="1.0" encoding="UTF-8"?>
+<feed>
+    <info>Products</info>
+    <product id="1"><name>EasyBook</name><price>99.9</price></product>
+    <product id="2"><name>EasyPhone</name><price>49.9</price></product>
+</feed>
+"""
+
+
+def test_data_xml_stream_processor():
+    data_processor = ed.DataXmlStreamProcessor(tag="product")
+
+    db_list = list(data_processor.parse_data(xml_feed))
+
+    assert [db["main"] for db in db_list] == [
+        {"product": {"@id": "1", "name": "EasyBook", "price": "99.9"}},
+        {"product": {"@id": "2", "name": "EasyPhone", "price": "49.9"}},
+    ]
+
+
+def test_data_xml_stream_processor_releases_elements(monkeypatch):
+    from easydata.processors.data import etree
+
+    iterparse = etree.iterparse
+
+    roots = []
+
+    def tracked_iterparse(*args, **kwargs):
+        assert kwargs["resolve_entities"] is False
+        assert kwargs["no_network"] is True
+
+        for event, element in iterparse(*args, **kwargs):
+            if not roots:
+                roots.append(element.getroottree().getroot())
+
+            yield event, element
+
+    monkeypatch.setattr(etree, "iterparse", tracked_iterparse)
+
+    test_feed = """<catalog>
+        <info>Products</info>
+        <products>
+            <product id="1"><name>EasyBook</name></product>
+            <note>Discounted</note>
+            <product id="2"><name>EasyPhone</name></product>
+            <note>Sold out</note>
+            <product id="3"><name>EasyWatch</name></product>
+        </products>
+    </catalog>"""
+
+    data_processor = ed.DataXmlStreamProcessor(tag="product", to_dict=False)
+
+    tree_sizes = []
+
+    for element in data_processor.process_data(test_feed):
+        tree_sizes.append(sum(1 for _ in roots[0].iter()))
+
+        assert element.getparent() is None
+
+    # Parser reads ahead, but in the end only catalog and products elements
+    # are left in a tree
+    assert tree_sizes == sorted(tree_sizes, reverse=True)
+    assert tree_sizes[-1] == 2
+
+
+def test_data_xml_stream_processor_root_children(tmp_path):
+    feed_path = tmp_path / "feed.xml"
+    feed_path.write_text(xml_feed)
+
+    data_processor = ed.DataXmlStreamProcessor()
+
+    db_list = list(data_processor.parse_data(str(feed_path)))
+
+    assert len(db_list) == 3
+    assert db_list[0]["main"] == {"info": "Products"}
+
+
+def test_data_xml_stream_processor_elements():
+    class ProductModel(ed.ItemModel):
+        data_processors = [
+            ed.DataXmlStreamProcessor(tag="product", to_dict=False),
+        ]
+
+        item_id = ed.Int(ed.xpath("@id"))
+
+        item_name = ed.Text(ed.css("name::text"))
+
+        item_price = ed.PriceFloat(ed.xpath("price::text"))
+
+    items = ProductModel().parse_items(xml_feed.encode())
+
+    assert list(items) == [
+        {"id": 1, "name": "EasyBook", "price": 99.9},
+        {"id": 2, "name": "EasyPhone", "price": 49.9},
+    ]
+
+
+def test_data_json_stream_processor():
+    test_json_text = '{"data": {"products": [{"id": 1}, {"id": 2}], "count": 2}}'
+
+    data_processor = ed.DataJsonStreamProcessor(prefix="data.products.item")
+
+    db_list = list(data_processor.parse_data(test_json_text))
+
+    assert [db["main"] for db in db_list] == [{"id": 1}, {"id": 2}]
+    assert db_list[0]["main_raw"] == test_json_text
+
+
+def test_data_json_lines_processor(tmp_path):
+    json_lines_path = tmp_path / "products.jsonl"
+    json_lines_path.write_text('{"id": 1}\n{"id": 2}\n')
+
+    data_processor = ed.DataJsonLinesProcessor(new_source="product")
+
+    db_list = list(data_processor.parse_data(str(json_lines_path)))
+
+    assert [db["product"] for db in db_list] == [{"id": 1}, {"id": 2}]
+    assert [db["product_offset"] for db in db_list] == [0, 10]
+    assert [db["product_next_offset"] for db in db_list] == [10, 20]
+
+
 def test_data_json_from_re_to_dict_processor():
     test_text = 'var config = {"title": "EasyBook"};'
 
@@ -218,3 +339,81 @@ def test_data_variants_processor_multi_values():
         {"color": "Black", "size": "15", "stock": True},
     ]
     assert db_list[0]["color_data_variants"] == expected_values_result
+
+
+def test_data_variants_processor_invariant_keys():
+    class VariantsModel(ed.ItemModel):
+        data_processors = [
+            ed.DataVariantsProcessor(
+                query=ed.jp("data.variants"),
+                key_query=ed.key("color"),
+                new_source="color_data",
+                invariant_keys=["tags"],
+                detect_invariant_keys=True,
+            )
+        ]
+
+        item_name = ed.Text(ed.jp("data.title"))
+
+        item_color = ed.Text(ed.jp("color"), source="color_data")
+
+        def item_tags(self, data):
+            self.tags_calls += 1
+
+            return ["notebook"]
+
+    variants_model = VariantsModel()
+    variants_model.tags_calls = 0
+
+    items = list(variants_model.parse_items(data_dict.variants_data_multi))
+
+    assert items == [
+        {"color": "Black", "name": "EasyData Pro", "tags": ["notebook"]},
+        {"color": "Gray", "name": "EasyData Pro", "tags": ["notebook"]},
+    ]
+
+    # Shared list values are copied for each item
+    assert items[0]["tags"] is not items[1]["tags"]
+
+    assert variants_model.tags_calls == 1
+
+
+def test_data_variants_processor_detect_invariant_keys_nested_queries():
+    class VariantsModel(ed.ItemModel):
+        data_processors = [
+            ed.DataVariantsProcessor(
+                query=ed.jp("data.variants"),
+                key_query=ed.key("color"),
+                new_source="color_data",
+                detect_invariant_keys=True,
+            )
+        ]
+
+        item_color = ed.Text(ed.jp("color"), source="color_data")
+
+        # Title is read from a main source, but a color from a variant
+        item_gray_title = ed.Has(
+            ed.jp("data.title"),
+            contains_query=ed.jp("[0].color", source="color_data_variants"),
+        )
+
+        # Query param is read from a variants source
+        item_sizes = ed.Text(
+            ed.jp(
+                "data.variants[?color=='{color}'].size | join(', ', @)",
+                params={"color": ed.Text(ed.jp("color"), source="color_data")},
+            )
+        )
+
+    test_data = json.loads(json.dumps(data_dict.variants_data_multi))
+    test_data["data"]["title"] = "EasyData Pro Gray"
+    del test_data["data"]["variants"][2]
+
+    variants_model = VariantsModel()
+
+    assert variants_model.model_manager.variant_invariant_item_keys("color_data") == ()
+
+    items = list(variants_model.parse_items(test_data))
+
+    assert [item["gray_title"] for item in items] == [False, True]
+    assert [item["sizes"] for item in items] == ["13, 15", "15"]
@@ -254,3 +254,11 @@ def test_item_discount_processor_remove_item_sale_price_key_config():
     item = discount_processor.parse(test_item)
 
     assert item == {"price": 29.99, "discount": 26.68}
+
+
+def test_item_processors_required_item_keys():
+    assert ed.ItemDiscountProcessor().required_item_keys == ["price", "sale_price"]
+
+    merge_processor = ed.ItemKeysMergeProcessor("name", ["brand", "title"])
+
+    assert merge_processor.required_item_keys == ["brand", "title"]
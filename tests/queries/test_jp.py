@@ -2,6 +2,7 @@ import pytest
 
 import easydata as ed
 from easydata.exceptions import QuerySearchDataEmpty, QuerySearchResultNotFound
+from easydata.queries.jp import compile_expression
 from tests.factory import data_dict
 
 
@@ -145,3 +146,15 @@ def test_jp_query_strict_query_non_existent_error():
 def test_jp_query_strict_data_empty_error():
     with pytest.raises(QuerySearchDataEmpty):
         assert ed.jp_strict("title").get(None)
+
+
+def test_jp_query_compiled_expression_is_shared():
+    query = "brand.name | [@]"
+
+    assert ed.jp(query).get(data_dict.item_with_options) == ["EasyData"]
+
+    cache_hits = compile_expression.cache_info().hits
+
+    assert ed.jp(query).get(data_dict.item_with_options) == ["EasyData"]
+
+    assert compile_expression.cache_info().hits == cache_hits + 1
@@ -0,0 +1,137 @@
+import pytest
+from lxml import etree
+
+import easydata as ed
+from easydata.data import DataBag
+from easydata.exceptions import QuerySearchDataEmpty, QuerySearchResultNotFound
+from tests.factory import data_html
+
+pq_compatible_queries = [
+    '[itemprop="name"]::text',
+    ".name .brand::text",
+    ".breadcrumbs .breadcrumb::text",
+    ".breadcrumbs .breadcrumb::text-all",
+    ".breadcrumbs .breadcrumb::ntext-all",
+    ".breadcrumbs .breadcrumb::text-items",
+    ".images img::attr(src)-items",
+    ".images img::src-items",
+    ".images img::src",
+    '[name="category"]::attr(value)',
+    '[name="category"]::val',
+    '[name="category"]::content',
+    ".name::html",
+    ".name::ohtml",
+    ".name .brand::has_class(brand)",
+    ".name .brand::has_class(name)",
+    ".not-existing::text",
+    ".not-existing::html",
+    ".not-existing::src",
+]
+
+
+@pytest.mark.parametrize("query", pq_compatible_queries)
+def test_css_query_same_as_pq(query):
+    test_html = data_html.item_with_breadcrumbs
+
+    assert ed.css(query).get(test_html) == ed.pq(query).get(test_html)
+
+
+def test_css_query_remove_query():
+    exp_result = "Test Product Item"
+    test_data = data_html.item_with_breadcrumbs
+    assert ed.css(".name::text", remove_query=".brand").get(test_data) == exp_result
+
+    # Removal is performed on a copy of selected elements
+    assert ed.css(".name .brand::text").get(test_data) == "EasyData"
+
+
+def test_css_query_iter():
+    result = ed.css(".images img::src-iter").get(data_html.item_with_breadcrumbs)
+
+    assert list(result) == [
+        "https://demo.com/img1.jpg",
+        "https://demo.com/img2.jpg",
+        "https://demo.com/img3.jpg",
+    ]
+
+
+def test_css_query_elements():
+    test_data = data_html.item_with_breadcrumbs
+
+    elements = ed.css(".breadcrumbs .breadcrumb").get(test_data)
+
+    assert len(elements) == 1
+    assert isinstance(elements[0], etree._Element)
+    assert elements[0].text.strip() == "Home"
+
+    items = ed.css(".breadcrumbs .breadcrumb::items").get(test_data)
+
+    assert [e[0].text.strip() for e in items] == ["Home", "Phone", "Smartphone"]
+
+
+@pytest.mark.parametrize(
+    "query, result",
+    [
+        ('//*[@class="brand"]::text', "EasyData"),
+        ('//*[@class="breadcrumb"]::text-all', "Home Phone Smartphone"),
+        ('//*[@name="category"]::val', "smartphone"),
+        ("//img::src", "https://demo.com/img1.jpg"),
+    ],
+)
+def test_xpath_query(query, result):
+    assert ed.xpath(query).get(data_html.item_with_breadcrumbs) == result
+
+
+@pytest.mark.parametrize(
+    "query, result",
+    [
+        ('//*[@class="breadcrumb"][1]/following-sibling::div::text', "Phone"),
+        (
+            '//*[@class="breadcrumb"][1]/following-sibling::div::text-all',
+            "Phone Smartphone",
+        ),
+        ('//*[@class="brand"]/parent::h2/@class', "name"),
+        ("//a/@href::text", "https://demo.com/product/123"),
+        ("//img/@src::items", [f"https://demo.com/img{i}.jpg" for i in (1, 2, 3)]),
+        ('//*[@class="breadcrumb"]/text()::ntext-all', "Home Phone Smartphone"),
+        ('count(//*[@class="breadcrumb"])', 3.0),
+    ],
+)
+def test_xpath_query_axes_and_values(query, result):
+    assert ed.xpath(query).get(data_html.item_with_breadcrumbs) == result
+
+
+def test_xpath_query_axis_without_pseudo_key():
+    elements = ed.xpath('//*[@class="breadcrumb"]/following-sibling::div').get(
+        data_html.item_with_breadcrumbs
+    )
+
+    assert elements[0].text == "Phone"
+
+    # Element names which match pseudo keys are node tests after an axis
+    assert ed.xpath("//a/child::text").get(data_html.item_with_breadcrumbs) == []
+
+
+def test_css_query_data_bag_shares_elements():
+    data_bag = DataBag(main=data_html.item_with_breadcrumbs)
+
+    assert ed.css(".name .brand::text").get(data_bag) == "EasyData"
+    assert ed.xpath('//*[@class="brand"]::text').get(data_bag) == "EasyData"
+
+    assert data_bag.has("main_lxml")
+
+    # pq query reuses elements that were already loaded by lxml queries
+    assert ed.pq(".name .brand::text").get(data_bag) == "EasyData"
+    assert data_bag["main_pq"][0] is data_bag["main_lxml"][0]
+
+
+def test_css_query_strict_query_non_existent_error():
+    with pytest.raises(QuerySearchResultNotFound):
+        assert ed.css_strict('[itemprop="name2"]::text').get(
+            data_html.prices_and_variants,
+        )
+
+
+def test_css_query_strict_data_empty_error():
+    with pytest.raises(QuerySearchDataEmpty):
+        assert ed.css_strict('[itemprop="name"]::text').get(None)
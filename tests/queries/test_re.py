@@ -99,3 +99,12 @@ def test_re_query_strict_query_non_existent_error():
 def test_re_query_strict_data_empty_error():
     with pytest.raises(QuerySearchDataEmpty):
         assert ed.re_strict('basePrice": "(.*?)"').get(None)
+
+
+def test_re_query_compiled_pattern_flags():
+    test_text = "Price: 10\nprice: 20"
+
+    assert ed.re(r"price: (\d+)").get(test_text) == "20"
+    assert ed.re(r"price: (\d+)", ignore_case=True).get(test_text) == "10"
+    assert ed.re(r"(\d+).price").get(test_text) == "10"
+    assert ed.re(r"(\d+).price", dotall=False).get(test_text) is None
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from easydata.benchmarks import (
+    SCENARIOS,
+    compare,
+    run_benchmarks,
+    run_scenario,
+    run_scenario_isolated,
+    runner,
+)
+from easydata.benchmarks.__main__ import main
+
+
+@pytest.mark.parametrize("scenario_name", list(SCENARIOS))
+def test_run_scenario(scenario_name):
+    scenario_results = run_scenario(SCENARIOS[scenario_name], documents=2)
+
+    assert scenario_results["documents"] == 2
+    assert scenario_results["items"] >= 2
+    assert scenario_results["items_per_sec"] > 0
+
+    latency_ms = scenario_results["latency_ms"]
+
+    assert latency_ms["p50"] <= latency_ms["p95"] <= latency_ms["p99"]
+    assert latency_ms["p99"] <= latency_ms["max"]
+
+
+def test_scenario_documents_are_reproducible():
+    scenario = SCENARIOS["json_api"]
+
+    assert scenario.create_documents(1, 3) == scenario.create_documents(1, 3)
+    assert scenario.create_documents(1, 3) != scenario.create_documents(2, 3)
+
+
+@pytest.mark.skipif(not runner.peak_rss_kb(), reason="peak rss is not available")
+def test_run_scenario_isolated():
+    # Memory used by a parent process isn't part of peak rss of a scenario
+    allocated = bytearray(256 * 1024 * 1024)
+
+    scenario_results = run_scenario_isolated("xml_feeds", documents=1)
+
+    assert scenario_results["documents"] == 1
+    assert scenario_results["peak_rss_kb"] < runner.peak_rss_kb() - 128 * 1024
+
+    del allocated
+
+
+def test_run_benchmarks_unknown_scenario():
+    with pytest.raises(ValueError):
+        run_benchmarks(["unknown"])
+
+
+def test_compare():
+    baseline = run_benchmarks(["xml_feeds"], documents=1)
+
+    current = json.loads(json.dumps(baseline))
+
+    current["scenarios"]["xml_feeds"]["items_per_sec"] /= 2
+
+    assert compare(baseline, baseline)["xml_feeds"]["regression"] is False
+    assert compare(baseline, current)["xml_feeds"]["regression"] is True
+
+
+def test_main_compare(tmp_path, capsys):
+    baseline_path = tmp_path / "baseline.json"
+    current_path = tmp_path / "current.json"
+
+    assert main(["-s", "xml_feeds", "-n", "1", "-o", str(baseline_path)]) == 0
+
+    current = json.loads(baseline_path.read_text())
+
+    current["scenarios"]["xml_feeds"]["latency_ms"]["p95"] *= 2
+
+    current_path.write_text(json.dumps(current))
+
+    assert main(["--compare", str(baseline_path), str(current_path)]) == 1
+
+    assert "REGRESSION" in capsys.readouterr().out
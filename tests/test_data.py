@@ -1,7 +1,11 @@
 import json
 
+from easydata import parsers, processors
 from easydata.data import DataBag
 from easydata.managers import ModelManager
+from easydata.models import ItemModel
+from easydata.queries import key, pq
+from easydata.queries import re as ed_re
 from tests.factory import data_dict
 from tests.factory.models import ProductJsonModel
 
@@ -61,3 +65,166 @@ def test_data_bag_add():
     data_bag.add("brand_info", "Groove")
 
     assert data_bag["brand_info"] == "Groove"
+
+
+def test_data_bag_copy_reads_through():
+    data_bag = DataBag(main="groove", main_extra="peach")
+
+    data_bag_copy = data_bag.copy()
+
+    # Copy doesn't hold parent data but it reads it through
+    assert "main" not in data_bag_copy.__dict__
+    assert data_bag_copy["main"] == "groove"
+    assert data_bag_copy.has("main_extra")
+    assert not data_bag_copy.has("main_missing")
+
+    data_bag_copy["main"] = "apple"
+
+    assert data_bag_copy["main"] == "apple"
+    assert data_bag["main"] == "groove"
+
+    # Nested copy reads through all parents
+    data_bag_nested_copy = data_bag_copy.copy()
+
+    assert data_bag_nested_copy["main"] == "apple"
+    assert data_bag_nested_copy["main_extra"] == "peach"
+
+
+def test_data_bag_copy_shares_derived_data():
+    data_bag = DataBag(main='{"name": "groove"}')
+
+    data_bag_copy = data_bag.copy()
+
+    assert key("name").get(data_bag_copy) == "groove"
+
+    # Derived dict was stored on a data bag which holds the source
+    assert "main_dict" in data_bag.__dict__
+    assert data_bag.copy()["main_dict"] == {"name": "groove"}
+
+
+def test_data_bag_copy_overridden_source_derived_data():
+    data_bag = DataBag(main='{"name": "groove"}')
+
+    assert key("name").get(data_bag) == "groove"
+
+    data_bag_copy = data_bag.copy()
+    data_bag_copy["main"] = '{"name": "peach"}'
+
+    # Derived dict from parent is outdated since copy has its own main source
+    assert not data_bag_copy.has("main_dict")
+    assert key("name").get(data_bag_copy) == "peach"
+    assert key("name").get(data_bag) == "groove"
+
+
+def test_data_bag_query_memo():
+    class PriceModel(ItemModel):
+        ED_QUERY_MEMO = True
+
+        item_price = parsers.PriceFloat(pq(".price::text"))
+
+        item_price_text = parsers.Text(pq(".price::text"))
+
+        item_price_html = parsers.Text(pq(".price::html"))
+
+        item_currency = parsers.Text(ed_re(r"(\$)"))
+
+        item_currencies = parsers.List(ed_re(r"(\$)::all"))
+
+    data_bag = DataBag(main='<div class="price">$19.99</div>')
+
+    item = PriceModel().parse_item(data_bag)
+
+    assert item == {
+        "currencies": ["$"],
+        "currency": "$",
+        "price": 19.99,
+        "price_html": "$19.99",
+        "price_text": "$19.99",
+    }
+
+    # Price selection is shared between price fields, while regex selection
+    # is shared between fields with and without the all pseudo key
+    assert data_bag.query_memo is not None
+    assert data_bag.query_memo.stats() == {"hits": 3, "misses": 2, "size": 2}
+
+    # Copies share query memo with a data bag they were copied from
+    assert data_bag.copy().query_memo is data_bag.query_memo
+
+
+def test_data_bag_query_memo_documents():
+    class ProductModel(ItemModel):
+        ED_QUERY_MEMO = True
+
+        data_processors = [processors.DataJsonStreamProcessor(prefix="item")]
+
+        item_name = parsers.Text(key("name"))
+
+        item_title = parsers.Text(ed_re(r'"name": "(.+?)"'))
+
+    data_bag = DataBag(main='[{"name": "EasyBook"}, {"name": "EasyPhone"}]')
+
+    items = list(ProductModel().parse_items(data_bag))
+
+    assert items == [
+        {"name": "EasyBook", "title": "EasyBook"},
+        {"name": "EasyPhone", "title": "EasyPhone"},
+    ]
+
+    # Each streamed document has its own memo, which isn't kept by a source
+    assert data_bag.query_memo.stats()["size"] == 0
+
+    document_data = data_bag.copy(new_document=True)
+
+    assert document_data.query_memo is not data_bag.query_memo
+    assert document_data.copy().query_memo is document_data.query_memo
+
+
+def test_data_bag_query_memo_re_first_match():
+    selection = ed_re(r"\$(\S+)")._select("$19.99 $9.99", r"\$(\S+)")
+
+    # Matching stops at a first match unless all matches are read
+    assert selection.first() == "19.99"
+    assert selection._matched_results == ["19.99"]
+    assert selection.all() == ["19.99", "9.99"]
+
+
+def test_data_bag_query_memo_disabled():
+    data_bag = load_data_bag_with_model()
+
+    assert data_bag.query_memo is None
+
+
+def test_data_bag_memoize():
+    data_bag = DataBag(main="Easybook Pro 13")
+    data_copy = data_bag.copy()
+
+    assert data_bag.memoize("title", lambda: "first") == "first"
+    assert data_copy.memoize("title", lambda: "second") == "first"
+
+    # Copies with a new document don't share memo with their source
+    document_data = data_bag.copy(new_document=True)
+
+    assert document_data.memoize("title", lambda: "third") == "third"
+    assert data_bag.memoize("title", lambda: "second") == "first"
+
+
+def test_data_bag_memoize_documents():
+    class DescriptionModel(ItemModel):
+        data_processors = [processors.DataJsonStreamProcessor(prefix="item")]
+
+        item_description = parsers.Description(key("description"))
+
+        item_sentences = parsers.Sentences(key("description"))
+
+    data_bag = DataBag(
+        main=json.dumps(
+            [{"description": "Easybook Pro {}.".format(i)} for i in range(5)]
+        )
+    )
+
+    items = list(DescriptionModel().parse_items(data_bag))
+
+    assert [item["sentences"] for item in items][-1] == ["Easybook Pro 4."]
+
+    # Text analysis of each streamed document is released with the document
+    assert data_bag._memo == {}
@@ -60,3 +60,23 @@ def test_object_manager():
     om.add_list([DataToPqProcessor(), DataJsonToDictProcessor()], unique=True)
 
     assert len(om) == 2
+
+
+def test_object_manager_version():
+    om = ObjectLoader([DataJsonToDictProcessor()])
+
+    version = om.version
+
+    om.del_if_exists("missing")
+
+    assert om.version == version
+
+    om.add("pq", DataToPqProcessor())
+
+    assert om.version > version
+
+    version = om.version
+
+    om.del_by_type(DataToPqProcessor)
+
+    assert om.version > version
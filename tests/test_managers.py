@@ -3,6 +3,8 @@ import pytest
 from easydata import parsers
 from easydata.managers import ModelManager
 from easydata.models import ItemModel
+from easydata.processors.data import DataJsonToDictProcessor
+from easydata.processors.item import ItemRemoveKeysProcessor
 from easydata.queries import jp
 
 
@@ -128,3 +130,135 @@ def test_model_manager_block_models_nested(item_key, item_value):
     item_data = model_manager.items()
 
     assert item_data[item_key] == item_value
+
+
+class CallbacksModel(ItemModel):
+    item_name = parsers.Text(jp("name"))
+
+    def preprocess_data(self, data):
+        data["main"] = {"name": data["main"]["title"]}
+
+        return data
+
+    def process_item(self, item):
+        item["processed"] = True
+
+        return item
+
+
+def test_model_manager_compile():
+    model_manager = ModelManager(CallbacksModel())
+
+    assert len(model_manager._preprocess_data_cbs) == 1
+    assert len(model_manager._process_item_cbs) == 1
+    assert model_manager._load_item_cbs == ()
+
+    items = list(model_manager.parse_data_to_items({"title": "EasyData"}))
+
+    assert items == [{"name": "EasyData", "processed": True}]
+
+
+def test_model_manager_processors_change():
+    model_manager = ModelManager(ProductModel())
+
+    model_manager.item_processors.add("language", lambda item: None)
+
+    # Plan is compiled again once processors loaders change
+    items = list(model_manager.parse_data_to_items(json_data={"brand": "EasyData"}))
+    assert items == [None]
+
+    model_manager.item_processors.del_if_exists("language")
+
+    items = list(model_manager.parse_data_to_items(json_data={"brand": "EasyData"}))
+    assert items[0]["language"] == "en"
+
+
+class ProfileVariantModel(ItemModel):
+    item_name = parsers.Text(jp("name"))
+
+
+class ProfileModel(ItemModel):
+    data_processors = [DataJsonToDictProcessor()]
+
+    item_processors = [ItemRemoveKeysProcessor(["processed"])]
+
+    item_name = parsers.Text(jp("title"))
+
+    item_variant = ProfileVariantModel()
+
+    def process_data(self, data):
+        data["main"]["name"] = data["main"]["title"]
+
+        return data
+
+    def preprocess_item(self, item):
+        item["processed"] = True
+
+        return item
+
+
+def test_model_manager_profile():
+    model = ProfileModel()
+
+    with model.profile() as profiler:
+        for title in ("EasyData", "EasyBook"):
+            model.parse_item('{{"title": "{}"}}'.format(title))
+
+    profile_stats = profiler.stats()
+
+    assert set(profile_stats["items"]) == {"name", "variant", "variant.name"}
+    assert set(profile_stats["data_processors"]) == {"DataJsonToDictProcessor"}
+    assert set(profile_stats["item_processors"]) == {"ItemRemoveKeysProcessor"}
+    assert set(profile_stats["callbacks"]) == {
+        "ProfileModel.process_data",
+        "ProfileModel.preprocess_item",
+    }
+
+    name_stats = profile_stats["items"]["name"]
+
+    assert name_stats["count"] == 2
+    assert name_stats["p50"] <= name_stats["p99"] <= name_stats["max"]
+
+    assert "items: variant.name" in profiler.format_table()
+
+    # Profiler is removed when context exits
+    assert model.model_manager.profiler is None
+    assert model.item_variant.model_manager.profiler is None
+
+
+def test_model_manager_profile_config():
+    class ProfileConfigModel(ProfileVariantModel):
+        ED_PROFILE = True
+
+    model_manager = ModelManager(ProfileConfigModel())
+
+    list(model_manager.parse_data_to_items({"name": "EasyData"}))
+
+    assert model_manager.profiler.stats()["items"]["name"]["count"] == 1
+
+
+def test_model_manager_variant_invariant_item_keys():
+    class VariantsModel(ItemModel):
+        item_name = parsers.Text(jp("title"))
+
+        item_brand = parsers.Text(jp("brand"), process_value=parsers.Text())
+
+        item_color = parsers.Text(jp("color"), source="color_data")
+
+        item_sizes = parsers.List(source="color_data_variants")
+
+        item_title = parsers.Text(from_item="name")
+
+        item_stock = parsers.Bool(jp("stock"), process_value=lambda v, d: v)
+
+        def item_currency(self, data):
+            return "USD"
+
+    model_manager = VariantsModel().model_manager
+
+    assert model_manager.variant_invariant_item_keys("color_data") == (
+        "brand",
+        "name",
+    )
+
+    assert model_manager.variant_invariant_item_keys("main") == ("color", "sizes")
@@ -0,0 +1,46 @@
+import easydata as ed
+from easydata.mixins import ConfigMixin, config_property
+
+
+class LanguageConfig(ConfigMixin):
+    def __init__(self):
+        self.lookups = 0
+
+    @config_property
+    def _language(self):
+        self.lookups += 1
+
+        return self.config["ED_LANGUAGE"]
+
+
+def test_config_property():
+    config_obj = LanguageConfig().init_config({"ED_LANGUAGE": "de"})
+
+    assert config_obj._language == "de"
+    assert config_obj._language == "de"
+    assert config_obj.lookups == 1
+
+    # Property is resolved again with a new config
+    config_obj.init_config({"ED_LANGUAGE": "fr"}, override=True)
+
+    assert config_obj._language == "fr"
+    assert config_obj.lookups == 2
+
+
+def test_bind_config():
+    config_obj = LanguageConfig().init_config({"ED_LANGUAGE": "de"}).bind_config()
+
+    assert config_obj.lookups == 1
+    assert vars(config_obj)["_language"] == "de"
+    assert LanguageConfig._config_property_names == ("_language",)
+
+
+def test_model_binds_parsers_config():
+    class ConfigModel(ed.ItemModel):
+        ED_LANGUAGE = "de"
+
+        item_name = ed.parsers.Text(ed.key("name"))
+
+    ConfigModel().parse_item({"name": "EasyData"})
+
+    assert vars(ConfigModel.item_name)["_language"] == "de"
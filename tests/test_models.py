@@ -1,9 +1,14 @@
+import asyncio
 import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import pytest
 
 import easydata as ed
+from easydata.data import DataBag
 from easydata.exceptions import DropItem
+from easydata.models import _iter_batch_results
 from tests.factory import data_dict, data_html
 from tests.factory.models import (
     PricingBlockModel,
@@ -367,3 +372,576 @@ def test_model_exceptions(stacked_model, exception, error_msg):
         stacked_model.parse_item(test_data)
 
     assert error_msg in str(excinfo.value).lower()
+
+
+def test_item_model_parse_items_batch():
+    product_model = ProductJsonModelWithVariantItems()
+
+    documents = [json.dumps(data_dict.variants_data_multi)] * 5
+
+    items = list(product_model.parse_items_batch(documents, workers=2, chunksize=2))
+
+    assert items == list(product_model.parse_items(documents[0])) * 5
+
+
+def test_item_model_parse_items_batch_unordered():
+    product_model = ProductJsonModelWithVariantItems()
+
+    documents = [json.dumps(data_dict.variants_data_multi)] * 4
+
+    items = product_model.parse_items_batch(documents, workers=2, ordered=False)
+
+    assert len(list(items)) == 8
+
+
+def test_item_model_parse_items_batch_drop_items():
+    product_model = ProductJsonModelWithVariantDropItems()
+
+    documents = [json.dumps(data_dict.variants_data_multi)] * 2
+
+    items = []
+
+    with pytest.raises(DropItem) as excinfo:
+        for item in product_model.parse_items_batch(documents, workers=2):
+            items.append(item)
+
+    # Non dropped variants are still yielded for each document
+    assert [item["color"] for item in items] == ["Gray", "Gray"]
+
+    assert "for document index: 1" in str(excinfo.value).lower()
+
+
+def test_item_model_parse_items_batch_error():
+    product_model = ProductModel()
+
+    with pytest.raises(AttributeError) as excinfo:
+        list(product_model.parse_items_batch(["<html></html>"], workers=1))
+
+    assert excinfo.value.document_index == 0
+    assert "FOR DOCUMENT INDEX: 0" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_iter_batch_results_cancels_pending_futures(ordered):
+    futures = []
+
+    class PendingExecutor:
+        def submit(self, fn, *args):
+            future = Future()
+
+            # Only the first chunk is done, with an error
+            if not futures:
+                future.set_exception(ValueError("chunk"))
+
+            futures.append(future)
+
+            return future
+
+    batch_results = _iter_batch_results(
+        executor=PendingExecutor(),
+        chunks=iter([[(0, None)], [(1, None)], [(2, None)]]),
+        kwargs={},
+        ordered=ordered,
+        max_pending=3,
+    )
+
+    with pytest.raises(ValueError):
+        next(batch_results)
+
+    assert [future.cancelled() for future in futures] == [False, True, True]
+
+
+def test_item_model_parse_jsonl(tmp_path):
+    jsonl_path = tmp_path / "products.jsonl"
+
+    jsonl_path.write_text(
+        "\n".join(json.dumps({"id": i, "name": "Product %s" % i}) for i in range(3))
+    )
+
+    class JsonLinesModel(ed.ItemModel):
+        item_id = ed.Int(ed.key("id"))
+
+        item_name = ed.Text(ed.key("name"))
+
+        item_next_offset = ed.Int(source="main_next_offset")
+
+    items = list(JsonLinesModel().parse_jsonl(jsonl_path))
+
+    assert [item["name"] for item in items] == ["Product 0", "Product 1", "Product 2"]
+
+    # Processing can be resumed from next offset of any record
+    resumed_items = JsonLinesModel().parse_jsonl(
+        jsonl_path,
+        offset=items[0]["next_offset"],
+    )
+
+    assert list(resumed_items) == items[1:]
+
+
+def test_item_model_parse_jsonl_drop_items(tmp_path):
+    jsonl_path = tmp_path / "products.jsonl"
+
+    jsonl_path.write_text(
+        "\n".join(json.dumps(data_dict.variants_data_multi) for _ in range(2))
+    )
+
+    class JsonLinesModel(ProductJsonModelWithVariantDropItems):
+        # Records are already decoded
+        data_processors = ProductJsonModelWithVariantDropItems.data_processors[1:]
+
+    items = []
+
+    with pytest.raises(DropItem):
+        for item in JsonLinesModel().parse_jsonl(jsonl_path):
+            items.append(item)
+
+    # Model data processors are applied to each record
+    assert [item["color"] for item in items] == ["Gray", "Gray"]
+
+
+def test_item_model_aparse_item():
+    product_model = ProductModel()
+
+    item = asyncio.run(
+        product_model.aparse_item(
+            data_html.prices_and_variants, json_data=test_dict_source
+        )
+    )
+
+    assert item == item_model_expected_result
+
+
+def test_item_model_aparse_items():
+    product_model = ProductJsonModelWithVariantItems()
+
+    test_data = json.dumps(data_dict.variants_data_multi)
+
+    async def collect_items():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            iter_items = product_model.aparse_items(test_data, executor=executor)
+
+            return [item async for item in iter_items]
+
+    assert asyncio.run(collect_items()) == list(product_model.parse_items(test_data))
+
+
+def test_item_model_aparse_items_concurrency():
+    active = {"current": 0, "max": 0}
+
+    class ConcurrencyModel(ed.ItemModel):
+        ED_ASYNC_CONCURRENCY = 1
+
+        def item_name(self, data):
+            active["current"] += 1
+            active["max"] = max(active["max"], active["current"])
+
+            time.sleep(0.01)
+
+            active["current"] -= 1
+
+            return data["main"]
+
+    product_model = ConcurrencyModel()
+
+    async def parse_concurrently():
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return await asyncio.gather(
+                *[
+                    product_model.aparse_item(str(i), executor=executor)
+                    for i in range(4)
+                ]
+            )
+
+    items = asyncio.run(parse_concurrently())
+
+    assert items == [{"name": str(i)} for i in range(4)]
+
+    assert active["max"] == 1
+
+
+def test_item_model_lazy_item():
+    parsed_keys = []
+
+    class LazyProductModel(ProductModel):
+        def item_stock(self, data):
+            parsed_keys.append("stock")
+
+            return super().item_stock(data)
+
+        class ItemInfo(ed.ItemGroup):
+            item_category = "notebooks"
+
+            _item_code = "EB15"
+
+    product_model = LazyProductModel()
+
+    item = product_model.parse_item(
+        data_html.prices_and_variants,
+        json_data=test_dict_source,
+        lazy=True,
+    )
+
+    assert isinstance(item, ed.LazyItem)
+
+    assert list(item) == [
+        "category",
+        "designer",
+        "language",
+        "name",
+        "stock",
+        "tags",
+    ]
+
+    # Protected item values and groups with them are parsed right away
+    assert item.data.cached_results == {
+        "brand": "EasyData",
+        "ItemInfo": {"category": "notebooks", "code": "EB15"},
+    }
+
+    assert item["designer"] == "EasyData"
+    assert item["category"] == "notebooks"
+    assert parsed_keys == []
+
+    assert item.to_dict() == {**item_model_expected_result, "category": "notebooks"}
+    assert parsed_keys == ["stock"]
+
+    with pytest.raises(KeyError):
+        item["brand"]
+
+
+def test_item_model_lazy_item_with_item_processors():
+    product_model = PricingBlockModel()
+
+    with pytest.raises(ValueError):
+        product_model.parse_item(data_html.prices_and_variants, lazy=True)
+
+
+def test_item_model_parse_item_only():
+    parsed_keys = []
+
+    class ProjectionProductModel(ProductModel):
+        block_models = [PricingBlockModel()]
+
+        def item_stock(self, data):
+            parsed_keys.append("stock")
+
+            return super().item_stock(data)
+
+    product_model = ProjectionProductModel()
+
+    test_data = data_html.prices_and_variants
+
+    # Designer depends on protected brand while discount processor requires
+    # price and sale price values.
+    item = product_model.parse_item(
+        test_data,
+        json_data=test_dict_source,
+        only=["designer", "discount"],
+    )
+
+    assert item == {"designer": "EasyData", "discount": 50.01}
+    assert parsed_keys == []
+
+    item = ProductModel().parse_item(
+        test_data,
+        json_data=test_dict_source,
+        only=["stock"],
+        lazy=True,
+    )
+
+    assert list(item) == ["stock"]
+    assert item.to_dict() == {"stock": True}
+    assert "name" not in item.data.cached_results
+
+
+def test_item_model_parse_item_only_process_item():
+    class CallbackModel(ed.ItemModel):
+        item_name = ed.Text(ed.key("name"))
+
+        item_price = ed.PriceFloat(ed.key("price"))
+
+        item_stock = ed.Bool(ed.key("stock"))
+
+        def process_item(self, item):
+            item["price_text"] = "{} EUR".format(item["price"])
+
+            return item
+
+    test_data = {"name": "Easybook", "price": "149.99", "stock": True}
+
+    # Callbacks which don't declare item keys they read require all values
+    item = CallbackModel().parse_item(test_data, only=["name"])
+
+    assert item == {"name": "Easybook"}
+
+    class RequiredKeysModel(CallbackModel):
+        required_item_keys = ["price"]
+
+    item_model = RequiredKeysModel()
+
+    item = item_model.parse_item(test_data, only=["name", "price_text"])
+
+    assert item == {"name": "Easybook", "price_text": "149.99 EUR"}
+
+    data = DataBag(main=test_data)
+
+    item_model.parse_item(data, only=["name"])
+
+    assert "stock" not in data.cached_results
+
+
+def test_item_model_parse_items_exclude():
+    class ProjectionProductModel(ProductModel):
+        class ItemInfo(ed.ItemGroup):
+            item_category = "notebooks"
+
+            item_code = "EB15"
+
+    product_model = ProjectionProductModel()
+
+    item = product_model.parse_item(
+        data_html.prices_and_variants,
+        json_data=test_dict_source,
+        exclude=["name", "stock", "code"],
+    )
+
+    assert item == {
+        "category": "notebooks",
+        "designer": "EasyData",
+        "language": "en",
+        "tags": ["phones", "ecommerce"],
+    }
+
+    with pytest.raises(ValueError):
+        product_model.parse_item(
+            data_html.prices_and_variants,
+            only=["name"],
+            exclude=["stock"],
+        )
+
+
+def test_item_model_reparse_item():
+    class MonitorModel(ed.ItemModel):
+        ED_TRACK_DEPENDENCIES = True
+
+        item_name = ed.Text(ed.pq(".name::text"))
+
+        item_price = ed.PriceFloat(ed.key("price"), source="stock_json")
+
+        item_stock = ed.Bool(ed.key("stock"), source="stock_json")
+
+        item_price_text = ed.Text(from_item="price")
+
+        def item_brand(self, data):
+            self.brand_calls += 1
+
+            return ed.pq("h2::text").get(data)
+
+        def item_sale(self, data):
+            self.sale_calls += 1
+
+            return data.get("price") < 100
+
+        def item_sold_out(self, data):
+            return not data.stock_json["stock"]
+
+    monitor_model = MonitorModel()
+    monitor_model.brand_calls = 0
+    monitor_model.sale_calls = 0
+
+    data = DataBag(
+        main='<div><h2>EasyData</h2><p class="name">Pro</p></div>',
+        stock_json={"price": "149.99", "stock": True},
+    )
+
+    assert monitor_model.parse_item(data) == {
+        "brand": "EasyData",
+        "name": "Pro",
+        "price": 149.99,
+        "price_text": "149.99",
+        "sale": False,
+        "sold_out": False,
+        "stock": True,
+    }
+
+    assert data.dependencies["brand"] == {"main", "main_lxml", "main_pq"}
+    assert data.dependencies["sale"] == {"stock_json"}
+
+    # Sources read as data bag attributes are tracked as well
+    assert data.dependencies["sold_out"] == {"stock_json"}
+
+    changed_sources = {"stock_json": {"price": "89.99", "stock": False}}
+
+    reparsed_item = monitor_model.reparse_item(data, changed_sources)
+
+    assert reparsed_item == {
+        "brand": "EasyData",
+        "name": "Pro",
+        "price": 89.99,
+        "price_text": "89.99",
+        "sale": True,
+        "sold_out": True,
+        "stock": False,
+    }
+
+    # Only values which depend on changed source were parsed again
+    assert monitor_model.brand_calls == 1
+    assert monitor_model.sale_calls == 2
+
+    # Derived sources like main_pq are parsed again from a changed source
+    reparsed_item = monitor_model.reparse_item(
+        data, {"main": '<div><h2>Easybook</h2><p class="name">Pro</p></div>'}
+    )
+
+    assert reparsed_item["brand"] == "Easybook"
+    assert reparsed_item["price"] == 149.99
+
+    # Data bag of a reparsed item can be reparsed again without nesting copies
+    lazy_item = monitor_model.reparse_item(data, changed_sources, lazy=True)
+
+    lazy_item = monitor_model.reparse_item(
+        lazy_item.data,
+        {"stock_json": {"price": "79.99", "stock": True}},
+        lazy=True,
+    )
+
+    assert lazy_item.data._parent is data
+    assert lazy_item["price"] == 79.99
+    assert lazy_item["brand"] == "EasyData"
+
+
+@pytest.mark.parametrize("track_dependencies", [False, True])
+def test_item_model_data_bag_subclass(track_dependencies):
+    class StockDataBag(DataBag):
+        def in_stock(self):
+            return self.stock_json["stock"]
+
+    class StockModel(ed.ItemModel):
+        ED_TRACK_DEPENDENCIES = track_dependencies
+
+        item_name = ed.Text(ed.key("name"))
+
+        def item_stock(self, data):
+            return data.in_stock()
+
+    stock_model = StockModel()
+
+    data = StockDataBag(main={"name": "Easybook"}, stock_json={"stock": True})
+
+    assert stock_model.parse_item(data) == {"name": "Easybook", "stock": True}
+    assert isinstance(data, StockDataBag)
+
+    if track_dependencies:
+        assert data.dependencies["stock"] == {"stock_json"}
+
+        reparsed_item = stock_model.reparse_item(data, {"stock_json": {"stock": False}})
+
+        assert reparsed_item == {"name": "Easybook", "stock": False}
+
+
+def test_item_model_reparse_item_requires_tracked_dependencies():
+    item_model = ed.StackedModel(name=ed.Text(ed.jp("title")))
+
+    data = DataBag(main=data_dict.item_with_options)
+
+    item_model.parse_item(data)
+
+    with pytest.raises(ValueError):
+        item_model.reparse_item(data, {"main": {}})
+
+
+def test_item_model_parse_columns():
+    class ColumnsModel(ed.ItemModel):
+        item_name = ed.Text(ed.key("name"))
+
+        item_price = ed.PriceFloat(ed.key("price"))
+
+        item_stock = ed.Bool(ed.key("stock"), default=False)
+
+        def item_sale(self, data):
+            return data.get("price") < 100
+
+    documents = [
+        {"name": "Easybook", "price": "149.99", "stock": True},
+        {"name": "Easydata", "price": "89.99"},
+    ]
+
+    columns_model = ColumnsModel()
+
+    assert columns_model.parse_columns(documents) == {
+        "name": ["Easybook", "Easydata"],
+        "price": [149.99, 89.99],
+        "sale": [False, True],
+        "stock": [True, False],
+    }
+
+    items = [columns_model.parse_item(document) for document in documents]
+
+    assert columns_model.parse_columns(documents, only=["name", "sale"]) == {
+        "name": [item["name"] for item in items],
+        "sale": [item["sale"] for item in items],
+    }
+
+
+def test_item_model_parse_columns_drop_items():
+    item_model = ed.StackedModel(
+        name=ed.Text(ed.key("name")),
+        price=ed.PriceFloat(ed.key("price")),
+        drop_name=ed.DropContains(ed.key("name"), contains="Easydata"),
+    )
+
+    documents = [
+        {"name": "Easybook", "price": "149.99"},
+        {"name": "Easydata", "price": "89.99"},
+        {"name": "Easyphone", "price": "49.99"},
+    ]
+
+    assert item_model.parse_columns(documents) == {
+        "drop_name": [None, None],
+        "name": ["Easybook", "Easyphone"],
+        "price": [149.99, 49.99],
+    }
+
+
+def test_item_model_parse_columns_drop_items_callbacks():
+    drop_values = []
+
+    def process_drop_value(value, data):
+        drop_values.append(value)
+
+        return value
+
+    def process_name(value, data):
+        if value == "Easytab":
+            raise ValueError(value)
+
+        return value
+
+    item_model = ed.StackedModel(
+        name=ed.Text(ed.key("name"), process_value=process_name),
+        drop_name=ed.DropContains(
+            ed.key("name"), contains="Easydata", process_raw_value=process_drop_value
+        ),
+    )
+
+    documents = [
+        {"name": "Easybook"},
+        {"name": "Easydata"},
+        {"name": "Easyphone"},
+    ]
+
+    assert item_model.parse_columns(documents) == {
+        "drop_name": [None, None],
+        "name": ["Easybook", "Easyphone"],
+    }
+
+    # Batch isn't parsed again one by one when a document is dropped
+    assert drop_values == ["Easybook", "Easydata", "Easyphone"]
+
+    # Other errors are raised as when items are parsed one by one
+    documents[2]["name"] = "Easytab"
+
+    with pytest.raises(ValueError) as excinfo:
+        item_model.parse_columns(documents)
+
+    assert excinfo.value.args == ('FOR ITEM KEY: "name"', "Easytab")
@@ -0,0 +1,33 @@
+from easydata.utils.cache import LRUCache
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.get("a") == 1
+
+    # Least recently used value is discarded
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b", "missing") == "missing"
+    assert cache.get_or_set("c", lambda: 4) == 3
+    assert cache.get_or_set("d", lambda: None) is None
+    assert "d" in cache
+
+    assert cache.info() == {"hits": 2, "misses": 2, "maxsize": 2, "size": 2}
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(maxsize=0)
+
+    cache.set("a", 1)
+
+    assert "a" not in cache
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+import easydata as ed
+from easydata.utils import codec
+
+
+@pytest.fixture
+def json_backend():
+    yield
+
+    codec.set_backend()
+
+
+@pytest.mark.parametrize("backend", ["auto", "orjson", "json"])
+def test_codec(backend, json_backend):
+    if backend != "auto":
+        pytest.importorskip(backend)
+
+    codec.set_backend(backend)
+
+    assert codec.loads('{"title": "EasyBook", "price": 99.9}') == {
+        "title": "EasyBook",
+        "price": 99.9,
+    }
+    assert codec.loads(b'["EasyBook"]') == ["EasyBook"]
+    assert codec.loads_buffer(memoryview(b'["EasyBook"]')) == ["EasyBook"]
+    assert json.loads(codec.dumps({"title": "EasyBook"})) == {"title": "EasyBook"}
+
+
+def test_codec_auto_backend(json_backend):
+    codec.set_backend("auto")
+
+    # Fast backend is used only for decoding, while encoding keeps stdlib output
+    assert codec.get_backend() in ("orjson", "ujson", "json")
+    assert codec.dumps({"title": "EasyBook"}) == '{"title": "EasyBook"}'
+
+    # Data rejected by fast backend is decoded by stdlib json
+    assert str(codec.loads("[NaN]")) == "[nan]"
+    assert str(codec.loads_buffer(memoryview(b"[NaN]"))) == "[nan]"
+
+
+def test_codec_backend_in_queries(json_backend):
+    pytest.importorskip("orjson")
+
+    codec.set_backend("orjson")
+
+    assert ed.key("info::json").get({"info": {"stock": True}}) == '{"stock":true}'
+    assert ed.key("info").get('{"info": {"stock": true}}') == {"stock": True}
+
+
+def test_codec_unsupported_backend(json_backend):
+    with pytest.raises(ValueError):
+        codec.set_backend("simplejson")
@@ -0,0 +1,70 @@
+import subprocess
+import sys
+
+import pytest
+
+import easydata
+from easydata import parsers, processors, queries
+from easydata.utils.imports import is_instance_of, lazy_import
+
+
+@pytest.mark.parametrize("module", [easydata, parsers, processors, queries])
+def test_lazy_module_attributes(module):
+    assert set(module.__all__) == set(module._lazy_attrs)
+
+    for attr_name in module.__all__:
+        assert getattr(module, attr_name) is not None
+
+    with pytest.raises(AttributeError):
+        getattr(module, "MissingAttribute")
+
+
+def test_lazy_module_aliases():
+    import easydata.queries.pq
+    import easydata.queries.re  # noqa: F401
+
+    assert queries.pq is queries.PyQuerySearch
+    assert queries.re is queries.ReSearch
+    assert easydata.pq is queries.PyQuerySearch
+
+
+def test_lazy_import():
+    json_module = lazy_import("json")
+
+    assert json_module.dumps([1]) == "[1]"
+    assert "dumps" in vars(json_module)
+
+
+def test_is_instance_of():
+    from pyquery import PyQuery
+
+    assert is_instance_of(PyQuery("<p>a</p>"), "pyquery", "PyQuery")
+    assert not is_instance_of("<p>a</p>", "pyquery", "PyQuery")
+    assert not is_instance_of("a", "missing_module", "Missing")
+
+
+def test_import_easydata_skips_heavy_dependencies():
+    modules_code = (
+        "import sys, easydata; "
+        "print(','.join(m for m in ('dateparser', 'pyquery', 'lxml', 'furl') "
+        "if m in sys.modules))"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", modules_code],
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_import_submodules_first():
+    # Modules are no longer imported by the package in advance, so each one
+    # has to be importable on its own
+    for module_name in ("managers", "models", "data", "parsers.base"):
+        subprocess.run(
+            [sys.executable, "-c", "import easydata.{}".format(module_name)],
+            check=True,
+        )
@@ -1,6 +1,7 @@
 import pytest
 from pyquery import PyQuery
 
+import easydata as ed
 from easydata.utils import mix
 
 test_nested_html = """
@@ -124,3 +125,54 @@ def test_multiply_list_values_multiply_key(multiply_keys):
 )
 def test_is_str_float(value, result):
     assert mix.is_str_float(value) == result
+
+
+@pytest.mark.parametrize(
+    "parser, result",
+    [
+        (None, None),
+        ("en", "en"),
+        (["phones", "ecommerce"], ["phones", "ecommerce"]),
+        (lambda data: data.upper(), "EASYDATA"),
+    ],
+)
+def test_compile_item_parser(parser, result):
+    assert mix.compile_item_parser(parser)("easydata") == result
+
+
+def test_iter_attr_data_from_obj_caches_class_attr_names(monkeypatch):
+    class Group(ed.ItemGroup):
+        item_color = "red"
+
+    class Model:
+        item_name = "EasyData"
+        ItemGroup = Group
+
+        def __init__(self, price=None):
+            if price:
+                self.item_price = price
+
+    dir_calls = []
+
+    def counted_dir(obj):
+        dir_calls.append(obj)
+
+        return dir(obj)
+
+    monkeypatch.setattr(mix, "dir", counted_dir, raising=False)
+
+    attr_prefixes = ["item_", "Item"]
+
+    first_attr_data = dict(mix.iter_attr_data_from_obj(Model(), attr_prefixes))
+
+    assert list(first_attr_data) == ["ItemGroup", "item_name"]
+    assert isinstance(first_attr_data["ItemGroup"], Group)
+
+    # Instance attributes are still discovered for each object
+    second_attr_data = dict(mix.iter_attr_data_from_obj(Model(10), attr_prefixes))
+
+    assert list(second_attr_data) == ["ItemGroup", "item_name", "item_price"]
+    assert second_attr_data["ItemGroup"] is first_attr_data["ItemGroup"]
+
+    # Classes of a model and a group are inspected only once
+    assert dir_calls == [Model, Group]
@@ -54,3 +54,21 @@ def test_get_discount(normal_price, sale_price, decimals, discount):
 )
 def test_get_discount_no_decimals(normal_price, sale_price, discount):
     assert price.get_discount(normal_price, sale_price, no_decimals=True) == discount
+
+
+@pytest.mark.parametrize(
+    "test_data, decimal_separator, result",
+    [
+        ("1299", None, 1299.0),
+        ("$1,299.00", None, 1299.0),
+        ("1.299,00 €", ",", 1299.0),
+        ("1.299,5 EUR", ",", 1299.5),
+        ("1,299.5 USD", ".", 1299.5),
+        # Values which don't match fast path are parsed by price parser
+        ("1.299,00 €", None, 1299.0),
+        ("Was 1.299", None, 1299.0),
+        ("Price: 12,99 €", None, 12.99),
+    ],
+)
+def test_to_float_decimal_separator(test_data, decimal_separator, result):
+    assert price.to_float(test_data, decimal_separator=decimal_separator) == result
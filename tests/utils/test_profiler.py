@@ -0,0 +1,52 @@
+from easydata.utils.profiler import Profiler
+
+
+def test_profiler_stats():
+    profiler = Profiler()
+
+    for elapsed in range(1, 101):
+        profiler.record("items", "name", elapsed / 1000)
+
+    name_stats = profiler.stats()["items"]["name"]
+
+    assert name_stats["count"] == 100
+    assert round(name_stats["total"], 3) == 5.05
+    assert round(name_stats["mean"], 4) == 0.0505
+    assert name_stats["p50"] == 0.05
+    assert name_stats["p95"] == 0.095
+    assert name_stats["p99"] == 0.099
+    assert name_stats["max"] == 0.1
+
+    profiler.clear()
+
+    assert profiler.stats()["items"] == {}
+
+
+def test_profiler_stats_bounded_sample():
+    profiler = Profiler(sample_size=100)
+
+    for elapsed in range(1, 10001):
+        profiler.record("items", "name", elapsed / 1000)
+
+    timing_stats = profiler._timings["items"]["name"]
+
+    assert len(timing_stats._sample) == 100
+
+    name_stats = profiler.stats()["items"]["name"]
+
+    # Count, total and max are exact, while percentiles are estimated
+    assert name_stats["count"] == 10000
+    assert round(name_stats["total"], 3) == 50005.0
+    assert name_stats["max"] == 10.0
+    assert 3 < name_stats["p50"] < 7
+
+
+def test_profiler_time_iter():
+    profiler = Profiler()
+
+    values = profiler.time_iter("data_processors", "split", iter([1, 2]))
+
+    assert list(values) == [1, 2]
+
+    # Last step which ends an iterator is timed as well
+    assert profiler.stats()["data_processors"]["split"]["count"] == 3
@@ -0,0 +1,172 @@
+import json
+from io import BytesIO
+
+import pytest
+
+from easydata.utils import codec, stream
+
+test_json_data = {
+    "meta": {"tags": ["a", {"b": "]}"}]},
+    "data": {
+        "count": 3,
+        "products": [
+            {"id": 1, "name": "EasyBook é", "price": 99.9},
+            {"id": 2, "name": 'Easy "Phone"', "price": None},
+            {"id": 3, "name": "EasyWatch", "stock": [True, False]},
+        ],
+        "total": 12345,
+    },
+}
+
+test_json_text = json.dumps(test_json_data, indent=2)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 65536])
+@pytest.mark.parametrize("data_type", ["str", "bytes", "file"])
+def test_iter_json_items(data_type, chunk_size):
+    if data_type == "str":
+        test_data = test_json_text
+    elif data_type == "bytes":
+        test_data = test_json_text.encode()
+    else:
+        test_data = BytesIO(test_json_text.encode())
+
+    json_items = stream.iter_json_items(
+        test_data,
+        prefix="data.products.item",
+        chunk_size=chunk_size,
+    )
+
+    assert list(json_items) == test_json_data["data"]["products"]
+
+
+@pytest.mark.parametrize(
+    "test_data, prefix, result",
+    [
+        (test_json_text, "data.total", [12345]),
+        (test_json_text, "data.missing.item", []),
+        (test_json_text, "meta.tags.item", ["a", {"b": "]}"}]),
+        ("[1, 22, 333]", "item", [1, 22, 333]),
+        ("[]", "item", []),
+        ('{"item": [1, 2]}', "item.item", [1, 2]),
+    ],
+)
+def test_iter_json_items_prefix(test_data, prefix, result):
+    assert list(stream.iter_json_items(test_data, prefix, chunk_size=3)) == result
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 17))
+def test_iter_json_items_split_numbers(chunk_size):
+    json_items = stream.iter_json_items(
+        b'[1.5, 2.25, 3e5, {"a": 10.75}, true, null]',
+        chunk_size=chunk_size,
+    )
+
+    assert list(json_items) == [1.5, 2.25, 3e5, {"a": 10.75}, True, None]
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 17))
+def test_iter_json_items_skipped_values(chunk_size):
+    test_data = {
+        "meta": {"text": 'a \\"]}', "nested": [[{"a": 1}], "[", 10.5]},
+        "count": -12.5e3,
+        "flag": False,
+        "products": [{"id": 1}, {"id": 2}],
+        "total": 2,
+    }
+
+    json_items = stream.iter_json_items(
+        json.dumps(test_data),
+        prefix="products.item",
+        chunk_size=chunk_size,
+    )
+
+    assert list(json_items) == test_data["products"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3])
+def test_iter_json_items_split_multibyte_chars(chunk_size):
+    # Reads which end within a multibyte character aren't the end of a stream
+    json_items = stream.iter_json_items(
+        BytesIO('["ü", 2, 3, "日本€"]'.encode()),
+        prefix="item",
+        chunk_size=chunk_size,
+    )
+
+    assert list(json_items) == ["ü", 2, 3, "日本€"]
+
+
+def test_json_stream_reader_skip_value_doesnt_decode(monkeypatch):
+    reader = stream.JsonStreamReader(BytesIO(b'[{"a": [1, "]"]}, 2]'), chunk_size=2)
+
+    reader.expect("[")
+
+    monkeypatch.setattr(stream, "_json_decoder", None)
+
+    reader.skip_value()
+
+    # Skipped parts are dropped from a buffer
+    assert len(reader._buffer) <= 4
+
+    assert not reader.read_separator("]")
+    assert reader.peek() == "2"
+
+
+def test_iter_json_items_file_path(tmp_path):
+    json_path = tmp_path / "products.json"
+    json_path.write_text(test_json_text)
+
+    json_items = stream.iter_json_items(str(json_path), prefix="data.products.item")
+
+    assert [i["id"] for i in json_items] == [1, 2, 3]
+
+
+def test_iter_json_items_invalid_json():
+    with pytest.raises(ValueError):
+        list(stream.iter_json_items('{"data": [1, 2 3]}', prefix="data.item"))
+
+
+def test_iter_json_lines(tmp_path):
+    json_lines_path = tmp_path / "products.jsonl"
+    json_lines_path.write_bytes(
+        b'{"id": 1}\n\n{"id": 2, "name": "\xc3\xa9"}\n{"id": 3}'
+    )
+
+    json_lines = list(stream.iter_json_lines(json_lines_path))
+
+    assert json_lines == [
+        (0, 10, {"id": 1}),
+        (11, 35, {"id": 2, "name": "é"}),
+        (35, 44, {"id": 3}),
+    ]
+
+    assert list(stream.iter_json_lines(json_lines_path, offset=11)) == json_lines[1:]
+
+
+@pytest.mark.parametrize("backend", ["auto", "orjson", "json"])
+def test_iter_json_lines_backends(tmp_path, backend):
+    if backend != "auto":
+        pytest.importorskip(backend)
+
+    json_lines_path = tmp_path / "products.jsonl"
+    json_lines_path.write_bytes(b'{"id": 1}\n \t\n{"id": 2}\n{"id": 3}\n')
+
+    codec.set_backend(backend)
+
+    try:
+        json_lines = stream.iter_json_lines(json_lines_path)
+
+        assert next(json_lines) == (0, 10, {"id": 1})
+        assert next(json_lines) == (13, 23, {"id": 2})
+
+        # Views of a mapped file are released when lines aren't read to the end
+        json_lines.close()
+    finally:
+        codec.set_backend()
+
+
+def test_iter_json_lines_empty_file(tmp_path):
+    json_lines_path = tmp_path / "products.jsonl"
+    json_lines_path.write_text("")
+
+    assert list(stream.iter_json_lines(json_lines_path)) == []